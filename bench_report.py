@@ -0,0 +1,136 @@
+"""
+Report Rendering Benchmark for Parabank Selenium Tests
+Generates test_report.html from synthetic result records (10k, 100k and 1M tests by
+default) in a scratch directory and prints the generation time, file size and peak
+memory per size. With --browser it also opens each report in headless Chrome and
+times how long the page takes until the results table has drawn, and how many rows are
+in the DOM; virtualization keeps that count the same whatever the number of tests.
+
+Usage:
+    python bench_report.py
+    python bench_report.py --sizes 10000 100000 --browser
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+from generate_report import TestReportGenerator
+from suite_runner import ALL_SUITES
+
+MESSAGES = [
+    "FAIL: BUG - Transfer accepted a negative amount",
+    "FAIL: Expected 'Welcome' message not found",
+    "ERROR: Message: no such element: Unable to locate element: {\"method\":\"id\",\"selector\":\"amount\"}",
+    "FAIL: XSS vulnerability detected - <script>alert(1)</script> reflected",
+]
+
+
+def make_records(count, seed=1):
+    """Synthetic records shaped like result_records' output, about 10% failing"""
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        suite_name, module_name, class_name = ALL_SUITES[i % len(ALL_SUITES)]
+        status = "passed" if rng.random() > 0.1 else rng.choice(["failed", "error"])
+        records.append({
+            "test_id": f"{module_name}.{class_name}.test_case_{i}",
+            "suite": suite_name,
+            "tc_id": f"TC_BENCH_{i:07d}",
+            "title": f"Synthetic case {i} for {suite_name}",
+            "status": status,
+            "duration": round(rng.uniform(1, 40), 3),
+            "message": rng.choice(MESSAGES) if status != "passed" else None,
+        })
+    return records
+
+
+def make_generator(records):
+    generator = TestReportGenerator()
+    for suite_name, module_name, class_name in ALL_SUITES:
+        suite_records = [record for record in records if record["suite"] == suite_name]
+        passed = sum(1 for record in suite_records if record["status"] == "passed")
+        total = len(suite_records)
+        generator.test_results.append({
+            "name": suite_name, "module": module_name, "passed": passed, "failed": total - passed,
+            "total": total, "success_rate": passed / total * 100 if total else 0,
+        })
+        generator.total_passed += passed
+        generator.total_failed += total - passed
+    return generator
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def load_in_browser(report_path):
+    """(seconds until the results table has drawn, rows in the DOM) in headless Chrome"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    options = Options()
+    options.add_argument('--headless')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    driver = webdriver.Chrome(options=options)
+    try:
+        driver.set_page_load_timeout(300)
+        start = time.perf_counter()
+        driver.get("file://" + os.path.abspath(report_path))
+        WebDriverWait(driver, 300).until(lambda d: d.execute_script("return window.resultsTableReady"))
+        seconds = time.perf_counter() - start
+        rows = driver.execute_script("return document.querySelectorAll('#results-body .vrow').length")
+        return seconds, rows
+    finally:
+        driver.quit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time HTML report generation for large numbers of tests")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[10000, 100000, 1000000])
+    parser.add_argument("--browser", action="store_true", help="also time page load in headless Chrome")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="parabank-bench-") as scratch:
+        cwd = os.getcwd()
+        os.chdir(scratch)  # the generator reads the screenshot manifest relative to the working directory
+        try:
+            for size in args.sizes:
+                records = make_records(size)
+                generator = make_generator(records)
+                report_path = f"report_{size}.html"
+                start = time.perf_counter()
+                generator.generate_html_report(records=records, report_path=report_path)
+                seconds = time.perf_counter() - start
+                result = {"size": size, "seconds": seconds, "mb": os.path.getsize(report_path) / 1024 / 1024,
+                          "rss": peak_rss_mb(), "load": None, "dom_rows": None}
+                if args.browser:
+                    result["load"], result["dom_rows"] = load_in_browser(report_path)
+                results.append(result)
+        finally:
+            os.chdir(cwd)
+
+    print("\n" + "="*60)
+    print("REPORT RENDERING BENCHMARK")
+    print("="*60)
+    for result in results:
+        line = (f"{result['size']:>9,} tests: {result['seconds']:6.2f}s "
+                f"({result['seconds'] / result['size'] * 1e6:5.1f} us/test) | {result['mb']:7.1f} MB "
+                f"| peak RSS {result['rss']:6.0f} MB")
+        if result["load"] is not None:
+            line += f" | page ready {result['load']:5.1f}s, {result['dom_rows']} rows in DOM"
+        print(line)
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Verdict Micro-Benchmark for Parabank Selenium Tests
+Times the single-pass VerdictRules engine against the short-circuit `"keyword" in page_source`
+chains the suites actually run (copied from test_request_loan.py, test_account_statement.py and
+test_find_transactions.py), on synthetic Parabank-sized pages. No browser needed.
+
+Usage:
+    python bench_verdicts.py
+    python bench_verdicts.py --size-kb 500 --repeat 200
+"""
+
+import argparse
+import timeit
+
+from verdicts import COMMON_RULES, VerdictRules
+
+FILLER = (
+    '<tr><td><a href="activity.htm?id=13344">13344</a></td><td>$515.50</td>'
+    '<td>$515.50</td></tr>\n<div id="rightPanel"><h1 class="title">Accounts Overview</h1>'
+    '<p>Balance includes deposits that may be subject to holds</p></div>\n'
+)
+
+
+def make_page(size_kb, tail=""):
+    """A lowercased page of roughly size_kb with the verdict text at the very end (the worst case for `in`)"""
+    page = FILLER * (size_kb * 1024 // len(FILLER) + 1)
+    return (page + tail).lower()
+
+
+def loan_zero_down(page_source):
+    """TC_LOAN_03"""
+    if "approved" in page_source:
+        return "approved"
+    elif "denied" in page_source:
+        return "denied"
+    elif "an internal error has occurred" in page_source:
+        return "internal_error"
+    return None
+
+
+def loan_empty_amount(page_source):
+    """TC_LOAN_04"""
+    if "an internal error has occurred" in page_source:
+        return "internal_error"
+    elif "required" in page_source or "enter" in page_source:
+        return "validation"
+    elif "approved" in page_source or "denied" in page_source:
+        return "processed"
+    return None
+
+
+def loan_large_amount(page_source):
+    """TC_LOAN_06"""
+    if "denied" in page_source:
+        return "denied"
+    elif "an internal error has occurred" in page_source:
+        return "internal_error"
+    elif "approved" in page_source:
+        return "approved"
+    elif "exception" in page_source or "overflow" in page_source:
+        return "overflow"
+    return None
+
+
+def statement_unauthorized(page_source):
+    """TC_STMT_07 (without its "$" check on the raw source)"""
+    if "an internal error has occurred" in page_source:
+        return "internal_error"
+    elif "access denied" in page_source or "unauthorized" in page_source:
+        return "access_denied"
+    elif "balance" in page_source:
+        return "balance"
+    return None
+
+
+def find_sql_exposed(visible_text):
+    """TC_FIND_07"""
+    sql_keywords = ["sqlexception", "jdbc", "mysql", "postgresql", "oracle", "syntax error"]
+    return "sql_exposed" if any(kw in visible_text for kw in sql_keywords) else None
+
+
+# each chain with the same rules in the same priority order for the engine
+CASES = [
+    ("TC_LOAN_03", loan_zero_down, VerdictRules(
+        approved=["approved"], denied=["denied"], internal_error=COMMON_RULES["internal_error"])),
+    ("TC_LOAN_04", loan_empty_amount, VerdictRules(
+        internal_error=COMMON_RULES["internal_error"], validation=["required", "enter"],
+        processed=["approved", "denied"])),
+    ("TC_LOAN_06", loan_large_amount, VerdictRules(
+        denied=["denied"], internal_error=COMMON_RULES["internal_error"], approved=["approved"],
+        overflow=["exception", "overflow"])),
+    ("TC_STMT_07", statement_unauthorized, VerdictRules(
+        internal_error=COMMON_RULES["internal_error"], access_denied=COMMON_RULES["access_denied"],
+        balance=["balance"])),
+    ("TC_FIND_07", find_sql_exposed, VerdictRules(sql_exposed=COMMON_RULES["sql_exposed"])),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the single-pass verdict engine with the suites' `in` chains")
+    parser.add_argument("--size-kb", type=int, default=100, help="synthetic page size")
+    parser.add_argument("--repeat", type=int, default=100, help="scans per timing")
+    args = parser.parse_args()
+
+    pages = {
+        "no verdict text": make_page(args.size_kb),
+        "loan denied": make_page(args.size_kb, "<p id='loanStatus'>Denied</p>"),
+        "internal error": make_page(args.size_kb, "<h1>Error!</h1><p>An internal error has occurred and has been logged.</p>"),
+    }
+
+    print("\n" + "="*60)
+    print(f"VERDICT BENCHMARK ({args.size_kb} KB page, {args.repeat} scans)")
+    print("="*60)
+    for label, page in pages.items():
+        print(label)
+        for test, chain, engine in CASES:
+            assert engine.verdict(page) == chain(page), (label, test)
+            chained = timeit.timeit(lambda: chain(page), number=args.repeat) / args.repeat
+            single = timeit.timeit(lambda: engine.verdict(page), number=args.repeat) / args.repeat
+            print(f"  {test:<11} chained `in`: {chained * 1000:7.3f} ms | one pass: {single * 1000:7.3f} ms "
+                  f"({chained / single:4.2f}x)")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
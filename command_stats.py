@@ -0,0 +1,122 @@
+"""
+WebDriver Command Statistics for Parabank Selenium Tests
+Wraps each driver's command executor so every WebDriver command a test sends
+(findElement, sendKeysToElement, getPageSource, screenshot, ...) is counted and timed
+per test. The HTML report shows the totals, the time per command type, a latency
+histogram and the slowest commands of each test.
+
+Needs a runner that reports test boundaries (suite_runner.instrument_suite).
+"""
+
+import heapq
+import threading
+import time
+
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+SLOWEST_KEPT = 5
+
+
+def bucket_labels():
+    labels = [f"<{limit} ms" for limit in LATENCY_BUCKETS_MS]
+    return labels + [f">={LATENCY_BUCKETS_MS[-1]} ms"]
+
+
+def command_detail(command, params):
+    """Short description of what a command targeted, for the slowest-commands list"""
+    params = params or {}
+    if "using" in params:
+        return f"{params['using']}={params.get('value')}"[:80]
+    if "script" in params:
+        return " ".join(str(params["script"]).split())[:60]
+    if "url" in params:
+        return str(params["url"])[:80]
+    return ""
+
+
+class TestCommandStats:
+    """Counts and timings of the WebDriver commands sent by one test"""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.by_command = {}
+        self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.slowest = []
+
+    def record(self, command, seconds, detail):
+        self.count += 1
+        self.seconds += seconds
+        entry = self.by_command.setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        milliseconds = seconds * 1000
+        bucket = next((i for i, limit in enumerate(LATENCY_BUCKETS_MS) if milliseconds < limit), len(LATENCY_BUCKETS_MS))
+        self.histogram[bucket] += 1
+        item = (seconds, command, detail)
+        if len(self.slowest) < SLOWEST_KEPT:
+            heapq.heappush(self.slowest, item)
+        elif item > self.slowest[0]:
+            heapq.heapreplace(self.slowest, item)
+
+    def as_dict(self):
+        return {
+            "commands": self.count,
+            "seconds": round(self.seconds, 3),
+            "by_command": {command: {"count": count, "seconds": round(seconds, 3)}
+                           for command, (count, seconds) in sorted(self.by_command.items(),
+                                                                   key=lambda item: -item[1][1])},
+            "histogram": list(self.histogram),
+            "slowest": [{"command": command, "ms": round(seconds * 1000, 1), "detail": detail}
+                        for seconds, command, detail in sorted(self.slowest, reverse=True)],
+        }
+
+
+class CommandStats:
+    """Test listener that times every command sent through an instrumented driver"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results = {}
+        # tests run one per thread (window_pool runs several at once)
+        self.local = threading.local()
+
+    def test_started(self, test_id):
+        stats = TestCommandStats()
+        with self.lock:
+            self.results[test_id] = stats
+        self.local.stats = stats
+
+    def driver_created(self, test_id, driver):
+        executor = driver.command_executor
+        if getattr(executor, "timed_by_command_stats", False):
+            return  # window_pool hands the same driver to every test
+        execute = executor.execute
+
+        def timed_execute(command, params):
+            start = time.perf_counter()
+            try:
+                return execute(command, params)
+            finally:
+                stats = getattr(self.local, "stats", None)
+                if stats is not None:
+                    stats.record(command, time.perf_counter() - start, command_detail(command, params))
+
+        executor.execute = timed_execute
+        executor.timed_by_command_stats = True
+
+    def test_finished(self, test_id, status):
+        stats = getattr(self.local, "stats", None)
+        self.local.stats = None
+        if stats is None or not stats.count:
+            return
+        top = sorted(stats.by_command.items(), key=lambda item: -item[1][1])[:3]
+        breakdown = ", ".join(f"{command} {count}x {seconds:.1f}s" for command, (count, seconds) in top)
+        print(f"    [COMMANDS] {stats.count} WebDriver command(s), {stats.seconds:.1f}s | {breakdown}")
+
+    def summary(self):
+        """Per-test statistics as plain dicts, in test order"""
+        with self.lock:
+            return {test_id: stats.as_dict() for test_id, stats in self.results.items()}
+
+
+command_stats = CommandStats()
@@ -3,14 +3,161 @@ HTML Test Report Generator for Parabank Selenium Tests
 Generates a professional HTML report after all tests complete
 """
 
+import json
 import os
 import sys
 from datetime import datetime
-import glob
+from html import escape
+
+from command_stats import bucket_labels, command_stats
+from live_report import live_report
+from phase_timing import PHASES, phase_timer
+from report_fonts import font_face_css
+from result_records import read_results, result_recorder
+from results_history import HISTORY_DB, HistoryStore
+from screenshot_capture import capture, read_manifest
+from suite_runner import discover_test_ids, instrument_suite
+from thumbnails import generate_thumbnails
+from visual_check import run_visual_checks
+
+VISUAL_CHECK = os.environ.get("PARABANK_VISUAL_CHECK") == "1"
+UPDATE_BASELINES = os.environ.get("PARABANK_UPDATE_BASELINES") == "1"
+# offline: no request to Google Fonts, the fonts are embedded from fonts/ or system fonts are used
+REPORT_OFFLINE = os.environ.get("PARABANK_REPORT_OFFLINE") == "1"
+# low CPU: no endless animations, for reports left open on a build monitor
+REPORT_LOW_CPU = os.environ.get("PARABANK_REPORT_LOW_CPU") == "1"
+
+GOOGLE_FONTS_LINK = ('<link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700;800;900'
+                     '&family=Rajdhani:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">')
+FONT_FACES_MARKER = "/*font-faces*/"
+STILL_CSS = """
+        .bg-grid, .status-icon { animation: none; }
+        .orb { display: none; }"""
+
+# per-test rows are embedded as JSON and drawn by RESULTS_TABLE_SCRIPT, a screenful at a time
+RESULTS_DATA_MARKER = "<!--results-data-->"
+RESULTS_CHUNK = 10000
+RESULTS_TABLE_SCRIPT = """
+(function () {
+    const ROW_HEIGHT = 36, OVERSCAN = 10;
+    const data = JSON.parse(document.getElementById('results-data').textContent);
+    const rows = data.rows;
+    // [tc_id, title, suite, status, duration, message, test_id]; suite and status index into data.suites / data.statuses
+    const keys = [
+        row => row[0] || row[6],
+        row => data.suites[row[2]],
+        row => data.statuses[row[3]],
+        row => row[4],
+        row => row[5] || '',
+    ];
+    const viewport = document.getElementById('results-viewport');
+    const spacer = document.getElementById('results-spacer');
+    const body = document.getElementById('results-body');
+    const count = document.getElementById('results-count');
+    const filterInput = document.getElementById('results-filter');
+    const statusSelect = document.getElementById('results-status');
+    let view = Array.from(rows.keys());
+    let sortColumn = -1, sortDescending = false, searchText = null;
+
+    data.statuses.forEach((status, index) => statusSelect.add(new Option(status, index)));
+
+    function cell(text, className) {
+        const div = document.createElement('div');
+        div.className = className;
+        div.textContent = text;
+        div.title = text;
+        return div;
+    }
+
+    function draw() {
+        spacer.style.height = view.length * ROW_HEIGHT + 'px';
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ROW_HEIGHT) - OVERSCAN);
+        const last = Math.min(view.length, first + Math.ceil(viewport.clientHeight / ROW_HEIGHT) + 2 * OVERSCAN);
+        const fragment = document.createDocumentFragment();
+        for (let i = first; i < last; i++) {
+            const row = rows[view[i]];
+            const status = data.statuses[row[3]];
+            const line = document.createElement('div');
+            line.className = 'vrow';
+            line.style.top = i * ROW_HEIGHT + 'px';
+            line.append(
+                cell(row[0] ? row[0] + ': ' + row[1] : row[6], 'suite-name'),
+                cell(data.suites[row[2]], 'module-name'),
+                cell(status, status === 'passed' ? 'num-passed' : 'num-failed'),
+                cell(row[4] == null ? '-' : row[4].toFixed(1) + 's', 'num-total'),
+                cell(row[5] || '', 'module-name'));
+            fragment.append(line);
+        }
+        body.replaceChildren(fragment);
+        count.textContent = view.length === rows.length ? rows.length + ' tests' : view.length + ' of ' + rows.length + ' tests';
+    }
+
+    function update() {
+        const text = filterInput.value.trim().toLowerCase();
+        const status = statusSelect.value === '' ? -1 : Number(statusSelect.value);
+        if (text && !searchText) {
+            searchText = rows.map(row => [row[0], row[1], data.suites[row[2]], row[5], row[6]].join(' ').toLowerCase());
+        }
+        view = [];
+        for (let i = 0; i < rows.length; i++) {
+            if ((status < 0 || rows[i][3] === status) && (!text || searchText[i].includes(text))) view.push(i);
+        }
+        if (sortColumn >= 0) {
+            const key = keys[sortColumn], direction = sortDescending ? -1 : 1;
+            view.sort((a, b) => {
+                const x = key(rows[a]), y = key(rows[b]);
+                return x === y ? a - b : (x == null || x < y ? -direction : direction);
+            });
+        }
+        viewport.scrollTop = 0;
+        draw();
+    }
+
+    document.querySelectorAll('#results-header [data-column]').forEach(header => header.addEventListener('click', () => {
+        const column = Number(header.dataset.column);
+        sortDescending = column === sortColumn ? !sortDescending : false;
+        sortColumn = column;
+        update();
+    }));
+    let timer = null;
+    filterInput.addEventListener('input', () => { clearTimeout(timer); timer = setTimeout(update, 200); });
+    statusSelect.addEventListener('change', update);
+    viewport.addEventListener('scroll', () => requestAnimationFrame(draw));
+    draw();
+    window.resultsTableReady = performance.now();
+})();
+"""
+
+def sparkline(values, color, width=120, height=28):
+    """Inline SVG line through the values (None leaves a gap), ending in a dot on the latest value"""
+    known = [value for value in values if value is not None]
+    if not known:
+        return ""
+    low, high = min(known), max(known)
+    span = (high - low) or 1
+    step = width / max(len(values) - 1, 1)
+    segments, segment, last = [], [], None
+    for i, value in enumerate(values):
+        if value is None:
+            if segment:
+                segments.append(segment)
+            segment = []
+            continue
+        last = (i * step, height - 3 - (value - low) / span * (height - 6))
+        segment.append(f"{last[0]:.1f},{last[1]:.1f}")
+    if segment:
+        segments.append(segment)
+    lines = "".join(f'<polyline points="{" ".join(points)}" fill="none" stroke="{color}" stroke-width="1.5"/>'
+                    for points in segments)
+    return (f'<svg class="spark" width="{width}" height="{height}" viewBox="0 0 {width} {height}">{lines}'
+            f'<circle cx="{last[0]:.1f}" cy="{last[1]:.1f}" r="2.5" fill="{color}"/></svg>')
+
 
 class TestReportGenerator:
     def __init__(self):
         self.test_results = []
+        self.visual_results = []
+        self.screenshots_by_test = {}
         self.total_passed = 0
         self.total_failed = 0
         self.start_time = datetime.now()
@@ -18,6 +165,9 @@ class TestReportGenerator:
     def run_all_tests(self):
         """Run all test suites and collect results"""
 
+        capture.start_run()
+        result_recorder.start_run()
+
         test_suites = [
             ("Registration", "test_selenium1", "TestRegistration"),
             ("Login", "test_selenium2", "TestLogin"),
@@ -27,6 +177,7 @@ class TestReportGenerator:
             ("Admin Page", "test_selenium6", "TestAdminPage"),
             ("Customer Care", "test_selenium7", "TestCustomerCare"),
         ]
+        live_report.start_run(len(discover_test_ids(test_suites)))
 
         for suite_name, module_name, class_name in test_suites:
             try:
@@ -37,8 +188,14 @@ class TestReportGenerator:
                 print(f"Running {suite_name} Tests...")
                 print('='*60)
 
-                test_instance = test_class()
+                test_instance = instrument_suite(test_class())
                 result = test_instance.run_all_tests()
+                capture.flush()
+
+                if VISUAL_CHECK or UPDATE_BASELINES:
+                    self.visual_results.extend(run_visual_checks(
+                        capture.screenshots_for(test_instance.screenshot_dir),
+                        update_baselines=UPDATE_BASELINES))
 
                 self.test_results.append({
                     "name": suite_name,
@@ -65,29 +222,362 @@ class TestReportGenerator:
                 })
                 self.total_failed += 1
 
+    def load_screenshots(self):
+        """Group this run's screenshot manifest entries by test ID"""
+        capture.flush()
+        self.screenshots_by_test = {}
+        for entry in read_manifest():
+            test_id = entry.get("test_id") or "(outside a test)"
+            self.screenshots_by_test.setdefault(test_id, []).append(entry)
+        return self.screenshots_by_test
+
     def count_screenshots(self):
-        """Count total screenshots captured"""
-        screenshots = glob.glob("screenshots/**/*.png", recursive=True)
-        return len(screenshots)
+        """Count screenshots captured in this run, from the capture manifest"""
+        return sum(len(entries) for entries in self.screenshots_by_test.values())
+
+    def render_screenshot_section(self):
+        """Per-test thumbnail galleries built from the manifest; full images load on click"""
+        if not self.screenshots_by_test:
+            return ""
+
+        thumbnails = generate_thumbnails(entry["stored"] for entries in self.screenshots_by_test.values()
+                                         for entry in entries)
+        rows = []
+        for test_id, entries in self.screenshots_by_test.items():
+            items = []
+            for entry in entries:
+                thumb = thumbnails.get(entry["stored"])
+                step, stored = escape(entry["step"], quote=True), escape(entry["stored"], quote=True)
+                if thumb:
+                    items.append(f'<a class="shot" href="{stored}" target="_blank" title="{step}">'
+                                 f'<img src="{escape(thumb, quote=True)}" loading="lazy" alt="{step}"><span>{step}</span></a>')
+                else:
+                    items.append(f'<a class="shot-link" href="{stored}" target="_blank">{step}</a>')
+            size_kb = sum(entry["size"] for entry in entries) / 1024
+            rows.append(f'''
+                    <tr>
+                        <td class="module-name">{escape(test_id)}</td>
+                        <td class="num-total">{len(entries)}</td>
+                        <td class="num-total">{size_kb:.0f} KB</td>
+                        <td><details><summary>Show {len(entries)}</summary><div class="gallery">{"".join(items)}</div></details></td>
+                    </tr>''')
+
+        return f'''
+        <div class="suites-section">
+            <h2>Screenshots</h2>
+            <table class="suites-table">
+                <thead>
+                    <tr>
+                        <th>Test</th>
+                        <th>Count</th>
+                        <th>Size</th>
+                        <th>Gallery</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(rows)}
+                </tbody>
+            </table>
+        </div>
+        '''
+
+    def render_visual_section(self):
+        """Visual regression table with links to the diff images; empty when checks did not run"""
+        if not self.visual_results:
+            return ""
+
+        regressions = [r for r in self.visual_results if r["status"] in ("fail", "error")]
+        new_count = sum(1 for r in self.visual_results if r["status"] == "new")
+        rows = []
+        for result in regressions:
+            ssim = f'{result["ssim"]:.4f}' if result["ssim"] is not None else "-"
+            changed = f'{result["changed_ratio"] * 100:.2f}%' if result["changed_ratio"] is not None else "-"
+            if result["diff"]:
+                diff_path = escape(result["diff"], quote=True)
+                diff = f'<a href="{diff_path}"><img class="diff-thumb" src="{diff_path}" alt="diff"></a>'
+            else:
+                diff = escape(result.get("error") or "")
+            rows.append(f'''
+                    <tr>
+                        <td class="suite-name">{escape(result["name"], quote=True)}</td>
+                        <td class="module-name">{escape(result["suite"], quote=True)}</td>
+                        <td class="num-total">{ssim}</td>
+                        <td class="num-failed">{changed}</td>
+                        <td>{diff}</td>
+                    </tr>''')
+
+        return f'''
+        <div class="suites-section">
+            <h2>Visual Regression</h2>
+            <p class="module-name">{len(self.visual_results)} compared | {len(regressions)} regression(s) | {new_count} without baseline</p>
+            <table class="suites-table">
+                <thead>
+                    <tr>
+                        <th>Screenshot</th>
+                        <th>Suite</th>
+                        <th>SSIM</th>
+                        <th>Changed</th>
+                        <th>Diff</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(rows)}
+                </tbody>
+            </table>
+        </div>
+        '''
 
-    def generate_html_report(self):
+    def render_command_section(self):
+        """WebDriver commands per test: counts, time per command type, latency histogram, slowest commands"""
+        stats_by_test = command_stats.summary()
+        if not stats_by_test:
+            return ""
+
+        histogram = [0] * len(bucket_labels())
+        rows = []
+        for test_id, stats in stats_by_test.items():
+            histogram = [total + count for total, count in zip(histogram, stats["histogram"])]
+            by_type = ", ".join(f'{command} {entry["count"]}x / {entry["seconds"]:.1f}s'
+                                for command, entry in list(stats["by_command"].items())[:4])
+            slowest = "<br>".join(f'{entry["ms"]:.0f} ms {entry["command"]} {escape(entry["detail"])}'
+                                  for entry in stats["slowest"][:3])
+            rows.append(f'''
+                    <tr>
+                        <td class="module-name">{escape(test_id)}</td>
+                        <td class="num-total">{stats["commands"]}</td>
+                        <td class="num-total">{stats["seconds"]:.1f}s</td>
+                        <td class="module-name">{by_type}</td>
+                        <td class="module-name">{slowest}</td>
+                    </tr>''')
+
+        peak = max(histogram) or 1
+        bars = "".join(f'<div class="bar" title="{escape(label)}: {count}"><div class="bar-fill" style="height: {count / peak * 100:.0f}%"></div>'
+                       f'<span>{escape(label)}</span><span class="num-total">{count}</span></div>'
+                       for label, count in zip(bucket_labels(), histogram))
+        total_commands = sum(stats["commands"] for stats in stats_by_test.values())
+        total_seconds = sum(stats["seconds"] for stats in stats_by_test.values())
+
+        return f'''
+        <div class="suites-section">
+            <h2>WebDriver Commands</h2>
+            <p class="module-name">{total_commands} command(s) | {total_seconds:.1f}s spent in WebDriver calls</p>
+            <div class="histogram">{bars}</div>
+            <table class="suites-table">
+                <thead>
+                    <tr>
+                        <th>Test</th>
+                        <th>Commands</th>
+                        <th>Time</th>
+                        <th>By Command</th>
+                        <th>Slowest</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(rows)}
+                </tbody>
+            </table>
+        </div>
+        '''
+
+    def render_waterfall_section(self):
+        """Per-test timing waterfall: where each test's time went, phase by phase"""
+        timelines = phase_timer.summary()
+        if not timelines:
+            return ""
+
+        totals = dict.fromkeys(PHASES, 0.0)
+        rows = []
+        for test_id, timeline in timelines.items():
+            duration = timeline["duration"] or 1
+            for name, seconds in timeline["totals"].items():
+                totals[name] += seconds
+            bars = "".join(f'<div class="phase-{name}" style="left: {start / duration * 100:.2f}%; '
+                           f'width: {max(length / duration * 100, 0.2):.2f}%" title="{name} {length:.2f}s at +{start:.2f}s"></div>'
+                           for name, start, length in timeline["spans"])
+            breakdown = ", ".join(f"{name} {seconds:.1f}s" for name, seconds in
+                                  sorted(timeline["totals"].items(), key=lambda item: -item[1])[:3])
+            rows.append(f'''
+                    <tr>
+                        <td class="module-name">{escape(test_id)}</td>
+                        <td class="num-total">{timeline["duration"]:.1f}s</td>
+                        <td class="waterfall-cell"><div class="waterfall">{bars}</div></td>
+                        <td class="module-name">{breakdown}</td>
+                    </tr>''')
+
+        overall = sum(totals.values()) or 1
+        stacked = "".join(f'<div class="phase-{name}" style="width: {seconds / overall * 100:.2f}%" '
+                          f'title="{name} {seconds:.1f}s"></div>' for name, seconds in totals.items() if seconds)
+        legend = "".join(f'<span><i class="phase-{name}"></i>{name} {totals[name]:.0f}s</span>' for name in PHASES)
+
+        return f'''
+        <div class="suites-section">
+            <h2>Timing Waterfall</h2>
+            <div class="phase-legend">{legend}</div>
+            <div class="phase-stack">{stacked}</div>
+            <table class="suites-table">
+                <thead>
+                    <tr>
+                        <th>Test</th>
+                        <th>Duration</th>
+                        <th>Waterfall</th>
+                        <th>Largest Phases</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(rows)}
+                </tbody>
+            </table>
+        </div>
+        '''
+
+    def render_results_section(self, records):
+        """Filterable, sortable per-test table; the rows themselves are streamed in by write_results_data"""
+        if not records:
+            return ""
+
+        headers = "".join(f'<div data-column="{index}">{name}</div>'
+                          for index, name in enumerate(["Test", "Suite", "Status", "Duration", "Message"]))
+        return f'''
+        <div class="suites-section">
+            <h2>Test Results</h2>
+            <div class="results-controls">
+                <input id="results-filter" type="search" placeholder="Filter by test, suite or message">
+                <select id="results-status"><option value="">All statuses</option></select>
+                <span id="results-count" class="module-name"></span>
+            </div>
+            <div id="results-header" class="vrow vhead">{headers}</div>
+            <div id="results-viewport">
+                <div id="results-spacer"></div>
+                <div id="results-body"></div>
+            </div>
+            <script type="application/json" id="results-data">{RESULTS_DATA_MARKER}</script>
+            <script>{RESULTS_TABLE_SCRIPT}</script>
+        </div>
+        '''
+
+    def write_results_data(self, f, records):
+        """Write records as compact JSON in chunks, with suite and status names stored once"""
+        suites, statuses = {}, {}
+        for record in records:
+            suites.setdefault(record.get("suite") or "", len(suites))
+            statuses.setdefault(record["status"], len(statuses))
+
+        def dumps(value):
+            # "<" escaped so a message containing "</script>" cannot end the data block
+            return json.dumps(value, separators=(",", ":")).replace("<", "\\u003c")
+
+        f.write(f'{{"suites":{dumps(list(suites))},"statuses":{dumps(list(statuses))},"rows":[')
+        for start in range(0, len(records), RESULTS_CHUNK):
+            chunk = records[start:start + RESULTS_CHUNK]
+            if start:
+                f.write(",")
+            f.write(",".join(dumps([record.get("tc_id"), record.get("title"), suites[record.get("suite") or ""],
+                                    statuses[record["status"]], record.get("duration"), record.get("message"),
+                                    record["test_id"]])
+                             for record in chunk))
+        f.write("]}")
+
+    def save_history(self, records=None):
+        """Add this run's records to the results history"""
+        records = read_results() if records is None else records
+        if not records:
+            return None
+        command_seconds = {test_id: stats["seconds"] for test_id, stats in command_stats.summary().items()}
+        store = HistoryStore()
+        try:
+            run_id = store.record_run(records, command_seconds)
+        finally:
+            store.close()
+        print(f"[HISTORY] Run {run_id} saved to {HISTORY_DB}")
+        return run_id
+
+    def render_history_section(self):
+        """Per-suite and per-test trends over the last runs in the results history"""
+        if not os.path.exists(HISTORY_DB):
+            return ""
+        store = HistoryStore()
+        try:
+            runs, suites, tests = store.trends()
+        finally:
+            store.close()
+        if len(runs) < 2:
+            return ""
+
+        def latest(points, key, unit):
+            value = next((point[key] for point in reversed(points) if point and point[key] is not None), None)
+            return "-" if value is None else f"{value:.0f}{unit}" if unit == "%" else f"{value:.1f}{unit}"
+
+        def cells(points, keys):
+            return "".join(f'<td>{sparkline([point and point[key] for point in points], color)}'
+                           f'<span class="num-total">{latest(points, key, unit)}</span></td>'
+                           for key, color, unit in keys)
+
+        suite_keys = [("pass_rate", "var(--accent-green)", "%"), ("p50", "var(--accent-cyan)", "s"),
+                      ("p95", "var(--accent-purple)", "s"), ("idle", "var(--accent-yellow)", "s")]
+        suite_rows = [f'''
+                    <tr>
+                        <td class="suite-name">{escape(suite)}</td>{cells(points, suite_keys)}
+                    </tr>''' for suite, points in suites.items()]
+        test_rows = []
+        for test_id, points in tests.items():
+            strip = "".join(f'<i class="run-{"none" if not point else "pass" if point["status"] == "passed" else "fail"}"></i>'
+                            for point in points)
+            test_rows.append(f'''
+                    <tr>
+                        <td class="module-name">{escape(test_id)}</td>
+                        <td><span class="run-strip">{strip}</span></td>{cells(points, suite_keys[1:2] + suite_keys[3:])}
+                    </tr>''')
+
+        return f'''
+        <div class="suites-section">
+            <h2>Trends</h2>
+            <p class="module-name">Last {len(runs)} runs, builds {escape(runs[0]["build"])} to {escape(runs[-1]["build"])}</p>
+            <table class="suites-table">
+                <thead>
+                    <tr>
+                        <th>Suite</th>
+                        <th>Pass Rate</th>
+                        <th>p50 Duration</th>
+                        <th>p95 Duration</th>
+                        <th>Idle (p50)</th>
+                    </tr>
+                </thead>
+                <tbody>{"".join(suite_rows)}
+                </tbody>
+            </table>
+            <details>
+                <summary>Per-test trends ({len(test_rows)} tests)</summary>
+                <table class="suites-table">
+                    <thead>
+                        <tr>
+                            <th>Test</th>
+                            <th>Results</th>
+                            <th>p50 Duration</th>
+                            <th>Idle (p50)</th>
+                        </tr>
+                    </thead>
+                    <tbody>{"".join(test_rows)}
+                    </tbody>
+                </table>
+            </details>
+        </div>
+        '''
+
+    def generate_html_report(self, records=None, report_path="test_report.html"):
         """Generate the HTML report"""
 
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds()
         total_tests = self.total_passed + self.total_failed
         success_rate = (self.total_passed / total_tests * 100) if total_tests > 0 else 0
+        self.load_screenshots()
         screenshot_count = self.count_screenshots()
 
         # Generate table rows
-        table_rows = ""
+        table_rows = []
         for suite in self.test_results:
             rate = suite["success_rate"]
             rate_class = "rate-100" if rate == 100 else "rate-75" if rate >= 75 else "rate-50" if rate >= 50 else "rate-low"
             status_badge = "badge-passed" if suite["failed"] == 0 else "badge-failed"
             status_text = "PASS" if suite["failed"] == 0 else "FAIL"
 
-            table_rows += f'''
+            table_rows.append(f'''
                     <tr>
                         <td class="suite-name">{suite["name"]}</td>
                         <td class="module-name">{suite["module"]}.py</td>
@@ -99,7 +589,18 @@ class TestReportGenerator:
                             <span class="rate-text">{rate:.0f}%</span>
                         </td>
                         <td><span class="badge {status_badge}">{status_text}</span></td>
-                    </tr>'''
+                    </tr>''')
+
+        visual_section = self.render_visual_section()
+        command_section = self.render_command_section()
+        waterfall_section = self.render_waterfall_section()
+        screenshot_section = self.render_screenshot_section()
+        if records is None:
+            records = read_results()
+        results_section = self.render_results_section(records)
+        history_section = self.render_history_section()
+
+        font_link = "" if REPORT_OFFLINE else GOOGLE_FONTS_LINK
 
         html = f'''<!DOCTYPE html>
 <html lang="en">
@@ -107,8 +608,9 @@ class TestReportGenerator:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Parabank Test Report</title>
-    <link href="https://fonts.googleapis.com/css2?family=Orbitron:wght@400;500;600;700;800;900&family=Rajdhani:wght@300;400;500;600;700&family=JetBrains+Mono:wght@400;500;600&display=swap" rel="stylesheet">
+    {font_link}
     <style>
+        {FONT_FACES_MARKER if REPORT_OFFLINE else ""}
         :root {{
             --bg-primary: #0a0e17;
             --bg-secondary: #111827;
@@ -122,10 +624,13 @@ class TestReportGenerator:
             --text-secondary: #94a3b8;
             --text-muted: #64748b;
             --border-color: #2d3748;
+            --font-display: 'Orbitron', 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+            --font-body: 'Rajdhani', 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+            --font-mono: 'JetBrains Mono', Consolas, 'DejaVu Sans Mono', monospace;
         }}
         * {{ margin: 0; padding: 0; box-sizing: border-box; }}
         body {{
-            font-family: 'Rajdhani', sans-serif;
+            font-family: var(--font-body);
             background: var(--bg-primary);
             color: var(--text-primary);
             min-height: 100vh;
@@ -179,7 +684,7 @@ class TestReportGenerator:
             background: linear-gradient(90deg, transparent, var(--accent-cyan), var(--accent-purple), var(--accent-cyan), transparent);
         }}
         .header h1 {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             font-size: 3rem;
             font-weight: 900;
             margin-bottom: 15px;
@@ -198,7 +703,7 @@ class TestReportGenerator:
         }}
         .header .timestamp {{
             margin-top: 20px;
-            font-family: 'JetBrains Mono', monospace;
+            font-family: var(--font-mono);
             font-size: 0.9rem;
             color: var(--accent-cyan);
             padding: 8px 20px;
@@ -228,7 +733,7 @@ class TestReportGenerator:
             box-shadow: 0 15px 40px rgba(0, 0, 0, 0.3);
         }}
         .summary-card .value {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             font-size: 3.2rem;
             font-weight: 800;
             margin-bottom: 10px;
@@ -291,7 +796,7 @@ class TestReportGenerator:
             text-align: center;
         }}
         .circular-progress .percentage .value {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             font-size: 2.5rem;
             font-weight: 800;
             color: var(--accent-green);
@@ -305,7 +810,7 @@ class TestReportGenerator:
         }}
         .progress-details {{ flex: 1; }}
         .progress-details h3 {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             font-size: 1.4rem;
             margin-bottom: 25px;
             color: var(--text-primary);
@@ -351,7 +856,7 @@ class TestReportGenerator:
         }}
         .info-card:hover {{ border-color: var(--accent-cyan); transform: translateY(-3px); }}
         .info-card h4 {{
-            font-family: 'JetBrains Mono', monospace;
+            font-family: var(--font-mono);
             color: var(--text-muted);
             margin-bottom: 10px;
             font-size: 0.75rem;
@@ -381,7 +886,7 @@ class TestReportGenerator:
             border: 1px solid var(--border-color);
         }}
         .suites-section h2 {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             font-size: 1.6rem;
             margin-bottom: 30px;
             color: var(--text-primary);
@@ -403,7 +908,7 @@ class TestReportGenerator:
             border-spacing: 0 8px;
         }}
         .suites-table th {{
-            font-family: 'JetBrains Mono', monospace;
+            font-family: var(--font-mono);
             background: var(--bg-primary);
             color: var(--text-muted);
             text-transform: uppercase;
@@ -428,7 +933,7 @@ class TestReportGenerator:
             color: var(--accent-cyan);
         }}
         .module-name {{
-            font-family: 'JetBrains Mono', monospace;
+            font-family: var(--font-mono);
             font-size: 0.85rem;
             color: var(--text-muted);
         }}
@@ -470,13 +975,182 @@ class TestReportGenerator:
         .rate-50 {{ background: linear-gradient(90deg, #ff6b35, #e65a2b); }}
         .rate-low {{ background: linear-gradient(90deg, #ff3366, #cc2952); }}
         .rate-text {{
-            font-family: 'JetBrains Mono', monospace;
+            font-family: var(--font-mono);
             font-size: 0.9rem;
             font-weight: 600;
         }}
-        .num-passed {{ color: var(--accent-green); font-weight: 700; font-family: 'JetBrains Mono', monospace; }}
-        .num-failed {{ color: var(--accent-red); font-weight: 700; font-family: 'JetBrains Mono', monospace; }}
-        .num-total {{ font-weight: 600; font-family: 'JetBrains Mono', monospace; }}
+        .num-passed {{ color: var(--accent-green); font-weight: 700; font-family: var(--font-mono); }}
+        .num-failed {{ color: var(--accent-red); font-weight: 700; font-family: var(--font-mono); }}
+        .num-total {{ font-weight: 600; font-family: var(--font-mono); }}
+        .shot-link {{
+            display: inline-block;
+            margin: 2px 8px 2px 0;
+            font-family: var(--font-mono);
+            font-size: 0.8rem;
+            color: var(--accent-cyan);
+        }}
+        .gallery {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 12px;
+            margin-top: 12px;
+        }}
+        .shot {{
+            display: flex;
+            flex-direction: column;
+            width: 160px;
+            font-family: var(--font-mono);
+            font-size: 0.7rem;
+            color: var(--text-secondary);
+            text-decoration: none;
+            word-break: break-all;
+        }}
+        .shot img {{
+            width: 160px;
+            height: 100px;
+            object-fit: cover;
+            object-position: top;
+            border-radius: 6px;
+            border: 1px solid var(--border-color);
+            margin-bottom: 4px;
+        }}
+        details summary {{
+            cursor: pointer;
+            color: var(--accent-cyan);
+            font-family: var(--font-mono);
+            font-size: 0.85rem;
+        }}
+        .histogram {{
+            display: flex;
+            align-items: flex-end;
+            gap: 10px;
+            height: 140px;
+            margin: 20px 0;
+        }}
+        .histogram .bar {{
+            flex: 1;
+            display: flex;
+            flex-direction: column;
+            justify-content: flex-end;
+            height: 100%;
+            font-family: var(--font-mono);
+            font-size: 0.7rem;
+            color: var(--text-muted);
+            text-align: center;
+        }}
+        .histogram .bar-fill {{
+            background: linear-gradient(180deg, var(--accent-cyan), var(--accent-purple));
+            border-radius: 4px 4px 0 0;
+            min-height: 2px;
+        }}
+        .results-controls {{
+            display: flex;
+            gap: 12px;
+            align-items: center;
+            margin-bottom: 12px;
+        }}
+        .results-controls input, .results-controls select {{
+            background: var(--bg-primary);
+            color: var(--text-primary);
+            border: 1px solid var(--border-color);
+            border-radius: 6px;
+            padding: 8px 12px;
+            font-family: var(--font-mono);
+        }}
+        .results-controls input {{ flex: 1; }}
+        .vrow {{
+            display: grid;
+            grid-template-columns: 3fr 1.2fr 0.8fr 0.8fr 3fr;
+            gap: 12px;
+            align-items: center;
+            height: 36px;
+            padding: 0 12px;
+        }}
+        .vrow div {{ overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }}
+        .vhead {{
+            font-family: var(--font-mono);
+            color: var(--text-muted);
+            text-transform: uppercase;
+            font-size: 0.75rem;
+            letter-spacing: 1px;
+        }}
+        .vhead div {{ cursor: pointer; }}
+        #results-viewport {{
+            position: relative;
+            height: 540px;
+            overflow-y: auto;
+            background: var(--bg-primary);
+            border-radius: 8px;
+        }}
+        #results-body .vrow {{
+            position: absolute;
+            left: 0;
+            right: 0;
+            border-bottom: 1px solid var(--bg-card);
+        }}
+        .waterfall-cell {{ width: 45%; }}
+        .waterfall {{
+            position: relative;
+            height: 14px;
+            background: var(--bg-card);
+            border-radius: 3px;
+            overflow: hidden;
+        }}
+        .waterfall div {{
+            position: absolute;
+            top: 0;
+            bottom: 0;
+        }}
+        .phase-stack {{
+            display: flex;
+            height: 18px;
+            border-radius: 4px;
+            overflow: hidden;
+            margin: 12px 0 20px;
+        }}
+        .phase-legend {{
+            display: flex;
+            flex-wrap: wrap;
+            gap: 16px;
+            font-family: var(--font-mono);
+            font-size: 0.8rem;
+            color: var(--text-secondary);
+        }}
+        .phase-legend i {{
+            display: inline-block;
+            width: 10px;
+            height: 10px;
+            border-radius: 2px;
+            margin-right: 6px;
+        }}
+        .phase-driver {{ background: #a855f7; }}
+        .phase-login {{ background: #00f0ff; }}
+        .phase-navigation {{ background: #3b82f6; }}
+        .phase-form_fill {{ background: #00ff88; }}
+        .phase-wait {{ background: #ffcc00; }}
+        .phase-verdict {{ background: #ff6b35; }}
+        .phase-screenshot {{ background: #ec4899; }}
+        .phase-teardown {{ background: #94a3b8; }}
+        .phase-interaction {{ background: #14b8a6; }}
+        .phase-other {{ background: #475569; }}
+        .spark {{
+            vertical-align: middle;
+            margin-right: 8px;
+        }}
+        .run-strip {{ display: inline-flex; gap: 2px; }}
+        .run-strip i {{
+            width: 6px;
+            height: 16px;
+            border-radius: 1px;
+        }}
+        .run-pass {{ background: var(--accent-green); }}
+        .run-fail {{ background: var(--accent-red); }}
+        .run-none {{ background: var(--bg-card); }}
+        .diff-thumb {{
+            max-width: 240px;
+            border-radius: 6px;
+            border: 1px solid var(--border-color);
+        }}
         .footer {{
             text-align: center;
             padding: 30px 20px;
@@ -484,9 +1158,11 @@ class TestReportGenerator:
             font-size: 0.9rem;
         }}
         .footer .brand {{
-            font-family: 'Orbitron', monospace;
+            font-family: var(--font-display);
             color: var(--accent-cyan);
         }}
+        @media (prefers-reduced-motion: reduce) {{{STILL_CSS}
+        }}{STILL_CSS if REPORT_LOW_CPU else ""}
     </style>
 </head>
 <body>
@@ -593,11 +1269,16 @@ class TestReportGenerator:
                         <th>Status</th>
                     </tr>
                 </thead>
-                <tbody>{table_rows}
+                <tbody>{"".join(table_rows)}
                 </tbody>
             </table>
         </div>
-        
+        {results_section}
+        {history_section}
+        {visual_section}
+        {waterfall_section}
+        {command_section}
+        {screenshot_section}
         <div class="footer">
             <p><span class="brand">PARABANK</span> Selenium Test Automation</p>
             <p>Generated by Jenkins CI/CD Pipeline</p>
@@ -606,9 +1287,16 @@ class TestReportGenerator:
 </body>
 </html>'''
 
-        report_path = "test_report.html"
+        page_head, _, page_tail = html.partition(RESULTS_DATA_MARKER)
+        if REPORT_OFFLINE:
+            font_faces = font_face_css(page_head + page_tail)
+            page_head = page_head.replace(FONT_FACES_MARKER, font_faces, 1)
         with open(report_path, "w", encoding="utf-8") as f:
-            f.write(html)
+            f.write(page_head)
+            if results_section:
+                self.write_results_data(f, records)
+            f.write(page_tail)
+        live_report.finish()
 
         print(f"\n{'='*60}")
         print("HTML REPORT GENERATED")
@@ -626,4 +1314,5 @@ class TestReportGenerator:
 if __name__ == "__main__":
     generator = TestReportGenerator()
     generator.run_all_tests()
+    generator.save_history()
     generator.generate_html_report()
\ No newline at end of file
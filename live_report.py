@@ -0,0 +1,256 @@
+"""
+Live Report for Parabank Selenium Tests
+While a run is going, live_report.html shows its progress: a static page that polls
+live_status.json every few seconds. The status file is rewritten after each finished
+test from the result records (test_results.jsonl), with the number of tests finished,
+passed and failed out of the planned total, an ETA and the failures so far.
+
+The status file is replaced atomically (written to a temp file in the same directory,
+then renamed over the old one), so the page never reads half a file. Because it is built
+from the shared records file, work_queue's worker processes all keep it current.
+
+The page needs to be served over HTTP (Jenkins publishHTML, or python -m http.server);
+browsers block fetch() from file:// pages.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from result_records import RESULTS_PATH
+
+STATUS_PATH = os.environ.get("PARABANK_LIVE_STATUS", "live_status.json")
+LIVE_REPORT_PATH = "live_report.html"
+POLL_SECONDS = 5
+
+LIVE_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Parabank Test Run (live)</title>
+    <style>
+        body { font-family: sans-serif; background: #0a0e17; color: #e2e8f0; margin: 0; padding: 2rem; }
+        h1 { color: #00f0ff; letter-spacing: 2px; font-size: 1.6rem; }
+        .summary { display: flex; gap: 2rem; margin: 1.5rem 0; font-size: 1.2rem; }
+        .summary b { display: block; font-size: 2rem; }
+        .passed { color: #00ff88; }
+        .failed { color: #ff3366; }
+        .muted { color: #94a3b8; }
+        .progress { height: 12px; background: #1a2332; border-radius: 6px; overflow: hidden; }
+        .progress div { height: 100%; background: #00f0ff; transition: width 0.5s; }
+        table { width: 100%; border-collapse: collapse; margin-top: 1.5rem; }
+        th, td { text-align: left; padding: 0.5rem; border-bottom: 1px solid #2d3748; vertical-align: top; }
+        th { color: #94a3b8; font-weight: normal; text-transform: uppercase; font-size: 0.8rem; }
+        a { color: #00f0ff; }
+    </style>
+</head>
+<body>
+    <h1>PARABANK TEST RUN</h1>
+    <p id="state" class="muted">Waiting for the first status update...</p>
+    <div class="progress"><div id="bar" style="width: 0%"></div></div>
+    <div class="summary">
+        <div>Finished<b id="finished">0</b></div>
+        <div class="passed">Passed<b id="passed">0</b></div>
+        <div class="failed">Failed<b id="failed">0</b></div>
+        <div class="muted">ETA<b id="eta">-</b></div>
+    </div>
+    <h2>Failures so far</h2>
+    <table>
+        <thead><tr><th>Test</th><th>Suite</th><th>Status</th><th>Message</th><th>Finished</th></tr></thead>
+        <tbody id="failures"></tbody>
+    </table>
+    <script>
+        const POLL_MS = __POLL_MS__;
+        const cell = text => {
+            const td = document.createElement('td');
+            td.textContent = text == null ? '' : text;
+            return td;
+        };
+        const duration = seconds => seconds == null ? '-'
+            : seconds >= 60 ? Math.floor(seconds / 60) + 'm ' + Math.round(seconds % 60) + 's'
+            : Math.round(seconds) + 's';
+
+        function render(status) {
+            const planned = status.planned || status.finished;
+            document.getElementById('bar').style.width = (planned ? 100 * status.finished / planned : 0) + '%';
+            document.getElementById('finished').textContent = status.finished + (status.planned ? ' / ' + status.planned : '');
+            document.getElementById('passed').textContent = status.passed;
+            document.getElementById('failed').textContent = status.failed;
+            document.getElementById('eta').textContent = status.state === 'finished' ? 'done' : duration(status.eta_seconds);
+            const state = document.getElementById('state');
+            state.textContent = (status.state === 'finished' ? 'Finished' : 'Running') + ' - started ' + status.started_at
+                + ', updated ' + status.updated_at + ', elapsed ' + duration(status.elapsed_seconds);
+            if (status.state === 'finished') {
+                const link = document.createElement('a');
+                link.href = 'test_report.html';
+                link.textContent = 'Full report';
+                state.append(' - ', link);
+            }
+            const rows = status.failures.map(failure => {
+                const tr = document.createElement('tr');
+                tr.append(cell(failure.tc_id ? failure.tc_id + ': ' + failure.title : failure.test_id),
+                          cell(failure.suite), cell(failure.status), cell(failure.message), cell(failure.finished_at));
+                return tr;
+            });
+            document.getElementById('failures').replaceChildren(...rows);
+        }
+
+        async function poll() {
+            try {
+                const response = await fetch('__STATUS_FILE__?t=' + Date.now(), {cache: 'no-store'});
+                if (response.ok) {
+                    const status = await response.json();
+                    render(status);
+                    if (status.state === 'finished') return;
+                }
+            } catch (e) {
+                // not written yet, or the server is busy; try again on the next tick
+            }
+            setTimeout(poll, POLL_MS);
+        }
+        poll();
+    </script>
+</body>
+</html>
+"""
+
+
+def write_atomic(path, text):
+    """Replace path with text so readers see either the old or the new file, never a partial one"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".live-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        # mkstemp creates 0600 files; the web server or Jenkins user serving the page must be able to read it
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def read_status(status_path=STATUS_PATH):
+    if not os.path.exists(status_path):
+        return None
+    with open(status_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+class LiveReport:
+    """Test listener that rewrites the live status file after every finished test"""
+
+    def __init__(self, status_path=STATUS_PATH, page_path=LIVE_REPORT_PATH, results_path=RESULTS_PATH):
+        self.status_path = status_path
+        self.page_path = page_path
+        self.results_path = results_path
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.planned = None
+        self.started = None
+        self.offset = 0
+        self.finished = 0
+        self.passed = 0
+        self.failures = []
+
+    def start_run(self, planned):
+        """Write the page and an empty status; called by the runners once the tests are known"""
+        with self.lock:
+            self.reset()
+            self.planned = planned
+            self.started = time.time()
+            page = LIVE_PAGE.replace("__POLL_MS__", str(POLL_SECONDS * 1000))
+            page = page.replace("__STATUS_FILE__", os.path.basename(self.status_path))
+            write_atomic(self.page_path, page)
+            self.write_status("running")
+        print(f"[LIVE] Progress of {planned} test(s) at {self.page_path}")
+
+    def finish(self):
+        with self.lock:
+            if self.started is None:
+                return  # no run was started in this process (e.g. a report rebuilt from saved records)
+            self.read_new_records()
+            self.write_status("finished")
+
+    def test_started(self, test_id):
+        pass
+
+    def driver_created(self, test_id, driver):
+        pass
+
+    def test_finished(self, test_id, status):
+        # listeners run in order, so the result recorder has already appended this test's record
+        self.refresh()
+
+    def refresh(self):
+        """Fold in new records and rewrite the status; work_queue calls this once a held record is written"""
+        with self.lock:
+            if self.started is None:
+                self.adopt_run()
+            self.read_new_records()
+            self.write_status("running")
+
+    def adopt_run(self):
+        """In a work_queue worker process: take the planned count and start time from the runner's status"""
+        status = None
+        try:
+            status = read_status(self.status_path)
+        except (OSError, ValueError):
+            pass
+        if status:
+            self.planned = status.get("planned")
+            self.started = status.get("started_epoch")
+        if self.started is None:
+            self.started = time.time()
+
+    def read_new_records(self):
+        """Fold in the records appended since the last call (the file only grows during a run)"""
+        if not os.path.exists(self.results_path):
+            return
+        with open(self.results_path, encoding="utf-8") as f:
+            f.seek(self.offset)
+            while True:
+                line = f.readline()
+                if not line.endswith("\n"):
+                    break  # another process is mid-append; pick the line up next time
+                self.offset = f.tell()
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                self.finished += 1
+                if record["status"] == "passed":
+                    self.passed += 1
+                else:
+                    self.failures.append({key: record.get(key) for key in
+                                          ("test_id", "suite", "tc_id", "title", "status", "message", "finished_at")})
+
+    def write_status(self, state):
+        now = time.time()
+        elapsed = now - self.started
+        eta = None
+        if self.planned and self.finished and state == "running":
+            eta = round(elapsed / self.finished * max(self.planned - self.finished, 0), 1)
+        status = {
+            "state": state,
+            "planned": self.planned,
+            "finished": self.finished,
+            "passed": self.passed,
+            "failed": self.finished - self.passed,
+            "started_at": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "started_epoch": self.started,
+            "updated_at": datetime.fromtimestamp(now).isoformat(timespec="seconds"),
+            "elapsed_seconds": round(elapsed, 1),
+            "eta_seconds": eta,
+            "failures": self.failures,
+        }
+        write_atomic(self.status_path, json.dumps(status, indent=1))
+
+
+live_report = LiveReport()
@@ -0,0 +1,285 @@
+"""
+Locator Cost Profiler for Parabank Selenium Tests
+Times every element lookup (findElement/findElements, including the polling inside
+WebDriverWait) per distinct locator and ranks the locators by total time at the end of
+the run, with a cheaper equivalent for each XPath where one exists:
+
+  * a CSS selector, when the XPath only uses tags, attributes and positions
+    (//a[contains(@href, 'activity.htm')] -> a[href*='activity.htm'])
+  * otherwise the found element's ID or name, checked to be unique on the page
+    (//*[contains(text(), 'Welcome ...')] has no CSS form, but the element may have an ID)
+
+Set PARABANK_LOCATOR_PROFILE=1 to profile; =apply also sends the CSS translations
+instead of the XPaths. Page-derived suggestions are only reported, never applied.
+The ranking is printed at exit and written to locator_profile.json.
+
+A lookup that returns an error or an empty list counts as a miss; misses of an applied
+CSS translation are flagged in the ranking. `python locator_profile.py` checks the miss
+counting against a fake driver (no browser needed).
+"""
+
+import atexit
+import json
+import os
+import re
+import threading
+import time
+
+from selenium.webdriver.remote.command import Command
+
+PROFILE_PATH = "locator_profile.json"
+FIND_COMMANDS = {Command.FIND_ELEMENT, Command.FIND_ELEMENTS, Command.FIND_CHILD_ELEMENT, Command.FIND_CHILD_ELEMENTS}
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+STEP_PATTERN = re.compile(r"^(\*|[A-Za-z][\w-]*)((?:\[[^\[\]]+\])*)$")
+PREDICATE_PATTERN = re.compile(r"\[([^\[\]]+)\]")
+CSS_IDENT = re.compile(r"^[A-Za-z_][\w-]*$")
+
+SUGGEST_SCRIPT = """
+const el = arguments[0];
+const unique = selector => document.querySelectorAll(selector).length === 1;
+if (el.id && unique('#' + CSS.escape(el.id))) return '#' + CSS.escape(el.id);
+const name = el.getAttribute('name');
+if (name) {
+    const selector = el.tagName.toLowerCase() + '[name="' + name.replace(/"/g, '\\\\"') + '"]';
+    if (unique(selector)) return selector;
+}
+return null;
+"""
+
+
+def css_string(value):
+    """value as a single-quoted CSS string"""
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def predicate_to_css(predicate, tag):
+    """One XPath predicate as CSS, or None when CSS cannot express it"""
+    predicate = predicate.strip()
+    if predicate.isdigit():
+        return f":nth-of-type({predicate})" if tag != "*" else None
+    # the value may not contain its own quote character, so "@a='x' and @b='y'" is not taken as one string
+    match = re.match(r"^@([\w-]+)\s*=\s*(['\"])((?:(?!\2).)*)\2$", predicate)
+    if match:
+        name, value = match.group(1), match.group(3)
+        if name == "id" and CSS_IDENT.match(value):
+            return f"#{value}"
+        return f"[{name}={css_string(value)}]"
+    for function, operator in (("contains", "*="), ("starts-with", "^=")):
+        match = re.match(rf"^{function}\(\s*@([\w-]+)\s*,\s*(['\"])((?:(?!\2).)*)\2\s*\)$", predicate)
+        if match:
+            return f"[{match.group(1)}{operator}{css_string(match.group(3))}]"
+    return None
+
+
+def xpath_to_css(xpath):
+    """Equivalent CSS selector for a tag/attribute/position-only XPath, else None"""
+    alternatives = [part.strip() for part in xpath.split("|")]
+    if len(alternatives) > 1:
+        converted = [xpath_to_css(part) for part in alternatives]
+        return ", ".join(converted) if all(converted) else None
+
+    if not xpath.startswith("//"):
+        return None
+    parts = []
+    for separator, step in re.findall(r"(//|/)([^/]+)", xpath):
+        match = STEP_PATTERN.match(step)
+        if not match:
+            return None
+        tag, predicates = match.group(1), match.group(2)
+        css = "" if tag == "*" else tag
+        filtered = False
+        for predicate in PREDICATE_PATTERN.findall(predicates):
+            converted = predicate_to_css(predicate, tag)
+            # tr[@class='x'][1] counts only matching rows; :nth-of-type counts all of them
+            if converted is None or (filtered and converted.startswith(":nth")):
+                return None
+            filtered = filtered or not converted.startswith(":nth")
+            css += converted
+        if parts:
+            parts.append(" " if separator == "//" else " > ")
+        parts.append(css or "*")
+    return "".join(parts)
+
+
+class LocatorStats:
+    def __init__(self, using, value):
+        self.using = using
+        self.value = value
+        self.calls = 0
+        self.misses = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.css = xpath_to_css(value) if using == "xpath" else None
+        self.page_suggestion = None
+        self.suggested = False
+        self.css_misses = 0
+
+    def as_dict(self):
+        return {
+            "using": self.using,
+            "locator": self.value,
+            "calls": self.calls,
+            "misses": self.misses,
+            "total_ms": round(self.seconds * 1000, 1),
+            "avg_ms": round(self.seconds / self.calls * 1000, 1) if self.calls else 0,
+            "max_ms": round(self.max_seconds * 1000, 1),
+            "css": self.css,
+            "page_suggestion": self.page_suggestion,
+            "css_misses": self.css_misses,
+        }
+
+
+def is_miss(response):
+    """True when a find response is an error (Selenium 4 returns these instead of raising) or found nothing"""
+    if not isinstance(response, dict):
+        return False
+    value = response.get("value")
+    if response.get("status", 0) >= 400 or (isinstance(value, dict) and "error" in value):
+        return True
+    return value == []
+
+
+class LocatorProfiler:
+    """Test listener that times each distinct locator across the whole run"""
+
+    def __init__(self, enabled=False, apply_css=False, profile_path=PROFILE_PATH):
+        self.enabled = enabled
+        self.apply_css = apply_css
+        self.profile_path = profile_path
+        self.lock = threading.Lock()
+        self.stats = {}
+
+    def test_started(self, test_id):
+        pass
+
+    def test_finished(self, test_id, status):
+        pass
+
+    def driver_created(self, test_id, driver):
+        if not self.enabled:
+            return
+        executor = driver.command_executor
+        if getattr(executor, "profiled_by_locator_profiler", False):
+            return
+        execute = executor.execute
+
+        def profiled_execute(command, params):
+            if command not in FIND_COMMANDS or not params or "using" not in params:
+                return execute(command, params)
+            stats = self.stats_for(params["using"], params["value"])
+            sent = params
+            applied = self.apply_css and stats.css
+            if applied:
+                sent = dict(params, using="css selector", value=stats.css)
+            start = time.perf_counter()
+            try:
+                response = execute(command, sent)
+            except Exception:
+                self.record(stats, time.perf_counter() - start, missed=True, applied=applied)
+                raise
+            missed = is_miss(response)
+            self.record(stats, time.perf_counter() - start, missed=missed, applied=applied)
+            if not missed and stats.using == "xpath" and not stats.css and not stats.suggested:
+                stats.suggested = True
+                stats.page_suggestion = self.suggest(execute, params, response)
+            return response
+
+        executor.execute = profiled_execute
+        executor.profiled_by_locator_profiler = True
+
+    def stats_for(self, using, value):
+        with self.lock:
+            key = (using, value)
+            if key not in self.stats:
+                self.stats[key] = LocatorStats(using, value)
+            return self.stats[key]
+
+    def record(self, stats, seconds, missed, applied=False):
+        with self.lock:
+            stats.calls += 1
+            stats.misses += missed
+            stats.css_misses += missed and bool(applied)
+            stats.seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+
+    def suggest(self, execute, params, response):
+        """Ask the page for a unique ID/name selector of the first element found (one extra call)"""
+        value = response.get("value") if isinstance(response, dict) else None
+        element = value[0] if isinstance(value, list) and value else value
+        if not isinstance(element, dict) or ELEMENT_KEY not in element:
+            return None
+        try:
+            result = execute(Command.W3C_EXECUTE_SCRIPT, {
+                "script": SUGGEST_SCRIPT, "args": [element], "sessionId": params.get("sessionId")})
+            return result.get("value")
+        except Exception:
+            return None
+
+    def ranking(self):
+        with self.lock:
+            return sorted((stats.as_dict() for stats in self.stats.values()), key=lambda entry: -entry["total_ms"])
+
+    def report(self, top=15):
+        """Print the costliest locators with their suggestions and write the full ranking"""
+        if not self.enabled or not self.stats:
+            return None
+        ranking = self.ranking()
+        with open(self.profile_path, "w", encoding="utf-8") as f:
+            json.dump(ranking, f, indent=2)
+
+        print("\n" + "="*60)
+        print("LOCATOR COST PROFILE" + (" (CSS translations applied)" if self.apply_css else ""))
+        print("="*60)
+        for entry in ranking[:top]:
+            print(f"{entry['total_ms']:>9.0f} ms  {entry['calls']:>4}x  {entry['misses']:>3} miss  "
+                  f"{entry['using']}={entry['locator']}")
+            suggestion = entry["css"] or entry["page_suggestion"]
+            if suggestion:
+                kind = "CSS" if entry["css"] else "page"
+                print(f"{'':>24}[{kind}] -> {suggestion}")
+            if entry["css_misses"]:
+                print(f"{'':>24}[CSS] {entry['css_misses']} miss(es) with the translation applied - check it")
+        print(f"Full ranking: {self.profile_path}")
+        print("="*60)
+        return ranking
+
+
+locator_profiler = LocatorProfiler(
+    enabled=os.environ.get("PARABANK_LOCATOR_PROFILE") in ("1", "apply"),
+    apply_css=os.environ.get("PARABANK_LOCATOR_PROFILE") == "apply",
+)
+atexit.register(locator_profiler.report)
+
+
+def check_miss_counting():
+    """Run a found and a missing locator through a fake driver and check the counts"""
+
+    class FakeExecutor:
+        def execute(self, command, params):
+            if command == Command.W3C_EXECUTE_SCRIPT:
+                return {"status": 0, "value": "#found"}
+            if params["value"] == "//input[@id='missing']":
+                return {"status": 404, "value": {"error": "no such element", "message": "not found"}}
+            return {"status": 0, "value": {ELEMENT_KEY: "e1"}}
+
+    class FakeDriver:
+        command_executor = FakeExecutor()
+
+    profiler = LocatorProfiler(enabled=True)
+    driver = FakeDriver()
+    profiler.driver_created("check", driver)
+    execute = driver.command_executor.execute
+    for value in ("//input[@id='missing']", "//*[text()='found']", "//input[@id='missing']"):
+        execute(Command.FIND_ELEMENT, {"using": "xpath", "value": value})
+
+    missing = profiler.stats[("xpath", "//input[@id='missing']")]
+    found = profiler.stats[("xpath", "//*[text()='found']")]
+    assert (missing.calls, missing.misses) == (2, 2), (missing.calls, missing.misses)
+    assert not missing.suggested and missing.page_suggestion is None
+    assert (found.calls, found.misses, found.page_suggestion) == (1, 0, "#found")
+    print("[PASS] Missing locators are counted as misses and get no suggestion")
+
+
+if __name__ == "__main__":
+    check_miss_counting()
@@ -0,0 +1,133 @@
+"""
+Page Snapshot Cache for Parabank Selenium Tests
+Fetches the page source, visible text, URL and title in one WebDriver call and reuses
+them for every assertion on the same page state. The snapshot is dropped as soon as the
+test sends a command that can change the page (navigation, click, typing, scripts, ...).
+
+page_state() is the uncached variant for verdicts that only need what the user sees: visible
+text, title, URL, the .error messages, the internal-error flag and a few elements by ID,
+returned as one JSON object from a single execute_script call.
+
+Usage:
+    page = page_snapshot(driver)
+    if "welcome" in page.source_lower or "created" in page.text_lower: ...
+
+    state = page_state(driver, ["rightPanel", "transactionTable"])
+    if state["internal_error"] or state["errors"]: ...
+"""
+
+import threading
+from functools import cached_property
+
+from selenium.webdriver.remote.command import Command
+
+from phase_timing import phase
+
+# Commands that only read state; anything else invalidates the snapshot
+READ_ONLY_COMMANDS = {
+    Command.GET_PAGE_SOURCE,
+    Command.GET_TITLE,
+    Command.GET_CURRENT_URL,
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+    Command.GET_ELEMENT_TEXT,
+    Command.GET_ELEMENT_ATTRIBUTE,
+    Command.GET_ELEMENT_PROPERTY,
+    Command.GET_ELEMENT_TAG_NAME,
+    Command.GET_ELEMENT_RECT,
+    Command.GET_ELEMENT_VALUE_OF_CSS_PROPERTY,
+    Command.IS_ELEMENT_ENABLED,
+    Command.IS_ELEMENT_SELECTED,
+    Command.SCREENSHOT,
+    Command.ELEMENT_SCREENSHOT,
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE,
+    Command.W3C_GET_WINDOW_HANDLES,
+    Command.GET_WINDOW_RECT,
+    Command.GET_ALL_COOKIES,
+    Command.GET_COOKIE,
+    Command.GET_TIMEOUTS,
+}
+
+SNAPSHOT_SCRIPT = """
+return {
+    source: new XMLSerializer().serializeToString(document),
+    text: document.body ? document.body.innerText : '',
+    url: location.href,
+    title: document.title
+};
+"""
+
+PAGE_STATE_SCRIPT = """
+const visible = el => !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+const text = document.body ? document.body.innerText : '';
+const elements = {};
+for (const id of arguments[0]) {
+    const el = document.getElementById(id);
+    elements[id] = el ? {displayed: visible(el), text: el.innerText, value: el.value === undefined ? null : el.value} : null;
+}
+return {
+    text: text,
+    title: document.title,
+    url: location.href,
+    errors: Array.from(document.querySelectorAll('.error')).filter(visible)
+        .map(el => el.innerText.trim()).filter(message => message),
+    internal_error: text.toLowerCase().includes('an internal error has occurred'),
+    elements: elements
+};
+"""
+
+
+class PageSnapshot:
+    """Page state captured at one moment; the lowercase views are computed on first use"""
+
+    def __init__(self, source, text, url, title):
+        self.source = source
+        self.text = text
+        self.url = url
+        self.title = title
+
+    @cached_property
+    def source_lower(self):
+        return self.source.lower()
+
+    @cached_property
+    def text_lower(self):
+        return self.text.lower()
+
+
+def track_interactions(driver):
+    """Shadow driver.execute so page-changing commands drop the cached snapshot"""
+    # one cache per thread: window_pool drives a different window from each thread
+    cache = threading.local()
+    execute = driver.execute
+
+    def tracking_execute(driver_command, params=None):
+        if driver_command not in READ_ONLY_COMMANDS:
+            cache.snapshot = None
+        return execute(driver_command, params)
+
+    driver.execute = tracking_execute
+    driver.snapshot_cache = cache
+    return cache
+
+
+def page_snapshot(driver):
+    """Current page state, fetched once per navigation or interaction"""
+    cache = getattr(driver, "snapshot_cache", None)
+    if cache is None:
+        cache = track_interactions(driver)
+    snapshot = getattr(cache, "snapshot", None)
+    if snapshot is None:
+        with phase("verdict"):
+            state = driver.execute_script(SNAPSHOT_SCRIPT)
+        snapshot = PageSnapshot(state["source"], state["text"], state["url"], state["title"])
+        cache.snapshot = snapshot
+    return snapshot
+
+
+def page_state(driver, element_ids=()):
+    """What the user sees, in one round trip; elements maps each ID to its state or None if absent"""
+    with phase("verdict"):
+        return driver.execute_script(PAGE_STATE_SCRIPT, list(element_ids))
@@ -0,0 +1,204 @@
+"""
+Page Objects for Parabank Selenium Tests
+One place for the locators the suites share. Elements are declared as Locator class
+attributes, looked up on first use and cached for the lifetime of the page object, so a
+page never looks up the same element twice; a cached handle that has gone stale (the DOM
+was re-rendered) is looked up again and the call retried once.
+
+Usage:
+    LoginPanel(driver, wait).log_in("john", "demo")
+
+    page = TransferPage(driver, wait)
+    page.amount.send_keys("100")
+    page.transfer_button.click()
+"""
+
+import os
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+
+from form_filler import fill_form
+from phase_timing import phase
+
+# PARABANK_BASE_URL points every suite at another Parabank, e.g. http://localhost:8080/parabank
+BASE_URL = os.environ.get("PARABANK_BASE_URL", "https://parabank.parasoft.com/parabank").rstrip("/")
+HOME_URL = f"{BASE_URL}/index.htm"
+
+
+class Locator:
+    """Declares how to find one element of a page; wait=True waits for it on first use"""
+
+    def __init__(self, by, value, wait=False):
+        self.by = by
+        self.value = value
+        self.wait = wait
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    @property
+    def target(self):
+        """(by, value), for expected_conditions"""
+        return (self.by, self.value)
+
+    def __get__(self, page, owner):
+        if page is None:
+            return self
+        element = page.elements.get(self.name)
+        if element is None:
+            element = CachedElement(page, self)
+            page.elements[self.name] = element
+        return element
+
+
+class CachedElement:
+    """Lazy stand-in for a WebElement: found on first use, found again only if it went stale"""
+
+    def __init__(self, page, locator):
+        self.page = page
+        self.locator = locator
+        self.element = None
+
+    def resolve(self):
+        """The underlying WebElement (pass this to execute_script)"""
+        if self.element is None:
+            target = self.locator.target
+            if self.locator.wait and self.page.wait is not None:
+                self.element = self.page.wait.until(EC.presence_of_element_located(target))
+            else:
+                self.element = self.page.driver.find_element(*target)
+        return self.element
+
+    def __getattr__(self, name):
+        try:
+            value = getattr(self.resolve(), name)
+        except StaleElementReferenceException:
+            self.element = None
+            value = getattr(self.resolve(), name)
+        if not callable(value):
+            return value
+
+        def call(*args, **kwargs):
+            try:
+                return value(*args, **kwargs)
+            except StaleElementReferenceException:
+                self.element = None
+                return getattr(self.resolve(), name)(*args, **kwargs)
+
+        return call
+
+
+class BasePage:
+    """A page's element handles live as long as the page object; open() starts afresh"""
+
+    url = None
+
+    def __init__(self, driver, wait=None):
+        self.driver = driver
+        self.wait = wait
+        self.elements = {}
+
+    def open(self):
+        self.driver.get(self.url)
+        self.elements = {}
+        return self
+
+
+class LoginPanel(BasePage):
+    url = HOME_URL
+
+    username = Locator(By.NAME, "username", wait=True)
+    password = Locator(By.NAME, "password")
+    login_button = Locator(By.XPATH, "//input[@value='Log In']")
+
+    def log_in(self, username, password):
+        with phase("login"):
+            self.username.send_keys(username)
+            self.password.send_keys(password)
+            self.login_button.click()
+
+
+class CustomerForm(BasePage):
+    """The customer fields shared by the register and update-profile forms"""
+
+    first_name = Locator(By.ID, "customer.firstName")
+    last_name = Locator(By.ID, "customer.lastName")
+    street = Locator(By.ID, "customer.address.street")
+    city = Locator(By.ID, "customer.address.city")
+    state = Locator(By.ID, "customer.address.state")
+    zip_code = Locator(By.ID, "customer.address.zipCode")
+    phone = Locator(By.ID, "customer.phoneNumber")
+
+    def fill(self, typing=False, **values):
+        """Set the named fields in one go, e.g. fill(first_name="John", zip_code="10001")"""
+        fields = {getattr(type(self), name).value: value for name, value in values.items()}
+        fill_form(self.driver, fields, typing)
+
+
+class RegisterPage(CustomerForm):
+    url = f"{BASE_URL}/register.htm"
+
+    ssn = Locator(By.ID, "customer.ssn")
+    username = Locator(By.ID, "customer.username")
+    password = Locator(By.ID, "customer.password")
+    repeated_password = Locator(By.ID, "repeatedPassword")
+    register_button = Locator(By.XPATH, "//input[@value='Register']")
+
+
+class BillPayPage(BasePage):
+    url = f"{BASE_URL}/billpay.htm"
+
+    payee_name = Locator(By.NAME, "payee.name")
+    street = Locator(By.NAME, "payee.address.street")
+    city = Locator(By.NAME, "payee.address.city")
+    state = Locator(By.NAME, "payee.address.state")
+    zip_code = Locator(By.NAME, "payee.address.zipCode")
+    phone = Locator(By.NAME, "payee.phoneNumber")
+    account = Locator(By.NAME, "payee.accountNumber")
+    verify_account = Locator(By.NAME, "verifyAccount")
+    amount = Locator(By.NAME, "amount")
+    send_button = Locator(By.XPATH, "//input[@value='Send Payment']")
+
+    def fill(self, **values):
+        """Type into the named fields, e.g. fill(payee_name="Electric Company", amount="50")"""
+        with phase("form_fill"):
+            for name, value in values.items():
+                getattr(self, name).send_keys(value)
+
+
+class TransferPage(BasePage):
+    url = f"{BASE_URL}/transfer.htm"
+
+    amount = Locator(By.ID, "amount", wait=True)
+    from_account = Locator(By.ID, "fromAccountId")
+    to_account = Locator(By.ID, "toAccountId")
+    transfer_button = Locator(By.XPATH, "//input[@value='Transfer']")
+
+
+class FindTransactionsPage(BasePage):
+    url = f"{BASE_URL}/findtrans.htm"
+
+    transaction_id = Locator(By.ID, "transactionId")
+    transaction_date = Locator(By.ID, "transactionDate")
+    amount = Locator(By.ID, "amount")
+    find_by_id_button = Locator(By.XPATH, "//button[@id='findById']")
+    find_by_date_button = Locator(By.XPATH, "//button[@id='findByDate']")
+    find_by_amount_button = Locator(By.XPATH, "//button[@id='findByAmount']")
+
+
+class RequestLoanPage(BasePage):
+    url = f"{BASE_URL}/requestloan.htm"
+
+    amount = Locator(By.ID, "amount")
+    down_payment = Locator(By.ID, "downPayment")
+    from_account = Locator(By.ID, "fromAccountId")
+    apply_button = Locator(By.XPATH, "//input[@value='Apply Now']")
+
+
+class UpdateProfilePage(CustomerForm):
+    url = f"{BASE_URL}/updateprofile.htm"
+
+    update_button = Locator(By.XPATH, "//input[@value='Update Profile']")
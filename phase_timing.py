@@ -0,0 +1,184 @@
+"""
+Per-Test Phase Timing for Parabank Selenium Tests
+Splits each test's wall-clock time into phases and keeps the spans in order, so the HTML
+report can draw a waterfall of where the time went:
+
+    driver      creating the browser (create_driver)
+    login       the suites' login() helpers and LoginPanel.log_in, including their waits
+    navigation  driver.get, back, forward, refresh
+    form_fill   fill_form and BillPayPage.fill
+    wait        pause() and the test's WebDriverWait.until/until_not
+    verdict     reading the page to decide pass/fail (page_source, page_snapshot, page_state)
+    screenshot  taking screenshots
+    teardown    driver.quit / close
+    interaction other WebDriver commands (finding, clicking, typing)
+    other       time outside any of the above (test code, prints)
+
+Helpers mark their phase with `with phase("login"):`; WebDriver commands sent outside a marked
+phase are classified by command. The outermost phase wins, so the waits inside log_in
+count as login. Set PARABANK_PHASE_TIMING=0 to switch it off.
+
+Nothing global is patched: the suites sleep through pause(), and the WebDriverWait handed
+out by the instrumented create_driver is wrapped by the timer, so other threads (screenshot
+writer, work-queue heartbeat) and other code using time.sleep or Selenium are untouched.
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+from selenium.webdriver.remote.command import Command
+
+PHASES = ["driver", "login", "navigation", "form_fill", "wait", "verdict", "screenshot", "teardown",
+          "interaction", "other"]
+COMMAND_PHASES = {
+    Command.GET: "navigation",
+    Command.GO_BACK: "navigation",
+    Command.GO_FORWARD: "navigation",
+    Command.REFRESH: "navigation",
+    Command.QUIT: "teardown",
+    Command.CLOSE: "teardown",
+    Command.SCREENSHOT: "screenshot",
+    Command.ELEMENT_SCREENSHOT: "screenshot",
+    Command.GET_PAGE_SOURCE: "verdict",
+}
+# back-to-back spans of one phase closer than this are drawn as one bar
+MERGE_GAP = 0.05
+# spans kept per test for the waterfall; later ones still count in the phase totals
+MAX_SPANS = 300
+
+local = threading.local()
+
+
+class Timeline:
+    """Ordered phase spans of one test, as offsets from its start"""
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.end = None
+        self.depth = 0
+        self.spans = []
+        self.totals = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, name, start, end):
+        start, end = start - self.start, end - self.start
+        self.totals[name] += end - start
+        last = self.spans[-1] if self.spans else None
+        if last and last[0] == name and start - last[2] < MERGE_GAP:
+            last[2] = end
+        elif len(self.spans) < MAX_SPANS:
+            self.spans.append([name, start, end])
+
+    def as_dict(self):
+        duration = (self.end or time.perf_counter()) - self.start
+        totals = dict(self.totals)
+        totals["other"] = max(duration - sum(totals.values()), 0.0)
+        return {
+            "duration": round(duration, 3),
+            "totals": {name: round(seconds, 3) for name, seconds in totals.items() if round(seconds, 3)},
+            "spans": [[name, round(start, 3), round(end - start, 3)] for name, start, end in self.spans],
+        }
+
+
+@contextmanager
+def phase(name):
+    """Attribute the time spent in the block to a phase of the running test (no-op outside a test)"""
+    timeline = getattr(local, "timeline", None)
+    if timeline is None or timeline.depth:
+        if timeline is not None:
+            timeline.depth += 1
+        try:
+            yield
+        finally:
+            if timeline is not None:
+                timeline.depth -= 1
+        return
+
+    timeline.depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timeline.depth -= 1
+        timeline.add(name, start, time.perf_counter())
+
+
+def timed(name, function):
+    def run(*args, **kwargs):
+        with phase(name):
+            return function(*args, **kwargs)
+
+    run.timed_phase = name
+    return run
+
+
+def pause(seconds):
+    """time.sleep that counts as the wait phase of the running test"""
+    with phase("wait"):
+        time.sleep(seconds)
+
+
+class TimedWait:
+    """A test's WebDriverWait whose until/until_not count as the wait phase"""
+
+    def __init__(self, wait):
+        self.wait = wait
+        self.until = timed("wait", wait.until)
+        self.until_not = timed("wait", wait.until_not)
+
+    def __getattr__(self, name):
+        return getattr(self.wait, name)
+
+
+class PhaseTimer:
+    """Test listener that records each test's phase timeline"""
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.lock = threading.Lock()
+        self.results = {}
+
+    def wrap_wait(self, wait):
+        """The wait to hand to the test: timed when the timer is on"""
+        if not self.enabled or wait is None or isinstance(wait, TimedWait):
+            return wait
+        return TimedWait(wait)
+
+    def test_started(self, test_id):
+        local.timeline = Timeline() if self.enabled else None
+
+    def driver_created(self, test_id, driver):
+        if not self.enabled:
+            return
+        executor = driver.command_executor
+        if getattr(executor, "timed_by_phase_timer", False):
+            return
+        execute = executor.execute
+
+        def phased_execute(command, params):
+            with phase(COMMAND_PHASES.get(command, "interaction")):
+                return execute(command, params)
+
+        executor.execute = phased_execute
+        executor.timed_by_phase_timer = True
+
+    def test_finished(self, test_id, status):
+        timeline = getattr(local, "timeline", None)
+        local.timeline = None
+        if timeline is None:
+            return
+        timeline.end = time.perf_counter()
+        result = timeline.as_dict()
+        with self.lock:
+            self.results[test_id] = result
+        top = sorted(result["totals"].items(), key=lambda item: -item[1])[:4]
+        print(f"    [PHASES] {result['duration']:.1f}s | " + ", ".join(f"{name} {seconds:.1f}s" for name, seconds in top))
+
+    def summary(self):
+        """Per-test timelines as plain dicts, in test order"""
+        with self.lock:
+            return dict(self.results)
+
+
+phase_timer = PhaseTimer(enabled=os.environ.get("PARABANK_PHASE_TIMING") != "0")
@@ -0,0 +1,106 @@
+"""
+Report Fonts for the Parabank HTML Report
+Builds @font-face rules with the report's fonts embedded as data: URLs, so an offline
+report (PARABANK_REPORT_OFFLINE=1) makes no request to fonts.googleapis.com.
+
+Put the font files in fonts/ (PARABANK_FONT_DIR), named after the family as Google Fonts
+ships them: Orbitron[wght].ttf, Rajdhani-Regular.ttf ... Rajdhani-Bold.ttf,
+JetBrainsMono[wght].ttf. With fontTools (pip install fonttools brotli) each file is cut down
+to the characters the report uses, which takes a family from hundreds of KB to a few
+dozen; without it the whole file is embedded. A family without files falls back to the
+system fonts listed after it in the report's font stacks.
+"""
+
+import base64
+import glob
+import io
+import os
+import re
+
+try:
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+except ImportError:
+    subset = None
+    TTFont = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+FONT_DIR = os.environ.get("PARABANK_FONT_DIR", "fonts")
+FAMILIES = {
+    "Orbitron": "Orbitron",
+    "Rajdhani": "Rajdhani",
+    "JetBrains Mono": "JetBrainsMono",
+}
+FONT_EXTENSIONS = (".woff2", ".woff", ".ttf", ".otf")
+WEIGHTS = {
+    "thin": 100, "extralight": 200, "light": 300, "regular": 400, "medium": 500,
+    "semibold": 600, "bold": 700, "extrabold": 800, "black": 900,
+}
+# always kept, so records and messages that only reach the page as JSON still render in the font
+BASE_CHARACTERS = "".join(chr(code) for code in range(0x20, 0x7F)) + "\u00a0\u2013\u2014\u2018\u2019\u201c\u201d\u2026\u2022"
+FORMATS = {".woff2": ("font/woff2", "woff2"), ".woff": ("font/woff", "woff"),
+           ".ttf": ("font/ttf", "truetype"), ".otf": ("font/otf", "opentype")}
+
+
+def font_files(family, font_dir=FONT_DIR):
+    """(path, weight) for each file of a family; weight is "100 900" for a variable font"""
+    prefix = FAMILIES[family]
+    files = []
+    for path in sorted(glob.glob(os.path.join(font_dir, prefix + "*"))):
+        name, ext = os.path.splitext(os.path.basename(path))
+        if ext.lower() not in FONT_EXTENSIONS or "italic" in name.lower():
+            continue
+        if "[" in name:
+            weight = "100 900"
+        else:
+            style = re.sub(r"[^a-z]", "", name[len(prefix):].lower())
+            weight = str(WEIGHTS.get(style, 400))
+        files.append((path, weight))
+    return files
+
+
+def subset_font(path, characters):
+    """(font bytes, file extension) holding only the given characters; the whole file without fontTools"""
+    ext = os.path.splitext(path)[1].lower()
+    if subset is None:
+        with open(path, "rb") as f:
+            return f.read(), ext
+
+    options = subset.Options()
+    options.layout_features = ["*"]
+    options.flavor = "woff2" if brotli is not None else None
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=characters)
+    font = TTFont(path)
+    subsetter.subset(font)
+    output = io.BytesIO()
+    font.flavor = options.flavor
+    font.save(output)
+    return output.getvalue(), ".woff2" if options.flavor else ".ttf"
+
+
+def font_face_css(text, font_dir=FONT_DIR):
+    """@font-face rules for every family with files in font_dir, subset to the characters in text"""
+    characters = "".join(sorted(set(text) | set(BASE_CHARACTERS)))
+    rules = []
+    embedded = 0
+    for family in FAMILIES:
+        for path, weight in font_files(family, font_dir):
+            try:
+                data, ext = subset_font(path, characters)
+            except Exception as e:
+                print(f"    [Fonts] Could not embed {path}: {e}")
+                continue
+            embedded += len(data)
+            mime, font_format = FORMATS[ext]
+            encoded = base64.b64encode(data).decode("ascii")
+            rules.append(f"@font-face {{ font-family: '{family}'; font-weight: {weight}; font-display: swap; "
+                         f"src: url(data:{mime};base64,{encoded}) format('{font_format}'); }}")
+    missing = [family for family in FAMILIES if not font_files(family, font_dir)]
+    print(f"    [Fonts] {len(rules)} font file(s) embedded, {embedded / 1024:.0f} KB"
+          + (f"; system fonts for {', '.join(missing)}" if missing else ""))
+    return "\n".join(rules)
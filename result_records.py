@@ -0,0 +1,121 @@
+"""
+Per-Test Result Records for Parabank Selenium Tests
+Appends one JSON line per finished test to test_results.jsonl (PARABANK_RESULTS_PATH):
+
+    {"test_id": "test_billpay.TestBillPay.test_xss_in_payee_name", "suite": "Bill Pay",
+     "tc_id": "TC_BILL_06", "title": "XSS Prevention in Payee Name (SECURITY)",
+     "method": "test_xss_in_payee_name", "status": "failed", "started_at": "...",
+     "finished_at": "...", "duration": 7.41, "message": "1 check(s) failed",
+     "screenshots": ["screenshots/billpay/TC_BILL_06_01_xss_attempt.png", ...]}
+
+The TC ID and title come from the "=== TC_...: ... ===" banner in the test's source; the
+message comes from suite_runner.tracked_test: the exception a test raised, or how many of
+its checks failed. Records are written as soon as a test finishes, so reports, history and
+sharding can stream the file while the run goes on.
+
+A work_queue worker holds its record back until the queue has accepted the result: when a
+straggler was stolen and run twice, only the copy that finished first is written.
+"""
+
+import inspect
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+
+from screenshot_capture import capture
+
+RESULTS_PATH = os.environ.get("PARABANK_RESULTS_PATH", "test_results.jsonl")
+BANNER_PATTERN = re.compile(r"===\s*(TC_\w+):\s*(.*?)\s*===")
+
+
+def read_results(results_path=RESULTS_PATH):
+    """Records of the current run, in finish order"""
+    if not os.path.exists(results_path):
+        return []
+    records = []
+    with open(results_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                records.append(json.loads(line))
+    return records
+
+
+class ResultRecorder:
+    """Test listener that writes one record per finished test"""
+
+    def __init__(self, results_path=RESULTS_PATH):
+        self.results_path = results_path
+        self.lock = threading.Lock()
+        self.banners = {}
+        self.local = threading.local()
+        self.deferred = False
+
+    def start_run(self):
+        """Begin a fresh results file; called by the runners before the first test"""
+        with self.lock:
+            open(self.results_path, "w", encoding="utf-8").close()
+
+    def banner_for(self, test_id):
+        """(TC ID, title) from the banner in the test method's source, cached per method"""
+        if test_id not in self.banners:
+            from suite_runner import resolve_test
+            tc_id, title = None, None
+            try:
+                test_class, method_name = resolve_test(test_id)
+                match = BANNER_PATTERN.search(inspect.getsource(getattr(test_class, method_name)))
+                if match:
+                    tc_id, title = match.group(1), match.group(2)
+            except (OSError, TypeError, ValueError, ImportError, AttributeError):
+                pass
+            self.banners[test_id] = (tc_id, title)
+        return self.banners[test_id]
+
+    def test_started(self, test_id):
+        self.local.started_at = time.time()
+
+    def driver_created(self, test_id, driver):
+        pass
+
+    def test_finished(self, test_id, status):
+        from suite_runner import current, suite_name_for
+        finished_at = time.time()
+        started_at = getattr(self.local, "started_at", finished_at)
+        message = getattr(current, "message", None)
+
+        tc_id, title = self.banner_for(test_id)
+        record = {
+            "test_id": test_id,
+            "suite": suite_name_for(test_id),
+            "tc_id": tc_id,
+            "title": title,
+            "method": test_id.rsplit(".", 1)[-1],
+            "status": status,
+            "started_at": datetime.fromtimestamp(started_at).isoformat(timespec="milliseconds"),
+            "finished_at": datetime.fromtimestamp(finished_at).isoformat(timespec="milliseconds"),
+            "duration": round(finished_at - started_at, 3),
+            "message": message if status != "passed" else None,
+            "screenshots": capture.paths_for_test(test_id),
+        }
+        if self.deferred:
+            self.local.held = record
+        else:
+            self.write(record)
+
+    def release(self, accepted):
+        """Write the record held back by a work_queue worker, if the queue accepted its result"""
+        record = getattr(self.local, "held", None)
+        self.local.held = None
+        if record is not None and accepted:
+            self.write(record)
+
+    def write(self, record):
+        with self.lock:
+            # one write per line, so parallel workers appending to the same file do not interleave
+            with open(self.results_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+
+result_recorder = ResultRecorder()
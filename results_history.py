@@ -0,0 +1,189 @@
+"""
+Results History for Parabank Selenium Tests
+Keeps every run's per-test results in a local SQLite database (test_history.db,
+PARABANK_HISTORY_DB) keyed by build, commit and target URL, so the report can show how
+each suite and test has trended: pass rate, p50/p95 duration and idle time (the part of a
+test spent outside WebDriver commands - sleeps and Python-side work).
+
+Jenkins keeps the workspace between builds, so the database grows by one run per build;
+BUILD_NUMBER and GIT_COMMIT come from the Jenkins environment. Saving the same build,
+commit and URL again replaces that run. The target URL is pages.BASE_URL, the Parabank
+the suites actually ran against (PARABANK_BASE_URL, defaulting to the public demo site).
+
+Usage:
+    python results_history.py                  # last runs and per-suite pass rate
+    python results_history.py --test test_billpay.TestBillPay.test_negative_amount
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import time
+from datetime import datetime
+
+from pages import BASE_URL
+
+HISTORY_DB = os.environ.get("PARABANK_HISTORY_DB", "test_history.db")
+TREND_RUNS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    build TEXT NOT NULL,
+    commit_sha TEXT NOT NULL,
+    target_url TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    UNIQUE (build, commit_sha, target_url)
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs (target_url, started_at);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    test_id TEXT NOT NULL,
+    suite TEXT NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL,
+    idle REAL,
+    PRIMARY KEY (run_id, test_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_results_test ON results (test_id, run_id);
+"""
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers; None for an empty list"""
+    values = sorted(value for value in values if value is not None)
+    if not values:
+        return None
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+class HistoryStore:
+    """SQLite store of past runs, one row per test per run"""
+
+    def __init__(self, db_path=HISTORY_DB):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def record_run(self, records, command_seconds=None, build=None, commit=None, target_url=BASE_URL):
+        """Save one run's result records; command_seconds maps test IDs to time spent in WebDriver calls"""
+        command_seconds = command_seconds or {}
+        build = build or os.environ.get("BUILD_NUMBER") or time.strftime("local-%Y%m%d-%H%M%S")
+        commit = commit or os.environ.get("GIT_COMMIT") or ""
+        started_at = min((datetime.fromisoformat(record["started_at"]).timestamp()
+                          for record in records if record.get("started_at")), default=time.time())
+        passed = sum(1 for record in records if record["status"] == "passed")
+        rows = []
+        for record in records:
+            duration = record.get("duration")
+            in_commands = command_seconds.get(record["test_id"])
+            idle = max(duration - in_commands, 0.0) if duration is not None and in_commands is not None else None
+            rows.append((record["test_id"], record.get("suite") or "", record["status"], duration, idle))
+
+        with self.conn:
+            self.conn.execute("DELETE FROM runs WHERE build = ? AND commit_sha = ? AND target_url = ?",
+                              (build, commit, target_url))
+            run_id = self.conn.execute(
+                "INSERT INTO runs (build, commit_sha, target_url, started_at, total, passed) VALUES (?, ?, ?, ?, ?, ?)",
+                (build, commit, target_url, started_at, len(records), passed)
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO results (run_id, test_id, suite, status, duration, idle) VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in rows]
+            )
+        return run_id
+
+    def recent_runs(self, limit=TREND_RUNS, target_url=BASE_URL):
+        """The last runs against target_url, oldest first"""
+        rows = self.conn.execute(
+            "SELECT run_id, build, commit_sha, started_at, total, passed FROM runs "
+            "WHERE target_url = ? ORDER BY started_at DESC LIMIT ?", (target_url, limit)
+        ).fetchall()
+        keys = ["run_id", "build", "commit", "started_at", "total", "passed"]
+        return [dict(zip(keys, row)) for row in reversed(rows)]
+
+    def trends(self, limit=TREND_RUNS, target_url=BASE_URL):
+        """(runs, suite trends, test trends) over the last runs; each trend is one point per run"""
+        runs = self.recent_runs(limit, target_url)
+        if not runs:
+            return runs, {}, {}
+        index = {run["run_id"]: position for position, run in enumerate(runs)}
+        placeholders = ",".join("?" * len(runs))
+        rows = self.conn.execute(
+            f"SELECT run_id, test_id, suite, status, duration, idle FROM results WHERE run_id IN ({placeholders})",
+            list(index)
+        ).fetchall()
+
+        by_suite, by_test = {}, {}
+        for run_id, test_id, suite, status, duration, idle in rows:
+            position = index[run_id]
+            for groups, key in ((by_suite, suite), (by_test, test_id)):
+                points = groups.setdefault(key, [None] * len(runs))
+                if points[position] is None:
+                    points[position] = []
+                points[position].append((status, duration, idle))
+
+        def summarize(groups):
+            trends = {}
+            for key, points in sorted(groups.items()):
+                trends[key] = [None if results is None else {
+                    "pass_rate": sum(1 for status, _, _ in results if status == "passed") / len(results) * 100,
+                    "p50": percentile([duration for _, duration, _ in results], 0.5),
+                    "p95": percentile([duration for _, duration, _ in results], 0.95),
+                    "idle": percentile([idle for _, _, idle in results], 0.5),
+                    "status": results[0][0] if len(results) == 1 else None,
+                } for results in points]
+            return trends
+
+        return runs, summarize(by_suite), summarize(by_test)
+
+    def test_history(self, test_id, since=None, target_url=BASE_URL):
+        """Every recorded result of one test, oldest first (uses idx_results_test)"""
+        rows = self.conn.execute(
+            "SELECT runs.build, runs.started_at, results.status, results.duration, results.idle "
+            "FROM results JOIN runs USING (run_id) "
+            "WHERE results.test_id = ? AND runs.target_url = ? AND runs.started_at >= ? ORDER BY runs.started_at",
+            (test_id, target_url, since or 0)
+        ).fetchall()
+        keys = ["build", "started_at", "status", "duration", "idle"]
+        return [dict(zip(keys, row)) for row in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the Parabank results history")
+    parser.add_argument("--db", default=HISTORY_DB)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--test", help="show every recorded result of one test ID")
+    args = parser.parse_args()
+
+    store = HistoryStore(args.db)
+    try:
+        if args.test:
+            for entry in store.test_history(args.test):
+                duration = f"{entry['duration']:.1f}s" if entry["duration"] is not None else "-"
+                print(f"  {entry['build']:<24} {entry['status'].upper():7} {duration}")
+            return
+        runs, suites, _ = store.trends(args.runs)
+        print("\n" + "="*60)
+        print(f"LAST {len(runs)} RUN(S)")
+        print("="*60)
+        for run in runs:
+            print(f"  {run['build']:<24} {run['passed']}/{run['total']} passed  {run['commit'][:10]}")
+        for suite, points in suites.items():
+            rates = " ".join(f"{point['pass_rate']:3.0f}" if point else "  -" for point in points)
+            print(f"  {suite:<22} {rates}")
+        print("="*60)
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
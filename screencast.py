@@ -0,0 +1,106 @@
+"""
+Screencast Recorder for Parabank Selenium Tests
+Records a test as a CDP Page.startScreencast frame stream on a background thread and
+encodes it into one animated WebP per test, with the test's named steps on the timeline.
+
+Encoding needs Pillow (pip install pillow); without it the raw JPEG frames are kept
+next to the timeline instead.
+"""
+
+import base64
+import io
+import json
+import threading
+import time
+
+import trio
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+class ScreencastRecorder(threading.Thread):
+    """Collects screencast frames for one driver until stopped or the driver quits"""
+
+    def __init__(self, driver, quality=60, max_width=1280, max_height=800):
+        super().__init__(name="screencast", daemon=True)
+        self.driver = driver
+        self.quality = quality
+        self.max_width = max_width
+        self.max_height = max_height
+        self.frames = []
+        self.steps = []
+        self.started_at = time.time()
+        self.trio_token = None
+        self.cancel_scope = None
+        self.error = None
+
+    def run(self):
+        try:
+            trio.run(self.record)
+        except Exception as e:
+            # the CDP socket closes when the test quits its driver; frames so far are kept
+            self.error = e
+
+    async def record(self):
+        async with self.driver.bidi_connection() as connection:
+            session, devtools = connection.session, connection.devtools
+            with trio.CancelScope() as scope:
+                self.cancel_scope = scope
+                self.trio_token = trio.lowlevel.current_trio_token()
+                await session.execute(devtools.page.start_screencast(
+                    format_="jpeg", quality=self.quality,
+                    max_width=self.max_width, max_height=self.max_height))
+                async for frame in session.listen(devtools.page.ScreencastFrame):
+                    timestamp = frame.metadata.timestamp
+                    self.frames.append((float(timestamp) if timestamp else time.time(), base64.b64decode(frame.data)))
+                    await session.execute(devtools.page.screencast_frame_ack(frame.session_id))
+
+    def mark_step(self, name):
+        """Timestamp a named test step (what used to be a discrete screenshot)"""
+        self.steps.append((time.time(), name))
+
+    def stop(self, timeout=5):
+        if self.is_alive() and self.cancel_scope is not None:
+            try:
+                trio.from_thread.run_sync(self.cancel_scope.cancel, trio_token=self.trio_token)
+            except (RuntimeError, trio.RunFinishedError):
+                pass
+        self.join(timeout)
+
+    def timeline(self):
+        return {
+            "started_at": self.started_at,
+            "frames": [round(timestamp - self.started_at, 3) for timestamp, data in self.frames],
+            "steps": [{"name": name, "t": round(timestamp - self.started_at, 3)} for timestamp, name in self.steps],
+        }
+
+
+def encode_animation(frames, quality=60):
+    """Encode (timestamp, jpeg bytes) frames as an animated WebP; None without Pillow"""
+    if Image is None or not frames:
+        return None
+    images = [Image.open(io.BytesIO(data)).convert("RGB") for timestamp, data in frames]
+    # each frame is shown until the next one arrived; the last one for a second
+    durations = [max(int((frames[i + 1][0] - frames[i][0]) * 1000), 20) for i in range(len(frames) - 1)] + [1000]
+    output = io.BytesIO()
+    images[0].save(output, format="WEBP", save_all=True, append_images=images[1:],
+                   duration=durations, quality=quality, loop=0)
+    return output.getvalue()
+
+
+def recording_outputs(recorder, base_path):
+    """Files to write for a finished recording as (path, bytes) pairs"""
+    timeline = recorder.timeline()
+    outputs = []
+    animation = encode_animation(recorder.frames, recorder.quality)
+    if animation is not None:
+        outputs.append((f"{base_path}.webp", animation))
+    else:
+        for index, (timestamp, data) in enumerate(recorder.frames):
+            outputs.append((f"{base_path}_frame{index:04d}.jpg", data))
+        timeline["note"] = "Pillow not installed - frames kept as JPEG files"
+    outputs.append((f"{base_path}.json", json.dumps(timeline, indent=2).encode("utf-8")))
+    return outputs
@@ -0,0 +1,371 @@
+"""
+Screenshot Capture Layer for Parabank Selenium Tests
+Fetches the PNG bytes on the test thread and hands the disk write to a background
+writer thread through a bounded queue, so tests do not block on file I/O.
+
+Set PARABANK_SYNC_SCREENSHOTS=1 to write synchronously on the test thread instead.
+Set PARABANK_SCREENSHOT_MODE=failure-only to keep the last PARABANK_SCREENSHOT_BUFFER
+(default 5) screenshots of each test in memory and write them only if the test fails.
+Failure-only mode needs a runner that reports test boundaries (suite_runner.instrument_suite);
+screenshots taken outside an instrumented test are written straight away.
+Set PARABANK_SCREENSHOT_STORE=cas to store each distinct image once under screenshots/blobs,
+keyed by its SHA-256; the per-test names then point at the shared blobs in the manifest.
+Set PARABANK_SCREENSHOT_FORMAT=jpeg or webp (with PARABANK_SCREENSHOT_QUALITY, default 70),
+PARABANK_SCREENSHOT_SCALE (e.g. 0.5) and/or PARABANK_SCREENSHOT_CLIP (a CSS selector such as
+#rightPanel) to capture through CDP Page.captureScreenshot instead of a full-window PNG.
+Set PARABANK_SCREENSHOT_MODE=screencast to record each test as one animated WebP under
+screenshots/screencasts instead; take_screenshot() then only marks a named step on the timeline.
+With PARABANK_TMPFS=1 (see tmpfs_staging.py) files are staged on tmpfs and moved to their
+workspace paths by flush(); manifest paths always name the final location.
+
+Every file written is appended to screenshots/manifest.jsonl (test ID, step, path, stored
+location, size, timestamp); the report reads the run's screenshots from there.
+"""
+
+import atexit
+import base64
+import collections
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+
+from phase_timing import phase
+from screencast import ScreencastRecorder, recording_outputs
+from tmpfs_staging import staging
+
+
+MANIFEST_PATH = "screenshots/manifest.jsonl"
+
+
+def write_file(filepath, data, root=""):
+    """Plain sink: one file per screenshot name; returns (stored path, bytes written)"""
+    target = os.path.join(root, filepath)
+    if root:
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+    with open(target, "wb") as f:
+        f.write(data)
+    return filepath, len(data)
+
+
+def read_manifest(manifest_path=MANIFEST_PATH):
+    """Manifest entries of the current run, in write order"""
+    if not os.path.exists(manifest_path):
+        return []
+    entries = []
+    with open(manifest_path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                entries.append(json.loads(line))
+    return entries
+
+
+class ContentStore:
+    """Content-addressed sink: identical images share one blob"""
+
+    def __init__(self, root="screenshots/blobs"):
+        self.root = root
+        self.lock = threading.Lock()
+        self.known = set()
+        self.deduplicated = 0
+        os.makedirs(root, exist_ok=True)
+
+    def blob_path(self, digest, ext):
+        return f"{self.root}/{digest[:2]}/{digest}{ext}"
+
+    def put(self, filepath, data, root=""):
+        """Store data under its hash; returns (blob path, bytes written)"""
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.blob_path(digest, os.path.splitext(filepath)[1])
+        target = os.path.join(root, blob)
+        written = 0
+        with self.lock:
+            # another process may have staged the blob already, or it may already have been persisted
+            is_new = digest not in self.known and not os.path.exists(target) and not os.path.exists(blob)
+            self.known.add(digest)
+            if is_new:
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                tmp_path = target + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, target)
+                written = len(data)
+            else:
+                self.deduplicated += 1
+        return blob, written
+
+
+class ScreenshotWriter(threading.Thread):
+    """Background thread that writes queued screenshots to disk"""
+
+    def __init__(self, sink, max_queue=64):
+        super().__init__(name="screenshot-writer", daemon=True)
+        self.sink = sink
+        self.queue = queue.Queue(maxsize=max_queue)
+        self.stats_lock = threading.Lock()
+        self.written = 0
+        self.bytes_written = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.total_write_time = 0.0
+
+    def submit(self, filepath, data, meta):
+        """Queue a write; blocks when the queue is full so memory stays bounded"""
+        self.queue.put((filepath, data, meta, time.perf_counter()))
+        with self.stats_lock:
+            self.max_depth = max(self.max_depth, self.queue.qsize())
+
+    def run(self):
+        while True:
+            filepath, data, meta, queued_at = self.queue.get()
+            try:
+                write_start = time.perf_counter()
+                written = self.sink(filepath, data, meta)
+                done = time.perf_counter()
+                with self.stats_lock:
+                    self.written += 1
+                    self.bytes_written += written
+                    self.total_write_time += done - write_start
+                    self.total_latency += done - queued_at
+                    self.max_latency = max(self.max_latency, done - queued_at)
+            except Exception as e:
+                with self.stats_lock:
+                    self.errors += 1
+                print(f"    [Screenshot] [ERROR] Failed to write {filepath}: {e}")
+            finally:
+                self.queue.task_done()
+
+    def flush(self):
+        """Wait until every queued screenshot is on disk"""
+        self.queue.join()
+
+    def stats(self):
+        with self.stats_lock:
+            return {
+                "written": self.written,
+                "bytes": self.bytes_written,
+                "errors": self.errors,
+                "queue_depth": self.queue.qsize(),
+                "max_queue_depth": self.max_depth,
+                "avg_latency_ms": (self.total_latency / self.written * 1000) if self.written else 0,
+                "max_latency_ms": self.max_latency * 1000,
+                "avg_write_ms": (self.total_write_time / self.written * 1000) if self.written else 0,
+            }
+
+
+FILE_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+CLIP_SCRIPT = """
+const el = arguments[0] ? document.querySelector(arguments[0]) : null;
+const r = el ? el.getBoundingClientRect() : {left: 0, top: 0, width: window.innerWidth, height: window.innerHeight};
+return {x: r.left + window.scrollX, y: r.top + window.scrollY, width: r.width, height: r.height};
+"""
+
+
+class ScreenshotCapture:
+    """Shared entry point behind every suite's take_screenshot()"""
+
+    def __init__(self, async_writes=True, max_queue=64, failure_only=False, buffer_size=5, store=None,
+                 image_format="png", quality=70, scale=1.0, clip_selector=None, screencast=False,
+                 screencast_dir="screenshots/screencasts", manifest_path=MANIFEST_PATH):
+        self.async_writes = async_writes
+        self.manifest_path = manifest_path
+        self.manifest_lock = threading.Lock()
+        self.screencast = screencast
+        self.screencast_dir = screencast_dir
+        self.store = store
+        self.base_sink = store.put if store else write_file
+        self.image_format = image_format
+        self.quality = quality
+        self.scale = scale
+        self.clip_selector = clip_selector
+        self.bytes_lock = threading.Lock()
+        self.bytes_by_suite = {}
+        self.reported_bytes = {}
+        self.files_by_suite = {}
+        self.stored_paths = {}
+        self.paths_by_test = {}
+        self.max_queue = max_queue
+        self.failure_only = failure_only
+        self.buffer_size = buffer_size
+        self.writer = None
+        self.writer_lock = threading.Lock()
+        # tests run one per thread (window_pool runs several at once)
+        self.local = threading.local()
+
+    def get_writer(self):
+        with self.writer_lock:
+            if self.writer is None:
+                self.writer = ScreenshotWriter(self.sink, self.max_queue)
+                self.writer.start()
+            return self.writer
+
+    def uses_cdp(self):
+        return self.image_format != "png" or self.scale != 1.0 or bool(self.clip_selector)
+
+    def grab(self, driver):
+        """Fetch image bytes from the browser; returns (data, file extension)"""
+        if self.uses_cdp():
+            try:
+                params = {"format": self.image_format, "captureBeyondViewport": bool(self.clip_selector)}
+                if self.image_format != "png":
+                    params["quality"] = self.quality
+                clip = driver.execute_script(CLIP_SCRIPT, self.clip_selector)
+                clip["scale"] = self.scale
+                params["clip"] = clip
+                result = driver.execute_cdp_cmd("Page.captureScreenshot", params)
+                return base64.b64decode(result["data"]), FILE_EXTENSIONS[self.image_format]
+            except Exception as e:
+                # non-Chromium driver or CDP unavailable: fall back to the standard capture
+                print(f"    [Screenshot] CDP capture failed, using PNG: {e}")
+        return driver.get_screenshot_as_png(), ".png"
+
+    def take_screenshot(self, driver, screenshot_dir, name):
+        """Capture a screenshot and queue it for writing; returns the target path"""
+        recorder = getattr(self.local, "recorder", None)
+        if recorder is not None:
+            # no WebDriver round trip: the frame stream already has the picture
+            recorder.mark_step(name)
+            print(f"    [Screenshot] Step marked in screencast: {name}")
+            return f"{self.screencast_dir}/{self.local.test_id}.webp"
+
+        with phase("screenshot"):
+            data, ext = self.grab(driver)
+        filepath = f"{screenshot_dir}/{name}{ext}"
+        meta = self.entry_meta(name)
+        ring = getattr(self.local, "ring", None)
+        if ring is not None:
+            ring.append((filepath, data, meta))
+            print(f"    [Screenshot] Buffered: {filepath}")
+        else:
+            self.write(filepath, data, meta)
+            print(f"    [Screenshot] Saved: {filepath}")
+        return filepath
+
+    def entry_meta(self, step):
+        return {"test_id": getattr(self.local, "test_id", None), "step": step, "timestamp": time.time()}
+
+    def sink(self, filepath, data, meta):
+        """Write through the configured sink, count bytes per suite directory and append to the manifest"""
+        stored, written = self.base_sink(filepath, data, staging.write_root(len(data)))
+        suite = os.path.dirname(filepath)
+        with self.bytes_lock:
+            self.bytes_by_suite[suite] = self.bytes_by_suite.get(suite, 0) + written
+            self.files_by_suite.setdefault(suite, []).append(filepath)
+            self.stored_paths[filepath] = stored
+
+        entry = dict(meta, path=filepath, stored=stored, size=len(data), bytes_written=written)
+        with self.manifest_lock:
+            with open(self.manifest_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+        return written
+
+    def start_run(self):
+        """Begin a fresh manifest; called by the runners before the first suite"""
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with self.manifest_lock:
+            open(self.manifest_path, "w", encoding="utf-8").close()
+
+    def stored_path(self, filepath):
+        """Where the bytes for a screenshot name actually live (a blob in cas mode)"""
+        with self.bytes_lock:
+            return self.stored_paths.get(filepath, filepath)
+
+    def screenshots_for(self, screenshot_dir):
+        """(stored path, name, suite) for every image written to a suite directory so far"""
+        with self.bytes_lock:
+            filepaths = list(self.files_by_suite.get(screenshot_dir, []))
+        return [(self.stored_path(filepath), os.path.splitext(os.path.basename(filepath))[0],
+                 os.path.basename(screenshot_dir)) for filepath in filepaths]
+
+    def paths_for_test(self, test_id):
+        """Paths written (or queued) for a test so far; each test's list is handed out once"""
+        with self.bytes_lock:
+            return self.paths_by_test.pop(test_id, [])
+
+    def write(self, filepath, data, meta):
+        if meta.get("test_id"):
+            with self.bytes_lock:
+                self.paths_by_test.setdefault(meta["test_id"], []).append(filepath)
+        if self.async_writes:
+            self.get_writer().submit(filepath, data, meta)
+        else:
+            self.sink(filepath, data, meta)
+
+    def test_started(self, test_id):
+        self.local.test_id = test_id
+        if self.failure_only:
+            self.local.ring = collections.deque(maxlen=self.buffer_size)
+
+    def driver_created(self, test_id, driver):
+        if self.screencast and test_id:
+            recorder = ScreencastRecorder(driver, quality=self.quality)
+            recorder.start()
+            self.local.recorder = recorder
+
+    def test_finished(self, test_id, status):
+        recorder = getattr(self.local, "recorder", None)
+        self.local.recorder = None
+        if recorder is not None:
+            recorder.stop()
+            os.makedirs(self.screencast_dir, exist_ok=True)
+            outputs = recording_outputs(recorder, f"{self.screencast_dir}/{test_id}")
+            for filepath, data in outputs:
+                self.write(filepath, data, self.entry_meta("screencast"))
+            print(f"    [Screenshot] Screencast: {len(recorder.frames)} frame(s), "
+                  f"{len(recorder.steps)} step(s) -> {outputs[0][0]}")
+        self.local.test_id = None
+
+        ring = getattr(self.local, "ring", None)
+        self.local.ring = None
+        if not ring:
+            return
+        if status == "passed":
+            print(f"    [Screenshot] Test passed - discarded {len(ring)} buffered screenshot(s)")
+            return
+        for filepath, data, meta in ring:
+            self.write(filepath, data, meta)
+        print(f"    [Screenshot] Test {status} - saved last {len(ring)} screenshot(s)")
+
+    def flush(self):
+        """Drain the writer queue; call at suite end before reading the files"""
+        if self.writer is not None:
+            self.writer.flush()
+        staging.move_to_persistent()
+        with self.bytes_lock:
+            changed = {suite: size for suite, size in self.bytes_by_suite.items()
+                       if self.reported_bytes.get(suite) != size}
+            self.reported_bytes.update(changed)
+        self.print_suite_bytes(changed)
+        if self.writer is None:
+            return None
+        stats = self.writer.stats()
+        print(f"    [Screenshot] Writer flushed: {stats['written']} written "
+              f"({stats['bytes'] / 1024:.0f} KB), max queue depth {stats['max_queue_depth']}, "
+              f"latency avg {stats['avg_latency_ms']:.1f} ms / max {stats['max_latency_ms']:.1f} ms")
+        if self.store:
+            print(f"    [Screenshot] Content store: {len(self.store.known)} unique blob(s), "
+                  f"{self.store.deduplicated} duplicate(s) skipped")
+        return stats
+
+    def print_suite_bytes(self, bytes_by_suite):
+        for suite, size in sorted(bytes_by_suite.items()):
+            print(f"    [Screenshot] {suite}: {size / 1024:.0f} KB written")
+
+
+capture = ScreenshotCapture(
+    async_writes=os.environ.get("PARABANK_SYNC_SCREENSHOTS") != "1",
+    failure_only=os.environ.get("PARABANK_SCREENSHOT_MODE") == "failure-only",
+    screencast=os.environ.get("PARABANK_SCREENSHOT_MODE") == "screencast",
+    buffer_size=int(os.environ.get("PARABANK_SCREENSHOT_BUFFER", "5")),
+    store=ContentStore() if os.environ.get("PARABANK_SCREENSHOT_STORE") == "cas" else None,
+    image_format=os.environ.get("PARABANK_SCREENSHOT_FORMAT", "png"),
+    quality=int(os.environ.get("PARABANK_SCREENSHOT_QUALITY", "70")),
+    scale=float(os.environ.get("PARABANK_SCREENSHOT_SCALE", "1.0")),
+    clip_selector=os.environ.get("PARABANK_SCREENSHOT_CLIP") or None,
+)
+atexit.register(capture.flush)
@@ -0,0 +1,168 @@
+"""
+Suite Runner Helpers for Parabank Selenium Tests
+Resolves test IDs such as test_billpay.TestBillPay.test_negative_amount and runs them one at a time
+"""
+
+import importlib
+import threading
+
+from command_stats import command_stats
+from live_report import live_report
+from locator_profile import locator_profiler
+from phase_timing import phase, phase_timer, timed
+from result_records import result_recorder
+from screenshot_capture import capture
+from tmpfs_staging import staging
+
+ALL_SUITES = [
+    ("Registration", "test_selenium1", "TestRegistration"),
+    ("Login", "test_selenium2", "TestLogin"),
+    ("Open Account", "test_selenium3", "TestOpenAccount"),
+    ("Transfer Funds", "test_selenium4", "TestTransferFunds"),
+    ("Accounts Overview", "test_selenium5", "TestAccountsOverview"),
+    ("Admin Page", "test_selenium6", "TestAdminPage"),
+    ("Customer Care", "test_selenium7", "TestCustomerCare"),
+    ("Bill Pay", "test_billpay", "TestBillPay"),
+    ("Find Transactions", "test_find_transactions", "TestFindTransactions"),
+    ("Request Loan", "test_request_loan", "TestRequestLoan"),
+    ("Update Contact Info", "test_update_contact", "TestUpdateContactInfo"),
+    ("Forgot Login", "test_forgot_login", "TestForgotLoginInfo"),
+    ("Account Activity", "test_account_activity", "TestAccountActivity"),
+    ("Logout", "test_logout", "TestLogout"),
+    ("Navigation", "test_navigation", "TestNavigationMenu"),
+    ("Account Statement", "test_account_statement", "TestAccountStatement"),
+]
+
+
+def suite_name_for(test_id):
+    """Map a test ID back to the suite name used in the reports"""
+    module_name = test_id.split(".")[0]
+    for suite_name, suite_module, class_name in ALL_SUITES:
+        if suite_module == module_name:
+            return suite_name
+    return module_name
+
+
+def discover_test_ids(suites=None):
+    """List test IDs (module.Class.method) in definition order"""
+    test_ids = []
+    for suite_name, module_name, class_name in (suites or ALL_SUITES):
+        test_class = getattr(importlib.import_module(module_name), class_name)
+        for attr in vars(test_class):
+            if attr.startswith("test_") and callable(getattr(test_class, attr)):
+                test_ids.append(f"{module_name}.{class_name}.{attr}")
+    return test_ids
+
+
+def resolve_test(test_id):
+    """Return (test class, method name) for a test ID"""
+    module_name, class_name, method_name = test_id.split(".")
+    test_class = getattr(importlib.import_module(module_name), class_name)
+    if not hasattr(test_class, method_name):
+        raise ValueError(f"Unknown test: {test_id}")
+    return test_class, method_name
+
+
+class TestListener:
+    """Base class for objects notified when an instrumented test starts and finishes"""
+
+    def test_started(self, test_id):
+        pass
+
+    def driver_created(self, test_id, driver):
+        pass
+
+    def test_finished(self, test_id, status):
+        pass
+
+
+listeners = []
+# the test running on this thread (window_pool runs several at once)
+current = threading.local()
+
+
+def add_listener(listener):
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def test_id_for(test_instance, method_name):
+    test_class = type(test_instance)
+    return f"{test_class.__module__}.{test_class.__name__}.{method_name}"
+
+
+def tracked_test(test_instance, method_name):
+    """Wrap a bound test method so listeners see its start and its outcome"""
+    method = getattr(test_instance, method_name)
+    test_id = test_id_for(test_instance, method_name)
+
+    def run():
+        passed_before, failed_before = test_instance.passed, test_instance.failed
+        current.test_id = test_id
+        for listener in listeners:
+            listener.test_started(test_id)
+        status, message = "error", None
+        try:
+            method()
+            failed = test_instance.failed - failed_before
+            passed = failed == 0 and test_instance.passed > passed_before
+            status = "passed" if passed else "failed"
+            if not passed:
+                message = f"{failed} check(s) failed" if failed else "no check passed"
+        except Exception as e:
+            message = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            # listeners read the failure message from current rather than from the printed output
+            current.message = message
+            for listener in listeners:
+                listener.test_finished(test_id, status)
+            current.test_id = None
+            current.message = None
+        return status
+
+    return run
+
+
+def tracked_driver_factory(test_instance):
+    """Wrap create_driver so listeners can attach to each new driver"""
+    create_driver = test_instance.create_driver
+
+    def run():
+        with phase("driver"):
+            driver, wait = create_driver()
+        test_id = getattr(current, "test_id", None)
+        for listener in listeners:
+            listener.driver_created(test_id, driver)
+        return driver, phase_timer.wrap_wait(wait)
+
+    return run
+
+
+def instrument_suite(test_instance):
+    """Shadow each test_* method (and create_driver, login) on the instance, so run_all_tests() reports per-test events"""
+    for attr in vars(type(test_instance)):
+        if attr.startswith("test_") and callable(getattr(test_instance, attr)):
+            setattr(test_instance, attr, tracked_test(test_instance, attr))
+    test_instance.create_driver = tracked_driver_factory(test_instance)
+    if callable(getattr(test_instance, "login", None)):
+        # the whole helper (home page, settle sleeps, log_in) is the login phase
+        test_instance.login = timed("login", test_instance.login)
+    return test_instance
+
+
+def run_single_test(test_id):
+    """Run one test method on a fresh suite instance and report its outcome"""
+    test_class, method_name = resolve_test(test_id)
+    test_instance = instrument_suite(test_class())
+    status = getattr(test_instance, method_name)()
+    return {"test_id": test_id, "status": status}
+
+
+add_listener(capture)
+add_listener(staging)
+add_listener(command_stats)
+add_listener(phase_timer)
+add_listener(locator_profiler)
+add_listener(result_recorder)
+add_listener(live_report)
@@ -0,0 +1,64 @@
+"""
+Bulk Table Extraction for Parabank Selenium Tests
+Reads a whole table (header, body rows, footer and the link in each cell) in one
+execute_script call instead of one WebDriver call per cell, and parses Parabank's
+currency cells into Decimal on the Python side.
+
+Usage:
+    table = extract_table(driver, "accountTable")
+    balances = parse_column(table["body"], 1)
+    total = sum(balance for balance in balances if balance is not None)
+"""
+
+import re
+from decimal import Decimal, InvalidOperation
+
+from selenium.common.exceptions import NoSuchElementException
+
+TABLE_SCRIPT = """
+const table = document.getElementById(arguments[0]);
+if (!table) return null;
+// textContent avoids a layout pass per cell, which matters for long transaction histories
+const text = cell => cell.textContent.replace(/\\s+/g, ' ').trim();
+const rows = section => section ? Array.from(section.rows, row => Array.from(row.cells, text)) : [];
+const links = section => section ? Array.from(section.rows, row => Array.from(row.cells, cell => {
+    const a = cell.querySelector('a[href]');
+    return a ? a.href : null;
+})) : [];
+const body = table.tBodies.length ? table.tBodies[0] : null;
+return {
+    header: rows(table.tHead),
+    body: rows(body),
+    footer: rows(table.tFoot),
+    body_links: links(body)
+};
+"""
+
+CURRENCY_PATTERN = re.compile(r"^(-)?\(?(-)?\$?(-)?([\d,]*\.?\d+)\)?$")
+
+
+def extract_table(driver, table_id):
+    """Whole table as {"header", "body", "footer": [[cell text]], "body_links": [[href or None]]}"""
+    table = driver.execute_script(TABLE_SCRIPT, table_id)
+    if table is None:
+        raise NoSuchElementException(f"Table not found: #{table_id}")
+    return table
+
+
+def parse_currency(text):
+    """'$1,234.56', '-$50.00' or '($50.00)' as a Decimal; None if the cell is not an amount"""
+    text = text.strip().replace(" ", "")
+    match = CURRENCY_PATTERN.match(text)
+    if not match:
+        return None
+    try:
+        amount = Decimal(match.group(4).replace(",", ""))
+    except InvalidOperation:
+        return None
+    negative = any(match.group(i) for i in (1, 2, 3)) or (text.startswith("(") and text.endswith(")"))
+    return -amount if negative else amount
+
+
+def parse_column(rows, index):
+    """Currency values of one column (0-based) across rows; None where a cell is missing or not an amount"""
+    return [parse_currency(row[index]) if index < len(row) else None for row in rows]
@@ -6,11 +6,13 @@ Test Cases: TC_ACTIVITY_01 to TC_ACTIVITY_07
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL, LoginPanel
 
 class TestAccountActivity:
     def __init__(self):
@@ -24,24 +26,19 @@ class TestAccountActivity:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_accounts_overview_access(self):
         print("\n=== TC_ACTIVITY_01: Accounts Overview Access ===")
@@ -83,7 +80,7 @@ class TestAccountActivity:
             self.login(driver, wait)
 
             # Wait for accounts to load
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ACTIVITY_02_01_accounts_list")
 
@@ -92,7 +89,7 @@ class TestAccountActivity:
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_ACTIVITY_02_02_account_detail")
 
@@ -124,12 +121,12 @@ class TestAccountActivity:
             self.login(driver, wait)
 
             # Navigate to account activity
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_ACTIVITY_03_01_activity_page")
 
@@ -140,7 +137,7 @@ class TestAccountActivity:
 
                     go_button = driver.find_element(By.XPATH, "//input[@value='Go']")
                     go_button.click()
-                    time.sleep(2)
+                    pause(2)
 
                     self.take_screenshot(driver, "TC_ACTIVITY_03_02_filtered")
 
@@ -169,12 +166,12 @@ class TestAccountActivity:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_ACTIVITY_04_01_before_filter")
 
@@ -184,7 +181,7 @@ class TestAccountActivity:
 
                     go_button = driver.find_element(By.XPATH, "//input[@value='Go']")
                     go_button.click()
-                    time.sleep(2)
+                    pause(2)
 
                     self.take_screenshot(driver, "TC_ACTIVITY_04_02_credit_filter")
 
@@ -213,12 +210,12 @@ class TestAccountActivity:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_ACTIVITY_05_01_activity_list")
 
@@ -227,7 +224,7 @@ class TestAccountActivity:
 
                 if len(trans_links) > 0:
                     trans_links[0].click()
-                    time.sleep(2)
+                    pause(2)
 
                     self.take_screenshot(driver, "TC_ACTIVITY_05_02_transaction_detail")
 
@@ -261,7 +258,7 @@ class TestAccountActivity:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ACTIVITY_06_01_balance_check")
 
@@ -293,8 +290,8 @@ class TestAccountActivity:
             self.login(driver, wait)
 
             # Try to access a different account ID directly
-            driver.get("https://parabank.parasoft.com/parabank/activity.htm?id=99999")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/activity.htm?id=99999")
+            pause(2)
 
             self.take_screenshot(driver, "TC_ACTIVITY_07_01_idor_attempt")
 
@@ -6,11 +6,14 @@ Test Cases: TC_STMT_01 to TC_STMT_07
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from page_snapshot import page_snapshot
+from pages import BASE_URL, HOME_URL, LoginPanel
 
 class TestAccountStatement:
     def __init__(self):
@@ -24,24 +27,19 @@ class TestAccountStatement:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_account_details_display(self):
         print("\n=== TC_STMT_01: Account Details Display ===")
@@ -50,14 +48,14 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
 
             # Click on first account
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_STMT_01_01_account_details")
 
@@ -93,12 +91,12 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_STMT_02_01_transaction_list")
 
@@ -135,12 +133,12 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
                 account_links[0].click()
-                time.sleep(2)
+                pause(2)
 
                 self.take_screenshot(driver, "TC_STMT_03_01_account_type")
 
@@ -173,7 +171,7 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_STMT_04_01_balance_format")
 
@@ -212,7 +210,7 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_STMT_05_01_checking_balance")
 
@@ -243,7 +241,7 @@ class TestAccountStatement:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_STMT_06_01_accounts_list")
 
@@ -274,7 +272,7 @@ class TestAccountStatement:
             self.login(driver, wait)
 
             # Get current user's account ID from URL
-            time.sleep(2)
+            pause(2)
             account_links = driver.find_elements(By.XPATH, "//a[contains(@href, 'activity.htm')]")
 
             if len(account_links) > 0:
@@ -288,12 +286,13 @@ class TestAccountStatement:
                     # Try to access a different account (current_id - 1 or + 1000)
                     test_id = current_id - 1 if current_id > 1 else current_id + 1000
 
-                    driver.get(f"https://parabank.parasoft.com/parabank/activity.htm?id={test_id}")
-                    time.sleep(2)
+                    driver.get(f"{BASE_URL}/activity.htm?id={test_id}")
+                    pause(2)
 
                     self.take_screenshot(driver, "TC_STMT_07_01_unauthorized_access")
 
-                    page_source = driver.page_source.lower()
+                    page = page_snapshot(driver)
+                    page_source = page.source_lower
 
                     if "an internal error has occurred" in page_source:
                         print("[FAIL] FAIL: BUG - Server crashed instead of proper access denial")
@@ -301,7 +300,7 @@ class TestAccountStatement:
                     elif "access denied" in page_source or "unauthorized" in page_source:
                         print("[PASS] PASS: Unauthorized account access properly blocked")
                         self.passed += 1
-                    elif "$" in driver.page_source and "balance" in page_source:
+                    elif "$" in page.source and "balance" in page_source:
                         print("[FAIL] FAIL: SECURITY BUG - IDOR - Accessed unauthorized account")
                         self.failed += 1
                     else:
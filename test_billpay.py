@@ -8,8 +8,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL, BillPayPage, LoginPanel
 
 class TestBillPay:
     def __init__(self):
@@ -24,24 +27,19 @@ class TestBillPay:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_billpay_page_access(self):
         print("\n=== TC_BILL_01: Bill Pay Page Access ===")
@@ -52,7 +50,7 @@ class TestBillPay:
 
             billpay_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Bill Pay")))
             billpay_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_BILL_01_01_billpay_page")
 
@@ -91,25 +89,27 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
 
             # Fill bill pay form
-            driver.find_element(By.NAME, "payee.name").send_keys("Electric Company")
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 Power St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("New York")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("NY")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("10001")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5551234567")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys("12345")
-            driver.find_element(By.NAME, "verifyAccount").send_keys("12345")
-            driver.find_element(By.NAME, "amount").send_keys("50")
+            page = BillPayPage(driver, wait)
+            page.fill(
+                payee_name="Electric Company",
+                street="123 Power St",
+                city="New York",
+                state="NY",
+                zip_code="10001",
+                phone="5551234567",
+                account="12345",
+                verify_account="12345",
+                amount="50",
+            )
 
             self.take_screenshot(driver, "TC_BILL_02_01_form_filled")
 
-            send_button = driver.find_element(By.XPATH, "//input[@value='Send Payment']")
-            send_button.click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_BILL_02_02_result")
 
@@ -140,23 +140,26 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
 
             # Fill all except payee name
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 Test St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("Test City")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("TS")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("12345")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5551111111")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys("11111")
-            driver.find_element(By.NAME, "verifyAccount").send_keys("11111")
-            driver.find_element(By.NAME, "amount").send_keys("25")
+            page = BillPayPage(driver, wait)
+            page.fill(
+                street="123 Test St",
+                city="Test City",
+                state="TS",
+                zip_code="12345",
+                phone="5551111111",
+                account="11111",
+                verify_account="11111",
+                amount="25",
+            )
 
             self.take_screenshot(driver, "TC_BILL_03_01_no_payee_name")
 
-            driver.find_element(By.XPATH, "//input[@value='Send Payment']").click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_BILL_03_02_result")
 
@@ -188,23 +191,26 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
-
-            driver.find_element(By.NAME, "payee.name").send_keys("Test Payee")
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 Test St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("City")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("ST")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("12345")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5552222222")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys("12345")
-            driver.find_element(By.NAME, "verifyAccount").send_keys("99999")  # Mismatch
-            driver.find_element(By.NAME, "amount").send_keys("10")
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
+
+            page = BillPayPage(driver, wait)
+            page.fill(
+                payee_name="Test Payee",
+                street="123 Test St",
+                city="City",
+                state="ST",
+                zip_code="12345",
+                phone="5552222222",
+                account="12345",
+                verify_account="99999",  # Mismatch
+                amount="10",
+            )
 
             self.take_screenshot(driver, "TC_BILL_04_01_account_mismatch")
 
-            driver.find_element(By.XPATH, "//input[@value='Send Payment']").click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_BILL_04_02_result")
 
@@ -235,23 +241,26 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
-
-            driver.find_element(By.NAME, "payee.name").send_keys("Negative Test")
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("City")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("ST")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("12345")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5553333333")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys("55555")
-            driver.find_element(By.NAME, "verifyAccount").send_keys("55555")
-            driver.find_element(By.NAME, "amount").send_keys("-100")
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
+
+            page = BillPayPage(driver, wait)
+            page.fill(
+                payee_name="Negative Test",
+                street="123 St",
+                city="City",
+                state="ST",
+                zip_code="12345",
+                phone="5553333333",
+                account="55555",
+                verify_account="55555",
+                amount="-100",
+            )
 
             self.take_screenshot(driver, "TC_BILL_05_01_negative_amount")
 
-            driver.find_element(By.XPATH, "//input[@value='Send Payment']").click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_BILL_05_02_result")
 
@@ -282,28 +291,31 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
 
             xss_payload = "<script>alert('XSS')</script>"
 
-            driver.find_element(By.NAME, "payee.name").send_keys(xss_payload)
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("City")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("ST")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("12345")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5554444444")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys("66666")
-            driver.find_element(By.NAME, "verifyAccount").send_keys("66666")
-            driver.find_element(By.NAME, "amount").send_keys("1")
+            page = BillPayPage(driver, wait)
+            page.fill(
+                payee_name=xss_payload,
+                street="123 St",
+                city="City",
+                state="ST",
+                zip_code="12345",
+                phone="5554444444",
+                account="66666",
+                verify_account="66666",
+                amount="1",
+            )
 
             try:
                 self.take_screenshot(driver, "TC_BILL_06_01_xss_attempt")
             except:
                 pass
 
-            driver.find_element(By.XPATH, "//input[@value='Send Payment']").click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             try:
                 self.take_screenshot(driver, "TC_BILL_06_02_result")
@@ -351,28 +363,31 @@ class TestBillPay:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/billpay.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/billpay.htm")
+            pause(2)
 
             sql_payload = "'; DROP TABLE accounts; --"
 
-            driver.find_element(By.NAME, "payee.name").send_keys("SQL Test")
-            driver.find_element(By.NAME, "payee.address.street").send_keys("123 St")
-            driver.find_element(By.NAME, "payee.address.city").send_keys("City")
-            driver.find_element(By.NAME, "payee.address.state").send_keys("ST")
-            driver.find_element(By.NAME, "payee.address.zipCode").send_keys("12345")
-            driver.find_element(By.NAME, "payee.phoneNumber").send_keys("5555555555")
-            driver.find_element(By.NAME, "payee.accountNumber").send_keys(sql_payload)
-            driver.find_element(By.NAME, "verifyAccount").send_keys(sql_payload)
-            driver.find_element(By.NAME, "amount").send_keys("1")
+            page = BillPayPage(driver, wait)
+            page.fill(
+                payee_name="SQL Test",
+                street="123 St",
+                city="City",
+                state="ST",
+                zip_code="12345",
+                phone="5555555555",
+                account=sql_payload,
+                verify_account=sql_payload,
+                amount="1",
+            )
 
             try:
                 self.take_screenshot(driver, "TC_BILL_07_01_sql_injection")
             except:
                 pass
 
-            driver.find_element(By.XPATH, "//input[@value='Send Payment']").click()
-            time.sleep(2)
+            page.send_button.click()
+            pause(2)
 
             try:
                 self.take_screenshot(driver, "TC_BILL_07_02_result")
@@ -10,8 +10,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from page_snapshot import page_state
+from pages import HOME_URL, FindTransactionsPage, LoginPanel
 
 class TestFindTransactions:
     def __init__(self):
@@ -25,34 +29,34 @@ class TestFindTransactions:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
-
-    def get_visible_text(self, driver):
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
+
+    def get_page_state(self, driver):
+        """Visible text and error state of the page in a single WebDriver call"""
+        return page_state(driver)
+
+    def get_visible_text(self, driver, state=None):
         """Get only visible text from the page, not HTML/JS/CSS"""
-        return driver.find_element(By.TAG_NAME, "body").text.lower()
+        state = state or self.get_page_state(driver)
+        return state["text"].lower()
 
-    def has_internal_error(self, driver):
+    def has_internal_error(self, driver, state=None):
         """Check specifically for internal error in visible page text"""
-        visible_text = self.get_visible_text(driver)
+        state = state or self.get_page_state(driver)
         # Only match the specific error message shown on error pages
-        return "an internal error has occurred" in visible_text
+        return state["internal_error"]
 
     def test_find_transactions_page_access(self):
         print("\n=== TC_FIND_01: Find Transactions Page Access ===")
@@ -63,14 +67,15 @@ class TestFindTransactions:
 
             find_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Find Transactions")))
             find_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_01_01_page_loaded")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: Internal error on page load")
                 self.failed += 1
             elif "find transactions" in visible_text and "select an account" in visible_text:
@@ -96,25 +101,26 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
-            trans_id_field = driver.find_element(By.ID, "transactionId")
+            trans_id_field = page.transaction_id
             trans_id_field.clear()
             trans_id_field.send_keys("12345")
 
             self.take_screenshot(driver, "TC_FIND_02_01_id_entered")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findById']")
+            find_button = page.find_by_id_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_02_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error when searching by Transaction ID")
                 self.failed += 1
             elif "transaction results" in visible_text:
@@ -140,25 +146,26 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
-            date_field = driver.find_element(By.ID, "transactionDate")
+            date_field = page.transaction_date
             date_field.clear()
             date_field.send_keys("01-01-2024")
 
             self.take_screenshot(driver, "TC_FIND_03_01_date_entered")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findByDate']")
+            find_button = page.find_by_date_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_03_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error when searching by Date")
                 self.failed += 1
             elif "transaction results" in visible_text:
@@ -184,25 +191,26 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
-            amount_field = driver.find_element(By.ID, "amount")
+            amount_field = page.amount
             amount_field.clear()
             amount_field.send_keys("100")
 
             self.take_screenshot(driver, "TC_FIND_04_01_amount_entered")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findByAmount']")
+            find_button = page.find_by_amount_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_04_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error when searching by Amount")
                 self.failed += 1
             elif "transaction results" in visible_text:
@@ -228,21 +236,22 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_05_01_empty_field")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findById']")
+            find_button = page.find_by_id_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_05_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error on empty Transaction ID")
                 self.failed += 1
             elif "invalid transaction id" in visible_text:
@@ -268,25 +277,26 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
-            date_field = driver.find_element(By.ID, "transactionDate")
+            date_field = page.transaction_date
             date_field.clear()
             date_field.send_keys("not-a-date")
 
             self.take_screenshot(driver, "TC_FIND_06_01_invalid_date")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findByDate']")
+            find_button = page.find_by_date_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_06_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for internal error FIRST
-            if self.has_internal_error(driver):
+            if self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error on invalid date format")
                 self.failed += 1
             elif "invalid date" in visible_text:
@@ -312,23 +322,24 @@ class TestFindTransactions:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/findtrans.htm")
-            time.sleep(2)
+            page = FindTransactionsPage(driver, wait).open()
+            pause(2)
 
             sql_payload = "' OR '1'='1"
-            trans_id_field = driver.find_element(By.ID, "transactionId")
+            trans_id_field = page.transaction_id
             trans_id_field.clear()
             trans_id_field.send_keys(sql_payload)
 
             self.take_screenshot(driver, "TC_FIND_07_01_sql_injection")
 
-            find_button = driver.find_element(By.XPATH, "//button[@id='findById']")
+            find_button = page.find_by_id_button.resolve()
             driver.execute_script("arguments[0].click();", find_button)
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FIND_07_02_result")
 
-            visible_text = self.get_visible_text(driver)
+            state = self.get_page_state(driver)
+            visible_text = self.get_visible_text(driver, state)
 
             # Check for SQL exposure FIRST (security issue)
             sql_keywords = ["sqlexception", "jdbc", "mysql", "postgresql", "oracle", "syntax error"]
@@ -337,7 +348,7 @@ class TestFindTransactions:
             if sql_exposed:
                 print("[FAIL] FAIL: SECURITY BUG - SQL error details exposed to user")
                 self.failed += 1
-            elif self.has_internal_error(driver):
+            elif self.has_internal_error(driver, state):
                 print("[FAIL] FAIL: BUG FOUND - Internal server error on SQL injection attempt")
                 self.failed += 1
             elif "invalid transaction id" in visible_text:
@@ -8,8 +8,12 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL
+from form_filler import fill_form
 
 class TestForgotLoginInfo:
     def __init__(self):
@@ -23,29 +27,27 @@ class TestForgotLoginInfo:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def test_forgot_login_link_access(self):
         print("\n=== TC_FORGOT_01: Forgot Login Link Access ===")
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com")
-            time.sleep(2)
+            driver.get(HOME_URL)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_01_01_home_page")
 
             forgot_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Forgot login info?")))
             forgot_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_01_02_forgot_page")
 
@@ -71,8 +73,8 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_02_01_lookup_page")
 
@@ -108,23 +110,25 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
 
             # Use known test data
-            driver.find_element(By.ID, "firstName").send_keys("John")
-            driver.find_element(By.ID, "lastName").send_keys("Doe")
-            driver.find_element(By.ID, "address.street").send_keys("123 Main St")
-            driver.find_element(By.ID, "address.city").send_keys("New York")
-            driver.find_element(By.ID, "address.state").send_keys("NY")
-            driver.find_element(By.ID, "address.zipCode").send_keys("10001")
-            driver.find_element(By.ID, "ssn").send_keys("123-45-6789")
+            fill_form(driver, {
+                "firstName": "John",
+                "lastName": "Doe",
+                "address.street": "123 Main St",
+                "address.city": "New York",
+                "address.state": "NY",
+                "address.zipCode": "10001",
+                "ssn": "123-45-6789",
+            })
 
             self.take_screenshot(driver, "TC_FORGOT_03_01_form_filled")
 
             find_button = driver.find_element(By.XPATH, "//input[@value='Find My Login Info']")
             find_button.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_03_02_result")
 
@@ -156,14 +160,14 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_04_01_empty_form")
 
             find_button = driver.find_element(By.XPATH, "//input[@value='Find My Login Info']")
             find_button.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_04_02_result")
 
@@ -189,22 +193,24 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
-
-            driver.find_element(By.ID, "firstName").send_keys("NonExistent")
-            driver.find_element(By.ID, "lastName").send_keys("User")
-            driver.find_element(By.ID, "address.street").send_keys("999 Fake St")
-            driver.find_element(By.ID, "address.city").send_keys("Nowhere")
-            driver.find_element(By.ID, "address.state").send_keys("XX")
-            driver.find_element(By.ID, "address.zipCode").send_keys("00000")
-            driver.find_element(By.ID, "ssn").send_keys("000-00-0000")
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
+
+            fill_form(driver, {
+                "firstName": "NonExistent",
+                "lastName": "User",
+                "address.street": "999 Fake St",
+                "address.city": "Nowhere",
+                "address.state": "XX",
+                "address.zipCode": "00000",
+                "ssn": "000-00-0000",
+            })
 
             self.take_screenshot(driver, "TC_FORGOT_05_01_invalid_user")
 
             find_button = driver.find_element(By.XPATH, "//input[@value='Find My Login Info']")
             find_button.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_05_02_result")
 
@@ -233,24 +239,26 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
 
             sql_payload = "' OR '1'='1"
 
-            driver.find_element(By.ID, "firstName").send_keys("Test")
-            driver.find_element(By.ID, "lastName").send_keys("User")
-            driver.find_element(By.ID, "address.street").send_keys("123 St")
-            driver.find_element(By.ID, "address.city").send_keys("City")
-            driver.find_element(By.ID, "address.state").send_keys("ST")
-            driver.find_element(By.ID, "address.zipCode").send_keys("12345")
-            driver.find_element(By.ID, "ssn").send_keys(sql_payload)
+            fill_form(driver, {
+                "firstName": "Test",
+                "lastName": "User",
+                "address.street": "123 St",
+                "address.city": "City",
+                "address.state": "ST",
+                "address.zipCode": "12345",
+                "ssn": sql_payload,
+            })
 
             self.take_screenshot(driver, "TC_FORGOT_06_01_sql_injection")
 
             find_button = driver.find_element(By.XPATH, "//input[@value='Find My Login Info']")
             find_button.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_06_02_result")
 
@@ -287,23 +295,25 @@ class TestForgotLoginInfo:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/lookup.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/lookup.htm")
+            pause(2)
 
             # Try with known user pattern
-            driver.find_element(By.ID, "firstName").send_keys("John")
-            driver.find_element(By.ID, "lastName").send_keys("Smith")
-            driver.find_element(By.ID, "address.street").send_keys("123 St")
-            driver.find_element(By.ID, "address.city").send_keys("City")
-            driver.find_element(By.ID, "address.state").send_keys("ST")
-            driver.find_element(By.ID, "address.zipCode").send_keys("12345")
-            driver.find_element(By.ID, "ssn").send_keys("123456789")
+            fill_form(driver, {
+                "firstName": "John",
+                "lastName": "Smith",
+                "address.street": "123 St",
+                "address.city": "City",
+                "address.state": "ST",
+                "address.zipCode": "12345",
+                "ssn": "123456789",
+            })
 
             self.take_screenshot(driver, "TC_FORGOT_07_01_lookup_attempt")
 
             find_button = driver.find_element(By.XPATH, "//input[@value='Find My Login Info']")
             find_button.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_FORGOT_07_02_result")
 
@@ -8,8 +8,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL, LoginPanel
 
 class TestLogout:
     def __init__(self):
@@ -23,24 +26,19 @@ class TestLogout:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_logout_link_visible(self):
         print("\n=== TC_LOGOUT_01: Logout Link Visible After Login ===")
@@ -84,13 +82,13 @@ class TestLogout:
             self.take_screenshot(driver, "TC_LOGOUT_02_01_before_logout")
 
             logout_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_02_02_after_logout")
 
             # Check if redirected to home/login page
             try:
-                login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
+                LoginPanel(driver).login_button.resolve()
                 print("[PASS] PASS: Logout successful, redirected to login page")
                 self.passed += 1
             except:
@@ -115,11 +113,11 @@ class TestLogout:
 
             logout_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Log Out")))
             logout_link.click()
-            time.sleep(2)
+            pause(2)
 
             # Try to access protected page directly
-            driver.get("https://parabank.parasoft.com/parabank/overview.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/overview.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_03_01_protected_access")
 
@@ -132,7 +130,7 @@ class TestLogout:
             else:
                 # Check if login form is shown
                 try:
-                    driver.find_element(By.NAME, "username")
+                    LoginPanel(driver).username.resolve()
                     print("[PASS] PASS: Protected page redirects to login after logout")
                     self.passed += 1
                 except:
@@ -160,19 +158,19 @@ class TestLogout:
             self.login(driver, wait)
 
             # Navigate to a protected page
-            driver.get("https://parabank.parasoft.com/parabank/overview.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/overview.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_04_01_protected_page")
 
             # Logout
             logout_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Log Out")))
             logout_link.click()
-            time.sleep(2)
+            pause(2)
 
             # Click back button
             driver.back()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_04_02_after_back")
 
@@ -200,8 +198,8 @@ class TestLogout:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com")
-            time.sleep(2)
+            driver.get(HOME_URL)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_05_01_before_login")
 
@@ -238,7 +236,7 @@ class TestLogout:
 
             logout_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Log Out")))
             logout_link.click()
-            time.sleep(1)
+            pause(1)
 
             self.take_screenshot(driver, "TC_LOGOUT_06_01_first_logout")
 
@@ -246,7 +244,7 @@ class TestLogout:
             try:
                 logout_link2 = driver.find_element(By.LINK_TEXT, "Log Out")
                 logout_link2.click()
-                time.sleep(1)
+                pause(1)
 
                 self.take_screenshot(driver, "TC_LOGOUT_06_02_second_logout")
 
@@ -280,7 +278,7 @@ class TestLogout:
 
             logout_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Log Out")))
             logout_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGOUT_07_02_after_logout")
 
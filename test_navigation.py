@@ -8,8 +8,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import HOME_URL, LoginPanel
 
 class TestNavigationMenu:
     def __init__(self):
@@ -23,24 +26,19 @@ class TestNavigationMenu:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_all_nav_links_present(self):
         print("\n=== TC_NAV_01: All Navigation Links Present After Login ===")
@@ -95,7 +93,7 @@ class TestNavigationMenu:
             
             link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Open New Account")))
             link.click()
-            time.sleep(2)
+            pause(2)
             
             self.take_screenshot(driver, "TC_NAV_02_01_open_account_page")
             
@@ -125,7 +123,7 @@ class TestNavigationMenu:
             
             link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Transfer Funds")))
             link.click()
-            time.sleep(2)
+            pause(2)
             
             self.take_screenshot(driver, "TC_NAV_03_01_transfer_page")
             
@@ -151,8 +149,8 @@ class TestNavigationMenu:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com")
-            time.sleep(2)
+            driver.get(HOME_URL)
+            pause(2)
             
             self.take_screenshot(driver, "TC_NAV_04_01_before_login")
             
@@ -198,7 +196,7 @@ class TestNavigationMenu:
             
             # Navigate to another page
             driver.find_element(By.LINK_TEXT, "Bill Pay").click()
-            time.sleep(2)
+            pause(2)
             
             nav_links_billpay = len(driver.find_elements(By.XPATH, "//div[@id='leftPanel']//a"))
             
@@ -236,7 +234,7 @@ class TestNavigationMenu:
             for link_text in link_texts[:5]:  # Test first 5 to save time
                 try:
                     driver.find_element(By.LINK_TEXT, link_text).click()
-                    time.sleep(1)
+                    pause(1)
                     
                     page_source = driver.page_source.lower()
                     if "404" in page_source or "not found" in page_source or "error" in driver.title.lower():
@@ -244,7 +242,7 @@ class TestNavigationMenu:
                     
                     # Go back to main page
                     driver.find_element(By.LINK_TEXT, "Accounts Overview").click()
-                    time.sleep(1)
+                    pause(1)
                 except:
                     broken_links.append(link_text)
             
@@ -275,7 +273,7 @@ class TestNavigationMenu:
             
             # Navigate to a different page first
             driver.find_element(By.LINK_TEXT, "Bill Pay").click()
-            time.sleep(2)
+            pause(2)
             
             self.take_screenshot(driver, "TC_NAV_07_01_on_billpay")
             
@@ -291,7 +289,7 @@ class TestNavigationMenu:
                 except:
                     driver.find_element(By.XPATH, "//div[@id='topPanel']//a").click()
             
-            time.sleep(2)
+            pause(2)
             
             self.take_screenshot(driver, "TC_NAV_07_02_after_logo_click")
             
@@ -9,8 +9,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import HOME_URL, LoginPanel, RequestLoanPage
 
 class TestRequestLoan:
     def __init__(self):
@@ -24,24 +27,19 @@ class TestRequestLoan:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_loan_page_access(self):
         print("\n=== TC_LOAN_01: Request Loan Page Access ===")
@@ -52,15 +50,16 @@ class TestRequestLoan:
 
             loan_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Request Loan")))
             loan_link.click()
-            time.sleep(2)
+            pause(2)
+            page = RequestLoanPage(driver, wait)
 
             self.take_screenshot(driver, "TC_LOAN_01_01_loan_page")
 
             # Check required fields
             try:
-                driver.find_element(By.ID, "amount")
-                driver.find_element(By.ID, "downPayment")
-                driver.find_element(By.ID, "fromAccountId")
+                page.amount.resolve()
+                page.down_payment.resolve()
+                page.from_account.resolve()
                 print("[PASS] PASS: Loan request page loaded with all fields")
                 self.passed += 1
             except:
@@ -83,17 +82,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
-            driver.find_element(By.ID, "amount").send_keys("1000")
-            driver.find_element(By.ID, "downPayment").send_keys("100")
+            page.amount.send_keys("1000")
+            page.down_payment.send_keys("100")
 
             self.take_screenshot(driver, "TC_LOAN_02_01_form_filled")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(3)
+            page.apply_button.click()
+            pause(3)
 
             self.take_screenshot(driver, "TC_LOAN_02_02_result")
 
@@ -121,17 +119,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
-            driver.find_element(By.ID, "amount").send_keys("5000")
-            driver.find_element(By.ID, "downPayment").send_keys("0")
+            page.amount.send_keys("5000")
+            page.down_payment.send_keys("0")
 
             self.take_screenshot(driver, "TC_LOAN_03_01_zero_downpayment")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(3)
+            page.apply_button.click()
+            pause(3)
 
             self.take_screenshot(driver, "TC_LOAN_03_02_result")
 
@@ -165,17 +162,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
             # Only fill down payment
-            driver.find_element(By.ID, "downPayment").send_keys("100")
+            page.down_payment.send_keys("100")
 
             self.take_screenshot(driver, "TC_LOAN_04_01_empty_amount")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(2)
+            page.apply_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOAN_04_02_result")
 
@@ -209,17 +205,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
-            driver.find_element(By.ID, "amount").send_keys("-5000")
-            driver.find_element(By.ID, "downPayment").send_keys("100")
+            page.amount.send_keys("-5000")
+            page.down_payment.send_keys("100")
 
             self.take_screenshot(driver, "TC_LOAN_05_01_negative_amount")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(2)
+            page.apply_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOAN_05_02_result")
 
@@ -253,17 +248,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
-            driver.find_element(By.ID, "amount").send_keys("999999999999")
-            driver.find_element(By.ID, "downPayment").send_keys("100")
+            page.amount.send_keys("999999999999")
+            page.down_payment.send_keys("100")
 
             self.take_screenshot(driver, "TC_LOAN_06_01_huge_amount")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(3)
+            page.apply_button.click()
+            pause(3)
 
             self.take_screenshot(driver, "TC_LOAN_06_02_result")
 
@@ -300,17 +294,16 @@ class TestRequestLoan:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/requestloan.htm")
-            time.sleep(2)
+            page = RequestLoanPage(driver, wait).open()
+            pause(2)
 
-            driver.find_element(By.ID, "amount").send_keys("1000<script>alert(1)</script>")
-            driver.find_element(By.ID, "downPayment").send_keys("100")
+            page.amount.send_keys("1000<script>alert(1)</script>")
+            page.down_payment.send_keys("100")
 
             self.take_screenshot(driver, "TC_LOAN_07_01_special_chars")
 
-            apply_button = driver.find_element(By.XPATH, "//input[@value='Apply Now']")
-            apply_button.click()
-            time.sleep(2)
+            page.apply_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOAN_07_02_result")
 
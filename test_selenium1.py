@@ -8,10 +8,14 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
 import random
 import string
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from page_snapshot import page_snapshot
+from pages import HOME_URL, RegisterPage
 
 class TestRegistration:
     def __init__(self):
@@ -26,15 +30,13 @@ class TestRegistration:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def generate_unique_username(self):
         return "testuser_" + ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
@@ -44,8 +46,8 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com")
-            time.sleep(2)
+            driver.get(HOME_URL)
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_01_01_homepage")
 
@@ -53,29 +55,31 @@ class TestRegistration:
                 EC.element_to_be_clickable((By.LINK_TEXT, "Register"))
             )
             register_link.click()
-            time.sleep(2)
+            pause(2)
+            page = RegisterPage(driver, wait)
 
             self.take_screenshot(driver, "TC_REG_01_02_registration_page")
 
             unique_username = self.generate_unique_username()
 
-            driver.find_element(By.ID, "customer.firstName").send_keys("John")
-            driver.find_element(By.ID, "customer.lastName").send_keys("Doe")
-            driver.find_element(By.ID, "customer.address.street").send_keys("123 Main St")
-            driver.find_element(By.ID, "customer.address.city").send_keys("New York")
-            driver.find_element(By.ID, "customer.address.state").send_keys("NY")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("10001")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5551234567")
-            driver.find_element(By.ID, "customer.ssn").send_keys("123-45-6789")
-            driver.find_element(By.ID, "customer.username").send_keys(unique_username)
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Test@1234")
+            page.fill(
+                first_name="John",
+                last_name="Doe",
+                street="123 Main St",
+                city="New York",
+                state="NY",
+                zip_code="10001",
+                phone="5551234567",
+                ssn="123-45-6789",
+                username=unique_username,
+                password="Test@1234",
+                repeated_password="Test@1234",
+            )
 
             self.take_screenshot(driver, "TC_REG_01_03_form_filled")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(3)
+            page.register_button.click()
+            pause(3)
 
             try:
                 welcome_message = wait.until(
@@ -86,7 +90,8 @@ class TestRegistration:
                 self.passed += 1
             except:
                 self.take_screenshot(driver, "TC_REG_01_04_result")
-                if "Welcome" in driver.page_source or "created" in driver.page_source.lower():
+                snapshot = page_snapshot(driver)
+                if "Welcome" in snapshot.source or "created" in snapshot.source_lower:
                     print(f"[PASS] PASS: User registration completed successfully")
                     self.passed += 1
                 else:
@@ -107,14 +112,13 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
+            page = RegisterPage(driver, wait).open()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_02_01_empty_form")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_02_02_validation_errors")
 
@@ -140,26 +144,27 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
-
-            driver.find_element(By.ID, "customer.firstName").send_keys("Jane")
-            driver.find_element(By.ID, "customer.lastName").send_keys("Smith")
-            driver.find_element(By.ID, "customer.address.street").send_keys("456 Oak Ave")
-            driver.find_element(By.ID, "customer.address.city").send_keys("Boston")
-            driver.find_element(By.ID, "customer.address.state").send_keys("MA")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("02101")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5559876543")
-            driver.find_element(By.ID, "customer.ssn").send_keys("987-65-4321")
-            driver.find_element(By.ID, "customer.username").send_keys("john")
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Test@1234")
+            page = RegisterPage(driver, wait).open()
+            pause(2)
+
+            page.fill(
+                first_name="Jane",
+                last_name="Smith",
+                street="456 Oak Ave",
+                city="Boston",
+                state="MA",
+                zip_code="02101",
+                phone="5559876543",
+                ssn="987-65-4321",
+                username="john",
+                password="Test@1234",
+                repeated_password="Test@1234",
+            )
 
             self.take_screenshot(driver, "TC_REG_03_01_duplicate_username")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_03_02_result")
 
@@ -191,26 +196,27 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
-
-            driver.find_element(By.ID, "customer.firstName").send_keys("Mike")
-            driver.find_element(By.ID, "customer.lastName").send_keys("Johnson")
-            driver.find_element(By.ID, "customer.address.street").send_keys("789 Pine Rd")
-            driver.find_element(By.ID, "customer.address.city").send_keys("Chicago")
-            driver.find_element(By.ID, "customer.address.state").send_keys("IL")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("60601")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5551112222")
-            driver.find_element(By.ID, "customer.ssn").send_keys("111-22-3333")
-            driver.find_element(By.ID, "customer.username").send_keys(self.generate_unique_username())
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Different@5678")
+            page = RegisterPage(driver, wait).open()
+            pause(2)
+
+            page.fill(
+                first_name="Mike",
+                last_name="Johnson",
+                street="789 Pine Rd",
+                city="Chicago",
+                state="IL",
+                zip_code="60601",
+                phone="5551112222",
+                ssn="111-22-3333",
+                username=self.generate_unique_username(),
+                password="Test@1234",
+                repeated_password="Different@5678",
+            )
 
             self.take_screenshot(driver, "TC_REG_04_01_password_mismatch")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_04_02_result")
 
@@ -242,27 +248,28 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
+            page = RegisterPage(driver, wait).open()
+            pause(2)
 
             unique_username = self.generate_unique_username()
-            driver.find_element(By.ID, "customer.firstName").send_keys("Sarah")
-            driver.find_element(By.ID, "customer.lastName").send_keys("Williams")
-            driver.find_element(By.ID, "customer.address.street").send_keys("321 Elm St")
-            driver.find_element(By.ID, "customer.address.city").send_keys("Miami")
-            driver.find_element(By.ID, "customer.address.state").send_keys("FL")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("33101")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5553334444")
-            driver.find_element(By.ID, "customer.ssn").send_keys("12345")  # Invalid format
-            driver.find_element(By.ID, "customer.username").send_keys(unique_username)
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Test@1234")
+            page.fill(
+                first_name="Sarah",
+                last_name="Williams",
+                street="321 Elm St",
+                city="Miami",
+                state="FL",
+                zip_code="33101",
+                phone="5553334444",
+                ssn="12345",  # Invalid format
+                username=unique_username,
+                password="Test@1234",
+                repeated_password="Test@1234",
+            )
 
             self.take_screenshot(driver, "TC_REG_05_01_invalid_ssn")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_05_02_result")
 
@@ -292,29 +299,30 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
+            page = RegisterPage(driver, wait).open()
+            pause(2)
 
             # SQL injection attempt in username field
             sql_injection = "'; DROP TABLE users; --"
 
-            driver.find_element(By.ID, "customer.firstName").send_keys("Test")
-            driver.find_element(By.ID, "customer.lastName").send_keys("Security")
-            driver.find_element(By.ID, "customer.address.street").send_keys("123 Security St")
-            driver.find_element(By.ID, "customer.address.city").send_keys("SecureCity")
-            driver.find_element(By.ID, "customer.address.state").send_keys("SC")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("12345")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5550000000")
-            driver.find_element(By.ID, "customer.ssn").send_keys("000-00-0000")
-            driver.find_element(By.ID, "customer.username").send_keys(sql_injection)
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Test@1234")
+            page.fill(
+                first_name="Test",
+                last_name="Security",
+                street="123 Security St",
+                city="SecureCity",
+                state="SC",
+                zip_code="12345",
+                phone="5550000000",
+                ssn="000-00-0000",
+                username=sql_injection,
+                password="Test@1234",
+                repeated_password="Test@1234",
+            )
 
             self.take_screenshot(driver, "TC_REG_06_01_sql_injection_attempt")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_06_02_result")
 
@@ -342,30 +350,31 @@ class TestRegistration:
         driver = None
         try:
             driver, wait = self.create_driver()
-            driver.get("https://parabank.parasoft.com/parabank/register.htm")
-            time.sleep(2)
+            page = RegisterPage(driver, wait).open()
+            pause(2)
 
             # XSS attempt in name fields
             xss_payload = "<script>alert('XSS')</script>"
             unique_username = self.generate_unique_username()
 
-            driver.find_element(By.ID, "customer.firstName").send_keys(xss_payload)
-            driver.find_element(By.ID, "customer.lastName").send_keys("TestXSS")
-            driver.find_element(By.ID, "customer.address.street").send_keys("123 XSS St")
-            driver.find_element(By.ID, "customer.address.city").send_keys("XSSCity")
-            driver.find_element(By.ID, "customer.address.state").send_keys("XS")
-            driver.find_element(By.ID, "customer.address.zipCode").send_keys("00000")
-            driver.find_element(By.ID, "customer.phoneNumber").send_keys("5551111111")
-            driver.find_element(By.ID, "customer.ssn").send_keys("111-11-1111")
-            driver.find_element(By.ID, "customer.username").send_keys(unique_username)
-            driver.find_element(By.ID, "customer.password").send_keys("Test@1234")
-            driver.find_element(By.ID, "repeatedPassword").send_keys("Test@1234")
+            page.fill(
+                first_name=xss_payload,
+                last_name="TestXSS",
+                street="123 XSS St",
+                city="XSSCity",
+                state="XS",
+                zip_code="00000",
+                phone="5551111111",
+                ssn="111-11-1111",
+                username=unique_username,
+                password="Test@1234",
+                repeated_password="Test@1234",
+            )
 
             self.take_screenshot(driver, "TC_REG_07_01_xss_attempt")
 
-            register_button = driver.find_element(By.XPATH, "//input[@value='Register']")
-            register_button.click()
-            time.sleep(2)
+            page.register_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_REG_07_02_result")
 
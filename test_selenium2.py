@@ -9,8 +9,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL, LoginPanel
 
 class TestLogin:
     def __init__(self):
@@ -25,21 +28,19 @@ class TestLogin:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
         """Capture screenshot at critical test moments"""
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def setup(self, driver):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
     def test_valid_login(self):
         print("\n=== TC_LOGIN_01: Valid Login Test ===")
@@ -50,20 +51,16 @@ class TestLogin:
 
             self.take_screenshot(driver, "TC_LOGIN_01_01_login_page")
 
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys("john")
+            page = LoginPanel(driver, wait)
+            page.username.send_keys("john")
 
-            password_field = driver.find_element(By.NAME, "password")
-            password_field.send_keys("demo")
+            page.password.send_keys("demo")
 
             self.take_screenshot(driver, "TC_LOGIN_01_02_credentials_entered")
 
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            page.login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             try:
                 accounts_overview = wait.until(
@@ -93,20 +90,16 @@ class TestLogin:
             driver, wait = self.create_driver()
             self.setup(driver)
 
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys("invaliduser999")
+            page = LoginPanel(driver, wait)
+            page.username.send_keys("invaliduser999")
 
-            password_field = driver.find_element(By.NAME, "password")
-            password_field.send_keys("demo")
+            page.password.send_keys("demo")
 
             self.take_screenshot(driver, "TC_LOGIN_02_01_invalid_username_entered")
 
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            page.login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             page_source = driver.page_source.lower()
 
@@ -140,20 +133,16 @@ class TestLogin:
             driver, wait = self.create_driver()
             self.setup(driver)
 
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys("john")
+            page = LoginPanel(driver, wait)
+            page.username.send_keys("john")
 
-            password_field = driver.find_element(By.NAME, "password")
-            password_field.send_keys("wrongpassword123")
+            page.password.send_keys("wrongpassword123")
 
             self.take_screenshot(driver, "TC_LOGIN_03_01_invalid_password_entered")
 
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            page.login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             page_source = driver.page_source.lower()
 
@@ -190,11 +179,11 @@ class TestLogin:
             self.take_screenshot(driver, "TC_LOGIN_04_01_empty_fields")
 
             login_button = wait.until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@value='Log In']"))
+                EC.element_to_be_clickable(LoginPanel.login_button.target)
             )
             login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             try:
                 error_message = wait.until(
@@ -224,17 +213,14 @@ class TestLogin:
             driver, wait = self.create_driver()
             self.setup(driver)
 
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys("john")
+            page = LoginPanel(driver, wait)
+            page.username.send_keys("john")
 
             self.take_screenshot(driver, "TC_LOGIN_05_01_username_only")
 
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            page.login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             try:
                 error_message = wait.until(
@@ -268,20 +254,16 @@ class TestLogin:
             # SQL injection payload
             sql_injection = "' OR '1'='1"
 
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys(sql_injection)
+            page = LoginPanel(driver, wait)
+            page.username.send_keys(sql_injection)
 
-            password_field = driver.find_element(By.NAME, "password")
-            password_field.send_keys(sql_injection)
+            page.password.send_keys(sql_injection)
 
             self.take_screenshot(driver, "TC_LOGIN_06_01_sql_injection_attempt")
 
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            page.login_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGIN_06_02_result")
 
@@ -318,18 +300,9 @@ class TestLogin:
             self.setup(driver)
 
             # First, login successfully
-            username_field = wait.until(
-                EC.presence_of_element_located((By.NAME, "username"))
-            )
-            username_field.send_keys("john")
-
-            password_field = driver.find_element(By.NAME, "password")
-            password_field.send_keys("demo")
-
-            login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-            login_button.click()
+            LoginPanel(driver, wait).log_in("john", "demo")
 
-            time.sleep(2)
+            pause(2)
 
             # Verify login success
             wait.until(
@@ -344,13 +317,13 @@ class TestLogin:
             )
             logout_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGIN_07_02_after_logout")
 
             # Try to access protected page directly (more reliable than back button)
-            driver.get("https://parabank.parasoft.com/parabank/overview.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/overview.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_LOGIN_07_03_direct_access_attempt")
 
@@ -366,7 +339,7 @@ class TestLogin:
             # Check if login form is present (properly logged out)
             login_form_present = False
             try:
-                driver.find_element(By.NAME, "username")
+                LoginPanel(driver).username.resolve()
                 login_form_present = True
             except:
                 pass
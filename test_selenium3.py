@@ -10,8 +10,12 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from table_extract import extract_table
+from pages import HOME_URL, LoginPanel
 
 class TestOpenAccount:
     def __init__(self):
@@ -26,35 +30,23 @@ class TestOpenAccount:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
         """Capture screenshot at critical test moments"""
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def setup(self, driver):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
     def login(self, driver, wait):
-        username_field = wait.until(
-            EC.presence_of_element_located((By.NAME, "username"))
-        )
-        username_field.send_keys("john")
-
-        password_field = driver.find_element(By.NAME, "password")
-        password_field.send_keys("demo")
-
-        login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-        login_button.click()
-
-        time.sleep(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_open_checking_account(self):
         print("\n=== TC_OPEN_01: Open New Checking Account Successfully ===")
@@ -69,7 +61,7 @@ class TestOpenAccount:
             )
             open_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_OPEN_01_01_open_account_page")
 
@@ -81,7 +73,7 @@ class TestOpenAccount:
             open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
             open_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 success_message = wait.until(
@@ -118,7 +110,7 @@ class TestOpenAccount:
             )
             open_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             account_type_dropdown = Select(driver.find_element(By.ID, "type"))
             account_type_dropdown.select_by_visible_text("SAVINGS")
@@ -128,7 +120,7 @@ class TestOpenAccount:
             open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
             open_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 success_message = wait.until(
@@ -165,14 +157,14 @@ class TestOpenAccount:
             )
             open_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_OPEN_03_01_default_selection")
 
             open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
             open_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 success_message = wait.until(
@@ -209,7 +201,7 @@ class TestOpenAccount:
             )
             accounts_overview_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             initial_balance_elements = driver.find_elements(By.XPATH, "//table[@id='accountTable']//tr[1]//td[2]")
             if initial_balance_elements:
@@ -223,12 +215,12 @@ class TestOpenAccount:
             )
             open_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
             open_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 new_account_id = driver.find_element(By.ID, "newAccountId").text
@@ -238,7 +230,7 @@ class TestOpenAccount:
                 new_account_link = driver.find_element(By.ID, "newAccountId")
                 new_account_link.click()
 
-                time.sleep(2)
+                pause(2)
 
                 # Try to get balance
                 try:
@@ -280,10 +272,9 @@ class TestOpenAccount:
                 EC.element_to_be_clickable((By.LINK_TEXT, "Accounts Overview"))
             )
             accounts_overview_link.click()
-            time.sleep(2)
+            pause(2)
 
-            initial_accounts = driver.find_elements(By.XPATH, "//table[@id='accountTable']//tbody/tr")
-            initial_count = len(initial_accounts)
+            initial_count = len(extract_table(driver, "accountTable")["body"])
 
             self.take_screenshot(driver, "TC_OPEN_05_01_initial_count")
 
@@ -292,11 +283,11 @@ class TestOpenAccount:
                 EC.element_to_be_clickable((By.LINK_TEXT, "Open New Account"))
             )
             open_account_link.click()
-            time.sleep(2)
+            pause(2)
 
             open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
             open_button.click()
-            time.sleep(3)
+            pause(3)
 
             new_account_id = driver.find_element(By.ID, "newAccountId").text
 
@@ -307,22 +298,17 @@ class TestOpenAccount:
                 EC.element_to_be_clickable((By.LINK_TEXT, "Accounts Overview"))
             )
             accounts_overview_link.click()
-            time.sleep(2)
+            pause(2)
 
             # Verify new account count
-            updated_accounts = driver.find_elements(By.XPATH, "//table[@id='accountTable']//tbody/tr")
-            updated_count = len(updated_accounts)
+            account_table = extract_table(driver, "accountTable")
+            updated_count = len(account_table["body"])
 
             self.take_screenshot(driver, "TC_OPEN_05_03_updated_count")
 
             # Check if new account ID is in the list
-            account_ids = []
-            for acc in updated_accounts:
-                try:
-                    link = acc.find_element(By.XPATH, "./td[1]/a")
-                    account_ids.append(link.text)
-                except:
-                    pass  # Skip rows without account links (e.g., totals row)
+            account_ids = [row[0] for row, links in zip(account_table["body"], account_table["body_links"])
+                           if links and links[0]]  # Skip rows without account links (e.g., totals row)
 
             if new_account_id in account_ids and updated_count == initial_count + 1:
                 print(f"[PASS] PASS: New account {new_account_id} appears in accounts list (Count: {initial_count} -> {updated_count})")
@@ -360,7 +346,7 @@ class TestOpenAccount:
                     EC.element_to_be_clickable((By.LINK_TEXT, "Open New Account"))
                 )
                 open_account_link.click()
-                time.sleep(1)
+                pause(1)
 
                 # Alternate between CHECKING and SAVINGS
                 account_type = "CHECKING" if i % 2 == 0 else "SAVINGS"
@@ -369,7 +355,7 @@ class TestOpenAccount:
 
                 open_button = driver.find_element(By.XPATH, "//input[@value='Open New Account']")
                 open_button.click()
-                time.sleep(2)
+                pause(2)
 
                 try:
                     new_account_id = driver.find_element(By.ID, "newAccountId").text
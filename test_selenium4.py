@@ -10,8 +10,11 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import HOME_URL, LoginPanel, TransferPage
 
 class TestTransferFunds:
     def __init__(self):
@@ -26,35 +29,23 @@ class TestTransferFunds:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
         """Capture screenshot at critical test moments"""
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def setup(self, driver):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
     def login(self, driver, wait):
-        username_field = wait.until(
-            EC.presence_of_element_located((By.NAME, "username"))
-        )
-        username_field.send_keys("john")
-
-        password_field = driver.find_element(By.NAME, "password")
-        password_field.send_keys("demo")
-
-        login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-        login_button.click()
-
-        time.sleep(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_valid_transfer(self):
         print("\n=== TC_TRANSFER_01: Valid Transfer Between Accounts ===")
@@ -69,21 +60,18 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_TRANSFER_01_01_transfer_page")
 
-            amount_field = wait.until(
-                EC.presence_of_element_located((By.ID, "amount"))
-            )
-            amount_field.send_keys("100")
+            page = TransferPage(driver, wait)
+            page.amount.send_keys("100")
 
             self.take_screenshot(driver, "TC_TRANSFER_01_02_amount_entered")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 success_message = wait.until(
@@ -119,19 +107,16 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
-            amount_field = wait.until(
-                EC.presence_of_element_located((By.ID, "amount"))
-            )
-            amount_field.send_keys("999999999")
+            page = TransferPage(driver, wait)
+            page.amount.send_keys("999999999")
 
             self.take_screenshot(driver, "TC_TRANSFER_02_01_large_amount")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_TRANSFER_02_02_result")
 
@@ -171,19 +156,16 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
-            amount_field = wait.until(
-                EC.presence_of_element_located((By.ID, "amount"))
-            )
-            amount_field.send_keys("0")
+            page = TransferPage(driver, wait)
+            page.amount.send_keys("0")
 
             self.take_screenshot(driver, "TC_TRANSFER_03_01_zero_amount")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_TRANSFER_03_02_result")
 
@@ -220,15 +202,15 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_TRANSFER_04_01_empty_amount_form")
 
             # Do NOT enter any amount - leave field empty
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page = TransferPage(driver, wait)
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_TRANSFER_04_02_result")
 
@@ -268,19 +250,16 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
-            amount_field = wait.until(
-                EC.presence_of_element_located((By.ID, "amount"))
-            )
-            amount_field.send_keys("25.75")
+            page = TransferPage(driver, wait)
+            page.amount.send_keys("25.75")
 
             self.take_screenshot(driver, "TC_TRANSFER_05_01_decimal_amount")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             try:
                 success_message = wait.until(
@@ -317,19 +296,16 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
-            amount_field = wait.until(
-                EC.presence_of_element_located((By.ID, "amount"))
-            )
-            amount_field.send_keys("-100")
+            page = TransferPage(driver, wait)
+            page.amount.send_keys("-100")
 
             self.take_screenshot(driver, "TC_TRANSFER_06_01_negative_amount")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_TRANSFER_06_02_result")
 
@@ -367,11 +343,12 @@ class TestTransferFunds:
             )
             transfer_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             # Select the same account for both from and to
-            from_account = Select(driver.find_element(By.ID, "fromAccountId"))
-            to_account = Select(driver.find_element(By.ID, "toAccountId"))
+            page = TransferPage(driver, wait)
+            from_account = Select(page.from_account.resolve())
+            to_account = Select(page.to_account.resolve())
 
             # Get the first account option
             first_option = from_account.options[0].get_attribute("value")
@@ -379,15 +356,13 @@ class TestTransferFunds:
             from_account.select_by_value(first_option)
             to_account.select_by_value(first_option)
 
-            amount_field = driver.find_element(By.ID, "amount")
-            amount_field.send_keys("50")
+            page.amount.send_keys("50")
 
             self.take_screenshot(driver, "TC_TRANSFER_07_01_same_account_selected")
 
-            transfer_button = driver.find_element(By.XPATH, "//input[@value='Transfer']")
-            transfer_button.click()
+            page.transfer_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_TRANSFER_07_02_result")
 
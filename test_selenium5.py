@@ -9,8 +9,13 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from decimal import Decimal
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from table_extract import extract_table, parse_column
+from pages import BASE_URL, HOME_URL, LoginPanel
 
 class TestAccountsOverview:
     def __init__(self):
@@ -25,34 +30,23 @@ class TestAccountsOverview:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
         """Capture screenshot at critical test moments"""
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
-        username_field = wait.until(
-            EC.presence_of_element_located((By.NAME, "username"))
-        )
-        username_field.send_keys("john")
+        LoginPanel(driver, wait).log_in("john", "demo")
 
-        password_field = driver.find_element(By.NAME, "password")
-        password_field.send_keys("demo")
-
-        login_button = driver.find_element(By.XPATH, "//input[@value='Log In']")
-        login_button.click()
-
-        time.sleep(2)
+        pause(2)
 
     def test_view_accounts_overview(self):
         print("\n=== TC_ACCOUNTS_01: View Accounts Overview ===")
@@ -107,7 +101,7 @@ class TestAccountsOverview:
             account_number = first_account_link.text
             first_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             account_details_title = wait.until(
                 EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Account Details')]"))
@@ -142,7 +136,7 @@ class TestAccountsOverview:
             )
             first_account_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ACCOUNTS_03_01_account_page")
 
@@ -150,8 +144,8 @@ class TestAccountsOverview:
                 transaction_table = wait.until(
                     EC.presence_of_element_located((By.ID, "transactionTable"))
                 )
-                transaction_rows = driver.find_elements(By.XPATH, "//table[@id='transactionTable']//tbody/tr")
-                transaction_count = len(transaction_rows)
+                transactions = extract_table(driver, "transactionTable")
+                transaction_count = len(transactions["body"])
 
                 self.take_screenshot(driver, "TC_ACCOUNTS_03_02_transactions")
 
@@ -253,26 +247,20 @@ class TestAccountsOverview:
 
             self.take_screenshot(driver, "TC_ACCOUNTS_06_01_accounts_overview")
 
-            # Get all balance cells
-            balance_cells = driver.find_elements(By.XPATH, "//table[@id='accountTable']//tbody/tr/td[2]")
-
-            calculated_total = 0.0
-            for cell in balance_cells:
-                balance_text = cell.text.replace('$', '').replace(',', '')
-                try:
-                    calculated_total += float(balance_text)
-                except ValueError:
-                    pass
+            # Read the whole table in one call; sum the balance column exactly
+            account_table = extract_table(driver, "accountTable")
+            balances = parse_column(account_table["body"], 1)
+            calculated_total = sum((balance for balance in balances if balance is not None), Decimal("0"))
 
             # Get displayed total
             try:
-                total_cell = driver.find_element(By.XPATH, "//table[@id='accountTable']//tfoot//td[2]")
-                displayed_total = total_cell.text.replace('$', '').replace(',', '')
-                displayed_total = float(displayed_total)
+                displayed_total = parse_column(account_table["footer"], 1)[0]
+                if displayed_total is None:
+                    raise ValueError("Displayed total is not an amount")
 
                 self.take_screenshot(driver, "TC_ACCOUNTS_06_02_total_verified")
 
-                if abs(calculated_total - displayed_total) < 0.01:
+                if calculated_total == displayed_total:
                     print(f"[PASS] PASS: Total balance correct - Displayed: ${displayed_total:.2f}, Calculated: ${calculated_total:.2f}")
                     self.passed += 1
                 else:
@@ -300,8 +288,8 @@ class TestAccountsOverview:
             driver, wait = self.create_driver()
 
             # Try to access account page directly without login
-            driver.get("https://parabank.parasoft.com/parabank/activity.htm?id=12345")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/activity.htm?id=12345")
+            pause(2)
 
             self.take_screenshot(driver, "TC_ACCOUNTS_07_01_direct_access")
 
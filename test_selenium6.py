@@ -8,8 +8,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import BASE_URL, HOME_URL
 
 class TestAdminPage:
     def __init__(self):
@@ -23,20 +26,18 @@ class TestAdminPage:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def setup(self, driver):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
     def test_access_admin_page(self):
         print("\n=== TC_ADMIN_01: Access Admin Page ===")
@@ -49,7 +50,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_01_02_admin_page")
 
@@ -79,7 +80,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_02_01_admin_page")
 
@@ -111,7 +112,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_03_01_before_init")
 
@@ -124,7 +125,7 @@ class TestAdminPage:
                 initialize_button = driver.find_element(By.XPATH, "//button[@value='INIT']")
                 initialize_button.click()
 
-            time.sleep(3)
+            pause(3)
             self.take_screenshot(driver, "TC_ADMIN_03_02_after_init")
 
             page_source = driver.page_source.lower()
@@ -153,7 +154,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_04_01_before_clean")
 
@@ -166,7 +167,7 @@ class TestAdminPage:
                 clean_button = driver.find_element(By.XPATH, "//button[@value='CLEAN']")
                 clean_button.click()
 
-            time.sleep(3)
+            pause(3)
             self.take_screenshot(driver, "TC_ADMIN_04_02_after_clean")
 
             print("[PASS] PASS: Database cleaned successfully")
@@ -190,7 +191,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_05_01_admin_page")
 
@@ -221,8 +222,8 @@ class TestAdminPage:
             driver, wait = self.create_driver()
 
             # Direct access without login - THIS IS THE SECURITY TEST
-            driver.get("https://parabank.parasoft.com/parabank/admin.htm")
-            time.sleep(2)
+            driver.get(f"{BASE_URL}/admin.htm")
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_06_01_direct_access")
 
@@ -261,7 +262,7 @@ class TestAdminPage:
 
             admin_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Admin Page")))
             admin_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_ADMIN_07_01_admin_page")
 
@@ -276,7 +277,7 @@ class TestAdminPage:
                 if len(submit_buttons) > 0:
                     try:
                         submit_buttons[0].click()
-                        time.sleep(2)
+                        pause(2)
                     except:
                         pass
 
@@ -9,8 +9,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import HOME_URL
 
 class TestCustomerCare:
     def __init__(self):
@@ -25,21 +28,19 @@ class TestCustomerCare:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
         """Capture screenshot at critical test moments"""
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Screenshot saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def setup(self, driver):
-        driver.get("https://parabank.parasoft.com")
+        driver.get(HOME_URL)
         driver.maximize_window()
-        time.sleep(2)
+        pause(2)
 
     def test_access_customer_care_page(self):
         print("\n=== TC_CARE_01: Access Customer Care Page ===")
@@ -55,7 +56,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             customer_care_title = wait.until(
                 EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Customer Care')]"))
@@ -93,7 +94,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             name_field = wait.until(
                 EC.presence_of_element_located((By.ID, "name"))
@@ -114,7 +115,7 @@ class TestCustomerCare:
             submit_button = driver.find_element(By.XPATH, "//input[@value='Send to Customer Care']")
             submit_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_CARE_02_02_submitted")
 
@@ -149,7 +150,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_CARE_03_01_empty_form")
 
@@ -158,7 +159,7 @@ class TestCustomerCare:
             )
             submit_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_CARE_03_02_validation")
 
@@ -192,7 +193,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             name_field = wait.until(
                 EC.presence_of_element_located((By.ID, "name"))
@@ -213,7 +214,7 @@ class TestCustomerCare:
             submit_button = driver.find_element(By.XPATH, "//input[@value='Send to Customer Care']")
             submit_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_CARE_04_02_result")
 
@@ -250,7 +251,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             name_field = wait.until(
                 EC.presence_of_element_located((By.ID, "name"))
@@ -270,7 +271,7 @@ class TestCustomerCare:
             submit_button = driver.find_element(By.XPATH, "//input[@value='Send to Customer Care']")
             submit_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_CARE_05_02_result")
 
@@ -308,7 +309,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             xss_payload = "<script>alert('XSS')</script>"
 
@@ -331,7 +332,7 @@ class TestCustomerCare:
             submit_button = driver.find_element(By.XPATH, "//input[@value='Send to Customer Care']")
             submit_button.click()
 
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_CARE_06_02_result")
 
@@ -367,7 +368,7 @@ class TestCustomerCare:
             )
             contact_link.click()
 
-            time.sleep(2)
+            pause(2)
 
             # Very long input
             long_text = "A" * 2000
@@ -391,7 +392,7 @@ class TestCustomerCare:
             submit_button = driver.find_element(By.XPATH, "//input[@value='Send to Customer Care']")
             submit_button.click()
 
-            time.sleep(3)
+            pause(3)
 
             self.take_screenshot(driver, "TC_CARE_07_02_result")
 
@@ -8,8 +8,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-import time
 import os
+from screenshot_capture import capture
+from tmpfs_staging import staging
+from phase_timing import pause
+from pages import HOME_URL, LoginPanel, UpdateProfilePage
 
 class TestUpdateContactInfo:
     def __init__(self):
@@ -23,24 +26,19 @@ class TestUpdateContactInfo:
         options.add_argument('--no-sandbox')
         options.add_argument('--disable-dev-shm-usage')
         options.add_argument('--start-maximized')
+        staging.apply_profile(options)
         driver = webdriver.Chrome(options=options)
         wait = WebDriverWait(driver, 10)
         return driver, wait
 
     def take_screenshot(self, driver, name):
-        filepath = f"{self.screenshot_dir}/{name}.png"
-        driver.save_screenshot(filepath)
-        print(f"    [Screenshot] Saved: {filepath}")
-        return filepath
+        return capture.take_screenshot(driver, self.screenshot_dir, name)
 
     def login(self, driver, wait):
-        driver.get("https://parabank.parasoft.com")
-        time.sleep(2)
-        username_field = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-        username_field.send_keys("john")
-        driver.find_element(By.NAME, "password").send_keys("demo")
-        driver.find_element(By.XPATH, "//input[@value='Log In']").click()
-        time.sleep(2)
+        driver.get(HOME_URL)
+        pause(2)
+        LoginPanel(driver, wait).log_in("john", "demo")
+        pause(2)
 
     def test_update_page_access(self):
         print("\n=== TC_UPDATE_01: Update Contact Info Page Access ===")
@@ -51,19 +49,18 @@ class TestUpdateContactInfo:
 
             update_link = wait.until(EC.element_to_be_clickable((By.LINK_TEXT, "Update Contact Info")))
             update_link.click()
-            time.sleep(2)
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_01_01_update_page")
 
             # Check required fields exist
-            fields = ["customer.firstName", "customer.lastName", "customer.address.street",
-                      "customer.address.city", "customer.address.state", "customer.address.zipCode",
-                      "customer.phoneNumber"]
+            page = UpdateProfilePage(driver, wait)
+            fields = ["first_name", "last_name", "street", "city", "state", "zip_code", "phone"]
 
             missing = []
             for field in fields:
                 try:
-                    driver.find_element(By.ID, field)
+                    getattr(page, field).resolve()
                 except:
                     missing.append(field)
 
@@ -90,14 +87,14 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_02_01_prepopulated")
 
             # Check if fields have values
-            first_name = driver.find_element(By.ID, "customer.firstName").get_attribute("value")
-            last_name = driver.find_element(By.ID, "customer.lastName").get_attribute("value")
+            first_name = page.first_name.get_attribute("value")
+            last_name = page.last_name.get_attribute("value")
 
             if first_name and last_name:
                 print(f"[PASS] PASS: Form pre-populated (First: {first_name}, Last: {last_name})")
@@ -122,19 +119,16 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
             # Update phone number
-            phone_field = driver.find_element(By.ID, "customer.phoneNumber")
-            phone_field.clear()
-            phone_field.send_keys("5559999999")
+            page.fill(phone="5559999999")
 
             self.take_screenshot(driver, "TC_UPDATE_03_01_updated_phone")
 
-            update_button = driver.find_element(By.XPATH, "//input[@value='Update Profile']")
-            update_button.click()
-            time.sleep(2)
+            page.update_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_03_02_result")
 
@@ -165,18 +159,16 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
             # Clear first name
-            first_name = driver.find_element(By.ID, "customer.firstName")
-            first_name.clear()
+            page.fill(first_name="")
 
             self.take_screenshot(driver, "TC_UPDATE_04_01_empty_firstname")
 
-            update_button = driver.find_element(By.XPATH, "//input[@value='Update Profile']")
-            update_button.click()
-            time.sleep(2)
+            page.update_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_04_02_result")
 
@@ -212,18 +204,15 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
-            zip_field = driver.find_element(By.ID, "customer.address.zipCode")
-            zip_field.clear()
-            zip_field.send_keys("ABCDE")  # Invalid zip
+            page.fill(zip_code="ABCDE")  # Invalid zip
 
             self.take_screenshot(driver, "TC_UPDATE_05_01_invalid_zip")
 
-            update_button = driver.find_element(By.XPATH, "//input[@value='Update Profile']")
-            update_button.click()
-            time.sleep(2)
+            page.update_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_05_02_result")
 
@@ -260,20 +249,17 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
             xss_payload = "<img src=x onerror=alert('XSS')>"
 
-            first_name = driver.find_element(By.ID, "customer.firstName")
-            first_name.clear()
-            first_name.send_keys(xss_payload)
+            page.fill(first_name=xss_payload)
 
             self.take_screenshot(driver, "TC_UPDATE_06_01_xss_attempt")
 
-            update_button = driver.find_element(By.XPATH, "//input[@value='Update Profile']")
-            update_button.click()
-            time.sleep(2)
+            page.update_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_06_02_result")
 
@@ -302,20 +288,18 @@ class TestUpdateContactInfo:
             driver, wait = self.create_driver()
             self.login(driver, wait)
 
-            driver.get("https://parabank.parasoft.com/parabank/updateprofile.htm")
-            time.sleep(2)
+            page = UpdateProfilePage(driver, wait).open()
+            pause(2)
 
             long_string = "A" * 500
 
-            street = driver.find_element(By.ID, "customer.address.street")
-            street.clear()
-            street.send_keys(long_string)
+            # typed for real so the field's maxlength applies as it would for a user
+            page.fill(typing=True, street=long_string)
 
             self.take_screenshot(driver, "TC_UPDATE_07_01_long_input")
 
-            update_button = driver.find_element(By.XPATH, "//input[@value='Update Profile']")
-            update_button.click()
-            time.sleep(2)
+            page.update_button.click()
+            pause(2)
 
             self.take_screenshot(driver, "TC_UPDATE_07_02_result")
 
@@ -0,0 +1,53 @@
+"""
+Screenshot Thumbnails for the Parabank HTML Report
+Generates small JPEG thumbnails in a process pool so the report gallery stays light;
+the full-size images are only fetched when a thumbnail is clicked.
+
+Needs Pillow (pip install pillow); without it the gallery lazily loads the full images.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+THUMBNAIL_DIR = "screenshots/thumbnails"
+THUMBNAIL_SIZE = (320, 200)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+
+def thumbnail_path_for(image_path):
+    digest = hashlib.sha1(image_path.encode("utf-8")).hexdigest()[:16]
+    return f"{THUMBNAIL_DIR}/{digest}.jpg"
+
+
+def make_thumbnail(image_path):
+    """Write one thumbnail unless an up-to-date one exists; runs in a worker process"""
+    thumb_path = thumbnail_path_for(image_path)
+    try:
+        if os.path.exists(thumb_path) and os.path.getmtime(thumb_path) >= os.path.getmtime(image_path):
+            return image_path, thumb_path
+        with Image.open(image_path) as image:
+            image = image.convert("RGB")
+            image.thumbnail(THUMBNAIL_SIZE)
+            image.save(thumb_path, "JPEG", quality=70)
+        return image_path, thumb_path
+    except Exception as e:
+        print(f"    [Thumbnail] Failed for {image_path}: {e}")
+        return image_path, None
+
+
+def generate_thumbnails(image_paths, workers=None):
+    """Map each image path to its thumbnail path (or to itself when thumbnails are unavailable)"""
+    image_paths = sorted({path for path in image_paths if path.lower().endswith(IMAGE_EXTENSIONS)})
+    if Image is None or not image_paths:
+        return {path: path for path in image_paths}
+
+    os.makedirs(THUMBNAIL_DIR, exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(make_thumbnail, image_paths, chunksize=16)
+        return {image_path: thumb_path or image_path for image_path, thumb_path in results}
@@ -0,0 +1,138 @@
+"""
+RAM-Backed Staging for Parabank Selenium Tests
+Opt-in mode that puts each Chrome user-data-dir and the screenshot staging area on tmpfs
+(/dev/shm or another RAM-backed path) and moves finished artifacts to the workspace in
+bulk at the end of each suite.
+
+Set PARABANK_TMPFS=1 to enable; PARABANK_TMPFS_ROOT picks the RAM-backed directory
+(default /dev/shm) and PARABANK_TMPFS_FRACTION the share of available memory the staged
+screenshots may use (default 0.25). When the budget is used up, or the root does not
+exist, writes and profiles fall back to disk.
+"""
+
+import atexit
+import os
+import shutil
+import tempfile
+import threading
+
+PROFILE_RESERVE = 256 * 1024 * 1024  # free tmpfs space needed before placing another Chrome profile
+
+
+def available_memory():
+    """MemAvailable from /proc/meminfo in bytes, or None where that is not available"""
+    try:
+        with open("/proc/meminfo", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def free_space(path):
+    return shutil.disk_usage(path).free
+
+
+class TmpfsStaging:
+    """Hands out tmpfs locations for Chrome profiles and staged screenshot writes"""
+
+    def __init__(self, enabled=False, root="/dev/shm", memory_fraction=0.25):
+        self.enabled = enabled and os.path.isdir(root)
+        if enabled and not self.enabled:
+            print(f"[TMPFS] {root} not found - staging disabled, using the workspace disk")
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.staged_bytes = 0
+        self.budget = 0
+        if not self.enabled:
+            return
+
+        self.run_dir = tempfile.mkdtemp(prefix="parabank-", dir=root)
+        self.screenshot_root = os.path.join(self.run_dir, "artifacts")
+        self.profile_root = os.path.join(self.run_dir, "profiles")
+        os.makedirs(self.screenshot_root)
+        os.makedirs(self.profile_root)
+
+        memory = available_memory()
+        self.budget = free_space(root) - PROFILE_RESERVE
+        if memory is not None:
+            self.budget = min(self.budget, int(memory * memory_fraction))
+        self.budget = max(self.budget, 0)
+        print(f"[TMPFS] Staging in {self.run_dir} (screenshot budget {self.budget / 1024 / 1024:.0f} MB)")
+
+    def apply_profile(self, options):
+        """Point Chrome's user-data-dir at tmpfs; returns the profile path or None"""
+        if not self.enabled:
+            return None
+        if free_space(self.profile_root) < PROFILE_RESERVE:
+            print("[TMPFS] Low on RAM-backed space - this browser uses a disk profile")
+            return None
+        profile = tempfile.mkdtemp(prefix="chrome-", dir=self.profile_root)
+        options.add_argument(f"--user-data-dir={profile}")
+        if not hasattr(self.local, "profiles"):
+            self.local.profiles = []
+        self.local.profiles.append(profile)
+        return profile
+
+    def reserve(self, size):
+        """Claim staging space for a write; False means write straight to disk"""
+        if not self.enabled:
+            return False
+        with self.lock:
+            if self.staged_bytes + size > self.budget:
+                return False
+            self.staged_bytes += size
+            return True
+
+    def write_root(self, size):
+        """Directory a write of size bytes should be placed under ("" = the workspace)"""
+        return self.screenshot_root if self.reserve(size) else ""
+
+    def move_to_persistent(self):
+        """Move every staged artifact to the same relative path in the workspace"""
+        if not self.enabled:
+            return 0
+        moved = 0
+        with self.lock:
+            for dirpath, dirnames, filenames in os.walk(self.screenshot_root):
+                for filename in filenames:
+                    source = os.path.join(dirpath, filename)
+                    target = os.path.relpath(source, self.screenshot_root)
+                    os.makedirs(os.path.dirname(target) or ".", exist_ok=True)
+                    shutil.move(source, target)
+                    moved += 1
+            self.staged_bytes = 0
+        if moved:
+            print(f"[TMPFS] Moved {moved} staged artifact(s) to the workspace")
+        return moved
+
+    def remove_profiles(self):
+        """Delete the Chrome profiles created on this thread (their drivers have quit)"""
+        for profile in getattr(self.local, "profiles", []):
+            shutil.rmtree(profile, ignore_errors=True)
+        self.local.profiles = []
+
+    def test_started(self, test_id):
+        pass
+
+    def driver_created(self, test_id, driver):
+        pass
+
+    def test_finished(self, test_id, status):
+        self.remove_profiles()
+
+    def close(self):
+        if not self.enabled:
+            return
+        self.move_to_persistent()
+        shutil.rmtree(self.run_dir, ignore_errors=True)
+
+
+staging = TmpfsStaging(
+    enabled=os.environ.get("PARABANK_TMPFS") == "1",
+    root=os.environ.get("PARABANK_TMPFS_ROOT", "/dev/shm"),
+    memory_fraction=float(os.environ.get("PARABANK_TMPFS_FRACTION", "0.25")),
+)
+atexit.register(staging.close)
@@ -0,0 +1,67 @@
+"""
+Page Verdict Engine for Parabank Selenium Tests
+Compiles a test's keyword rules into one combined regex and scans the (lowercased) page
+text once, mapping every keyword hit back to the rules that contain it. Rules are kept in
+the order given, which is their priority: verdict() returns the first rule that matched,
+the way an if/elif chain would, and stops scanning as soon as the top rule is hit.
+
+The suites keep their short-circuit `in` chains: bench_verdicts.py times this engine
+against the exact chains they run. On Parabank pages the chains stop after one to three
+memchr-based `in` lookups, while one regex pass has to try the alternation at every
+position, so the chains are roughly 10x faster and stay.
+
+Usage:
+    LOAN_VERDICTS = VerdictRules(internal_error=["an internal error has occurred"],
+                                 denied=["denied"], approved=["approved"])
+    LOAN_VERDICTS.verdict(driver.page_source.lower())   # "denied", or None
+"""
+
+import re
+
+COMMON_RULES = {
+    "internal_error": ["an internal error has occurred"],
+    "access_denied": ["access denied", "unauthorized"],
+    "sql_exposed": ["sqlexception", "jdbc", "mysql", "postgresql", "oracle", "syntax error"],
+}
+
+
+class VerdictRules:
+    """Named keyword rules (a rule fires when any of its keywords occurs), in priority order"""
+
+    def __init__(self, *rule_sets, **rules):
+        self.rules = {}
+        for rule_set in rule_sets + (rules,):
+            for name, keywords in rule_set.items():
+                self.rules[name] = [keyword.lower() for keyword in keywords]
+        self.priority = {name: rank for rank, name in enumerate(self.rules)}
+
+        rules_for = {}
+        for name, keywords in self.rules.items():
+            for keyword in keywords:
+                rules_for.setdefault(keyword, set()).add(name)
+        # the lookahead reports a hit at every start position; a keyword also implies the
+        # shorter keywords it starts with, which the alternation (longest first) skips over
+        keywords = sorted(rules_for, key=len, reverse=True)
+        self.rules_for_hit = {
+            keyword: frozenset().union(*(rules_for[other] for other in keywords if keyword.startswith(other)))
+            for keyword in keywords
+        }
+        self.pattern = re.compile("(?=(" + "|".join(re.escape(keyword) for keyword in keywords) + "))")
+
+    def scan(self, text):
+        """Set of rule names whose keywords occur in text (pass lowercased text)"""
+        found = set()
+        for match in self.pattern.finditer(text):
+            found |= self.rules_for_hit[match.group(1)]
+        return found
+
+    def verdict(self, text):
+        """The highest-priority rule that matched text, or None"""
+        best = None
+        for match in self.pattern.finditer(text):
+            for name in self.rules_for_hit[match.group(1)]:
+                if best is None or self.priority[name] < self.priority[best]:
+                    best = name
+            if self.priority[best] == 0:
+                break
+        return best
@@ -0,0 +1,149 @@
+"""
+Visual Regression Checks for Parabank Selenium Tests
+Compares each named screenshot with its stored baseline using NumPy array diffs and a
+block-wise SSIM score, in a process pool after each suite. Failing comparisons get a diff
+image with the changed pixels highlighted, which the HTML report links to.
+
+Layout:
+    baselines/<suite>/<name>.png     e.g. baselines/navigation/TC_NAV_01_01_nav_menu.png
+    baselines/masks.json             {"TC_NAV_01_*": [[x, y, width, height], ...]} regions to ignore
+    screenshots/visual_diffs/<suite>/<name>.png
+
+Baselines are always stored as lossless PNG, whatever format the screenshots are captured in
+(PARABANK_SCREENSHOT_FORMAT), so recording them adds no compression loss of its own and the
+capture format can change without re-recording.
+
+Set PARABANK_VISUAL_CHECK=1 to enable, PARABANK_UPDATE_BASELINES=1 to (re)record baselines.
+Needs numpy and Pillow (pip install numpy pillow).
+"""
+
+import fnmatch
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:
+    np = None
+    Image = None
+
+BASELINE_DIR = "baselines"
+DIFF_DIR = "screenshots/visual_diffs"
+MASKS_FILE = "baselines/masks.json"
+
+PIXEL_TOLERANCE = 16       # per-channel difference below this counts as unchanged
+MAX_CHANGED_RATIO = 0.002  # fraction of unmasked pixels allowed to change
+MIN_SSIM = 0.98
+SSIM_BLOCK = 8
+
+
+def load_masks(masks_file=MASKS_FILE):
+    if not os.path.exists(masks_file):
+        return {}
+    with open(masks_file, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def mask_for(name, shape, masks):
+    """Boolean array, True where differences are ignored"""
+    mask = np.zeros(shape, dtype=bool)
+    for pattern, regions in masks.items():
+        if fnmatch.fnmatch(name, pattern):
+            for x, y, width, height in regions:
+                mask[y:y + height, x:x + width] = True
+    return mask
+
+
+def block_ssim(a, b, mask, block=SSIM_BLOCK):
+    """Mean SSIM over non-overlapping blocks of two grayscale arrays, skipping masked blocks"""
+    height, width = a.shape[0] - a.shape[0] % block, a.shape[1] - a.shape[1] % block
+    if height == 0 or width == 0:
+        return 1.0
+    shape = (height // block, block, width // block, block)
+    a = a[:height, :width].reshape(shape)
+    b = b[:height, :width].reshape(shape)
+    masked = mask[:height, :width].reshape(shape).any(axis=(1, 3))
+
+    mu_a, mu_b = a.mean(axis=(1, 3)), b.mean(axis=(1, 3))
+    var_a, var_b = a.var(axis=(1, 3)), b.var(axis=(1, 3))
+    covariance = ((a - mu_a[:, None, :, None]) * (b - mu_b[:, None, :, None])).mean(axis=(1, 3))
+
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    ssim = ((2 * mu_a * mu_b + c1) * (2 * covariance + c2)) / ((mu_a ** 2 + mu_b ** 2 + c1) * (var_a + var_b + c2))
+    valid = ~masked
+    return float(ssim[valid].mean()) if valid.any() else 1.0
+
+
+def baseline_path_for(name, suite):
+    return f"{BASELINE_DIR}/{suite}/{name}.png"
+
+
+def compare_screenshot(job):
+    """Compare one screenshot with its baseline; runs in a worker process"""
+    image_path, name, suite, masks = job
+    result = {"name": name, "suite": suite, "image": image_path, "status": "pass",
+              "ssim": None, "changed_ratio": None, "diff": None}
+    baseline_path = baseline_path_for(name, suite)
+    try:
+        if not os.path.exists(baseline_path):
+            result["status"] = "new"
+            return result
+
+        current = np.asarray(Image.open(image_path).convert("RGB"), dtype=np.int16)
+        baseline = np.asarray(Image.open(baseline_path).convert("RGB"), dtype=np.int16)
+        if current.shape != baseline.shape:
+            result["status"] = "fail"
+            result["error"] = f"size changed from {baseline.shape[1]}x{baseline.shape[0]} to {current.shape[1]}x{current.shape[0]}"
+            return result
+
+        mask = mask_for(name, current.shape[:2], masks)
+        changed = (np.abs(current - baseline).max(axis=2) > PIXEL_TOLERANCE) & ~mask
+        unmasked = max(int((~mask).sum()), 1)
+        result["changed_ratio"] = float(changed.sum()) / unmasked
+
+        gray_current = current.astype(np.float64) @ [0.299, 0.587, 0.114]
+        gray_baseline = baseline.astype(np.float64) @ [0.299, 0.587, 0.114]
+        result["ssim"] = block_ssim(gray_current, gray_baseline, mask)
+
+        if result["ssim"] < MIN_SSIM or result["changed_ratio"] > MAX_CHANGED_RATIO:
+            result["status"] = "fail"
+            highlighted = (current * 0.35).astype(np.uint8)
+            highlighted[changed] = [255, 51, 102]
+            diff_path = f"{DIFF_DIR}/{suite}/{name}.png"
+            os.makedirs(os.path.dirname(diff_path), exist_ok=True)
+            Image.fromarray(highlighted).save(diff_path)
+            result["diff"] = diff_path
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    return result
+
+
+def run_visual_checks(screenshots, workers=None, update_baselines=False):
+    """Compare (image path, name, suite) triples against their baselines in a process pool"""
+    if np is None or Image is None:
+        print("[VISUAL] numpy/Pillow not installed - visual checks skipped")
+        return []
+
+    if update_baselines:
+        for image_path, name, suite in screenshots:
+            baseline_path = baseline_path_for(name, suite)
+            os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+            Image.open(image_path).convert("RGB").save(baseline_path, "PNG")
+        print(f"[VISUAL] Recorded {len(screenshots)} baseline(s)")
+        return []
+
+    masks = load_masks()
+    jobs = [(image_path, name, suite, masks) for image_path, name, suite in screenshots]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(compare_screenshot, jobs))
+
+    failed = [result for result in results if result["status"] in ("fail", "error")]
+    new = [result for result in results if result["status"] == "new"]
+    print(f"[VISUAL] {len(results)} compared | {len(failed)} regression(s) | {len(new)} without baseline")
+    for result in failed:
+        detail = result.get("error") or f"ssim {result['ssim']:.4f}, {result['changed_ratio'] * 100:.2f}% changed"
+        print(f"    [VISUAL] {result['status'].upper()}: {result['suite']}/{result['name']} ({detail})")
+    return results
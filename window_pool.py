@@ -0,0 +1,190 @@
+"""
+Multi-Window Test Runner for Parabank Selenium Tests
+Runs read-only tests side by side in several windows of ONE authenticated Chrome.
+Every WebDriver command is serialized through a lock and pinned to the calling
+thread's window handle, while page loads in the different windows overlap.
+
+Usage:
+    python window_pool.py --windows 4
+    python window_pool.py --windows 3 test_selenium5.TestAccountsOverview.test_verify_balance_format ...
+"""
+
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.command import Command
+
+from screenshot_capture import capture
+from live_report import live_report
+from pages import BASE_URL, HOME_URL, LoginPanel
+from result_records import result_recorder
+from suite_runner import instrument_suite, resolve_test
+from tmpfs_staging import staging
+
+OVERVIEW_URL = f"{BASE_URL}/overview.htm"
+
+# Tests that only log in as john and read or navigate; they never change shared session state
+READ_ONLY_TESTS = [
+    "test_selenium5.TestAccountsOverview.test_view_accounts_overview",
+    "test_selenium5.TestAccountsOverview.test_navigate_to_account_details",
+    "test_selenium5.TestAccountsOverview.test_view_transaction_history",
+    "test_selenium5.TestAccountsOverview.test_verify_balance_format",
+    "test_selenium5.TestAccountsOverview.test_account_links_clickable",
+    "test_selenium5.TestAccountsOverview.test_total_balance_calculation",
+    "test_navigation.TestNavigationMenu.test_all_nav_links_present",
+    "test_navigation.TestNavigationMenu.test_open_new_account_link",
+    "test_navigation.TestNavigationMenu.test_transfer_funds_link",
+    "test_navigation.TestNavigationMenu.test_nav_consistency_across_pages",
+    "test_navigation.TestNavigationMenu.test_broken_links_check",
+    "test_account_statement.TestAccountStatement.test_account_details_display",
+    "test_account_statement.TestAccountStatement.test_transaction_list_display",
+    "test_account_statement.TestAccountStatement.test_account_type_displayed",
+    "test_account_statement.TestAccountStatement.test_balance_format",
+    "test_account_statement.TestAccountStatement.test_negative_balance_display",
+    "test_account_statement.TestAccountStatement.test_multiple_accounts_display",
+    "test_account_activity.TestAccountActivity.test_accounts_overview_access",
+    "test_account_activity.TestAccountActivity.test_account_details_click",
+    "test_account_activity.TestAccountActivity.test_activity_filter_by_month",
+    "test_account_activity.TestAccountActivity.test_activity_filter_by_type",
+    "test_account_activity.TestAccountActivity.test_account_balance_displayed",
+]
+
+
+class SharedBrowser:
+    """One logged-in Chrome whose windows are handed out to worker threads"""
+
+    def __init__(self, windows=4, page_load_timeout=30):
+        self.page_load_timeout = page_load_timeout
+        self.lock = threading.RLock()
+        self.local = threading.local()
+
+        options = Options()
+        options.add_argument('--no-sandbox')
+        options.add_argument('--disable-dev-shm-usage')
+        options.add_argument('--start-maximized')
+        staging.apply_profile(options)
+        # Navigation commands return immediately; get() below waits for the load without holding the lock
+        options.page_load_strategy = 'none'
+        self.driver = webdriver.Chrome(options=options)
+
+        self._execute = self.driver.execute
+        self._quit = self.driver.quit
+        self.driver.execute = self.execute
+        self.driver.get = self.get
+        # tests quit their driver in finally; the shared browser outlives them
+        self.driver.quit = lambda: None
+
+        self.login()
+
+        self.handles = queue.Queue()
+        self.current_handle = self.driver.current_window_handle
+        self.handles.put(self.current_handle)
+        for _ in range(windows - 1):
+            self.driver.switch_to.new_window('window')
+            self.current_handle = self.driver.current_window_handle
+            self.handles.put(self.current_handle)
+        print(f"[WINDOWS] Shared browser ready with {windows} window(s)")
+
+    def login(self):
+        """Authenticate once; every window shares the session cookie"""
+        wait = WebDriverWait(self.driver, 10)
+        self.driver.get(HOME_URL)
+        LoginPanel(self.driver, wait).log_in("john", "demo")
+        wait.until(EC.presence_of_element_located((By.LINK_TEXT, "Log Out")))
+
+    def execute(self, driver_command, params=None):
+        """Serialize access to the session and switch to the caller's window first"""
+        handle = getattr(self.local, "handle", None)
+        with self.lock:
+            if handle and handle != self.current_handle:
+                self._execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                self.current_handle = handle
+            return self._execute(driver_command, params)
+
+    def get(self, url):
+        """Start navigation, then poll for the load so other windows can use the session meanwhile"""
+        self.driver.execute_script("window.__parabankPending = true; window.location.href = arguments[0];", url)
+        deadline = time.time() + self.page_load_timeout
+        while time.time() < deadline:
+            time.sleep(0.1)
+            try:
+                if self.driver.execute_script(
+                        "return !window.__parabankPending && document.readyState === 'complete';"):
+                    return
+            except WebDriverException:
+                # the old document went away mid-script; keep polling the new one
+                pass
+        raise WebDriverException(f"Timed out loading {url}")
+
+    def run_test(self, test_id):
+        """Run one test on a free window; create_driver/login are replaced by the shared session"""
+        handle = self.handles.get()
+        self.local.handle = handle
+        try:
+            test_class, method_name = resolve_test(test_id)
+            test_instance = test_class()
+            test_instance.create_driver = lambda: (self.driver, WebDriverWait(self.driver, 10))
+            test_instance.login = lambda driver, wait: self.get(OVERVIEW_URL)
+            instrument_suite(test_instance)
+
+            start = time.time()
+            status = getattr(test_instance, method_name)()
+            return {"test_id": test_id, "status": status, "duration": time.time() - start}
+        except Exception as e:
+            print(f"[ERROR] {test_id}: {e}")
+            return {"test_id": test_id, "status": "error", "duration": 0}
+        finally:
+            self.local.handle = None
+            self.handles.put(handle)
+
+    def close(self):
+        self._quit()
+
+
+def run_multi_window(test_ids=None, windows=4):
+    """Run read-only tests concurrently across the windows of one browser"""
+    test_ids = test_ids or READ_ONLY_TESTS
+    unsafe = [test_id for test_id in test_ids if test_id not in READ_ONLY_TESTS]
+    if unsafe:
+        raise ValueError(f"Not marked read-only, run these in their own browser: {unsafe}")
+
+    start = time.time()
+    capture.start_run()
+    result_recorder.start_run()
+    live_report.start_run(len(test_ids))
+    browser = SharedBrowser(windows)
+    try:
+        with ThreadPoolExecutor(max_workers=windows) as pool:
+            results = list(pool.map(browser.run_test, test_ids))
+    finally:
+        browser.close()
+        capture.flush()
+        live_report.finish()
+
+    passed = sum(1 for result in results if result["status"] == "passed")
+    print("\n" + "="*60)
+    print("MULTI-WINDOW RUN COMPLETED")
+    print("="*60)
+    for result in results:
+        print(f"  {result['status'].upper():7} {result['test_id']} ({result['duration']:.1f}s)")
+    print(f"Total: {len(results)} | Passed: {passed} | Failed: {len(results) - passed}")
+    print(f"Wall time: {time.time() - start:.1f}s across {windows} window(s)")
+    print("="*60)
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run read-only tests in parallel windows of one Chrome")
+    parser.add_argument("--windows", type=int, default=4)
+    parser.add_argument("tests", nargs="*", help="test IDs (default: every read-only test)")
+    args = parser.parse_args()
+    run_multi_window(args.tests, args.windows)
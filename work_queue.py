@@ -0,0 +1,340 @@
+"""
+Work-Stealing Test Queue for Parabank Selenium Tests
+Test IDs go into a durable SQLite queue; any number of worker processes or hosts pull
+them one at a time under a lease that is kept alive by heartbeats. Expired leases
+(crashed workers) are requeued automatically.
+
+Usage:
+    python work_queue.py run --workers 4              # enqueue everything, run local workers, print summary
+    python work_queue.py enqueue --db queue.db        # fill the queue only
+    python work_queue.py worker --db queue.db         # join from another process or host (shared filesystem)
+    python work_queue.py status --db queue.db
+"""
+
+import argparse
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import threading
+import time
+
+from screenshot_capture import capture
+from live_report import live_report
+from result_records import result_recorder
+from suite_runner import discover_test_ids, run_single_test, suite_name_for
+
+DEFAULT_DB = "test_queue.db"
+DEFAULT_LEASE = 120.0
+DEFAULT_MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tests (
+    test_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL DEFAULT 'pending',
+    status TEXT,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_expires REAL,
+    enqueued_at REAL,
+    started_at REAL,
+    finished_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_tests_state ON tests (state, lease_expires);
+"""
+
+
+class WorkQueue:
+    """SQLite-backed queue of test IDs with leases and heartbeats"""
+
+    def __init__(self, db_path=DEFAULT_DB, lease_seconds=DEFAULT_LEASE, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def enqueue(self, test_ids):
+        """Add test IDs to the queue; IDs already present are left untouched"""
+        now = time.time()
+        self.conn.execute("BEGIN")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO tests (test_id, enqueued_at) VALUES (?, ?)",
+            [(test_id, now) for test_id in test_ids]
+        )
+        self.conn.execute("COMMIT")
+
+    def reset(self):
+        """Drop every queued and finished test"""
+        with self.conn:
+            self.conn.execute("DELETE FROM tests")
+
+    def requeue_expired(self, now=None):
+        """Put tests whose lease ran out back in the queue, or give up after max_attempts"""
+        now = now or time.time()
+        self.conn.execute(
+            "UPDATE tests SET state = 'done', status = 'error', worker = NULL, finished_at = ?, "
+            "error = 'lease expired ' || attempts || ' times' "
+            "WHERE state = 'leased' AND lease_expires < ? AND attempts >= ?",
+            (now, now, self.max_attempts)
+        )
+        expired = self.conn.execute(
+            "UPDATE tests SET state = 'pending', worker = NULL, lease_expires = NULL "
+            "WHERE state = 'leased' AND lease_expires < ?",
+            (now,)
+        ).rowcount
+        if expired:
+            print(f"[QUEUE] Requeued {expired} test(s) with expired leases")
+        return expired
+
+    def claim(self, worker_id, steal_after=None):
+        """Lease the next pending test to worker_id; returns the test ID or None
+
+        With steal_after set, an idle worker also takes a duplicate lease on a test that has
+        been running for longer than steal_after seconds, so one slow worker cannot hold up
+        the tail of the run. Whichever copy finishes first records the result.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.requeue_expired(now)
+            row = self.conn.execute(
+                "SELECT test_id FROM tests WHERE state = 'pending' ORDER BY rowid LIMIT 1"
+            ).fetchone()
+            if row is None and steal_after is not None:
+                row = self.conn.execute(
+                    "SELECT test_id FROM tests WHERE state = 'leased' AND worker != ? "
+                    "AND started_at < ? AND attempts < ? ORDER BY started_at LIMIT 1",
+                    (worker_id, now - steal_after, self.max_attempts)
+                ).fetchone()
+                if row is not None:
+                    print(f"[QUEUE] {worker_id} stealing straggler {row[0]}")
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+
+            self.conn.execute(
+                "UPDATE tests SET state = 'leased', worker = ?, attempts = attempts + 1, "
+                "lease_expires = ?, started_at = ? WHERE test_id = ?",
+                (worker_id, now + self.lease_seconds, now, row[0])
+            )
+            self.conn.execute("COMMIT")
+            return row[0]
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def heartbeat(self, test_id, worker_id):
+        """Extend the lease; returns False if the worker no longer owns the test"""
+        with self.conn:
+            updated = self.conn.execute(
+                "UPDATE tests SET lease_expires = ? WHERE test_id = ? AND worker = ? AND state = 'leased'",
+                (time.time() + self.lease_seconds, test_id, worker_id)
+            ).rowcount
+        return updated > 0
+
+    def complete(self, test_id, worker_id, status, error=None):
+        """Record a result; the first finisher wins if a test was stolen"""
+        with self.conn:
+            updated = self.conn.execute(
+                "UPDATE tests SET state = 'done', status = ?, worker = ?, finished_at = ?, "
+                "lease_expires = NULL, error = ? WHERE test_id = ? AND state != 'done'",
+                (status, worker_id, time.time(), error, test_id)
+            ).rowcount
+        return updated > 0
+
+    def counts(self):
+        """Number of tests per queue state"""
+        rows = self.conn.execute("SELECT state, COUNT(*) FROM tests GROUP BY state").fetchall()
+        counts = {"pending": 0, "leased": 0, "done": 0}
+        counts.update(dict(rows))
+        return counts
+
+    def is_drained(self):
+        """True once every test has a final result"""
+        counts = self.counts()
+        return counts["pending"] == 0 and counts["leased"] == 0
+
+    def results(self):
+        """Finished tests as dicts, in enqueue order"""
+        rows = self.conn.execute(
+            "SELECT test_id, status, worker, attempts, started_at, finished_at, error "
+            "FROM tests WHERE state = 'done' ORDER BY rowid"
+        ).fetchall()
+        keys = ["test_id", "status", "worker", "attempts", "started_at", "finished_at", "error"]
+        return [dict(zip(keys, row)) for row in rows]
+
+
+class LeaseHeartbeat(threading.Thread):
+    """Keeps a lease alive while the test runs on the main thread"""
+
+    def __init__(self, db_path, test_id, worker_id, lease_seconds):
+        super().__init__(daemon=True)
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.test_id = test_id
+        self.worker_id = worker_id
+        self.interval = lease_seconds / 3
+        self.stopped = threading.Event()
+
+    def run(self):
+        # sqlite connections cannot be shared across threads
+        queue = WorkQueue(self.db_path, lease_seconds=self.lease_seconds)
+        try:
+            while not self.stopped.wait(self.interval):
+                if not queue.heartbeat(self.test_id, self.worker_id):
+                    break
+        finally:
+            queue.close()
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+
+
+def run_worker(db_path=DEFAULT_DB, worker_id=None, lease_seconds=DEFAULT_LEASE, poll_interval=2.0, steal_after=None):
+    """Pull tests from the queue until it is drained"""
+    worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+    queue = WorkQueue(db_path, lease_seconds=lease_seconds)
+    executed = 0
+    # records wait for complete(), so a stolen test that finishes second leaves no record
+    result_recorder.deferred = True
+
+    print(f"[WORKER] {worker_id} started on {db_path}")
+    try:
+        while True:
+            test_id = queue.claim(worker_id, steal_after=steal_after)
+            if test_id is None:
+                if queue.is_drained():
+                    break
+                # other workers still hold leases; wait in case one expires or a straggler appears
+                time.sleep(poll_interval)
+                continue
+
+            heartbeat = LeaseHeartbeat(db_path, test_id, worker_id, lease_seconds)
+            heartbeat.start()
+            try:
+                result = run_single_test(test_id)
+                status, error = result["status"], None
+            except Exception as e:
+                status, error = "error", str(e)
+                print(f"[ERROR] {test_id}: {error}")
+            finally:
+                heartbeat.stop()
+
+            accepted = queue.complete(test_id, worker_id, status, error)
+            result_recorder.release(accepted)
+            live_report.refresh()
+            if not accepted:
+                print(f"[WORKER] {test_id} already finished by another worker - result discarded")
+            executed += 1
+    finally:
+        queue.close()
+
+    print(f"[WORKER] {worker_id} finished after {executed} test(s)")
+    return executed
+
+
+def print_summary(results):
+    """Per-suite totals in the same layout as the sequential runners"""
+    suites = {}
+    for result in results:
+        suite = suites.setdefault(suite_name_for(result["test_id"]), {"total": 0, "passed": 0, "failed": 0})
+        suite["total"] += 1
+        if result["status"] == "passed":
+            suite["passed"] += 1
+        else:
+            suite["failed"] += 1
+
+    print("\n" + "="*70)
+    print("FINAL SUMMARY - QUEUED EXECUTION")
+    print("="*70)
+
+    total_tests = total_passed = total_failed = 0
+    for name, suite in suites.items():
+        total_tests += suite["total"]
+        total_passed += suite["passed"]
+        total_failed += suite["failed"]
+        rate = suite["passed"] / suite["total"] * 100
+        status = "PASS" if suite["failed"] == 0 else "FAIL"
+        print(f"{status} {name}: {suite['passed']}/{suite['total']} passed ({rate:.1f}%)")
+
+    overall_rate = (total_passed / total_tests * 100) if total_tests > 0 else 0
+
+    print("\n" + "-"*70)
+    print(f"TOTAL: {total_tests} tests | PASSED: {total_passed} | FAILED: {total_failed}")
+    print(f"OVERALL SUCCESS RATE: {overall_rate:.2f}%")
+    print("="*70)
+
+    return {"total": total_tests, "passed": total_passed, "failed": total_failed, "success_rate": overall_rate}
+
+
+def run_queued(db_path=DEFAULT_DB, workers=4, test_ids=None, lease_seconds=DEFAULT_LEASE, steal_after=None):
+    """Enqueue tests, run local worker processes until the queue drains and summarize"""
+    queue = WorkQueue(db_path, lease_seconds=lease_seconds)
+    queue.reset()
+    queue.enqueue(test_ids or discover_test_ids())
+    capture.start_run()
+    result_recorder.start_run()
+    live_report.start_run(queue.counts()['pending'])
+    print(f"[QUEUE] {queue.counts()['pending']} test(s) queued in {db_path}, starting {workers} worker(s)")
+
+    command = [sys.executable, os.path.abspath(__file__), "worker", "--db", db_path,
+               "--lease", str(lease_seconds)]
+    if steal_after is not None:
+        command += ["--steal-after", str(steal_after)]
+    processes = [subprocess.Popen(command) for _ in range(workers)]
+    for process in processes:
+        process.wait()
+
+    live_report.finish()
+    results = queue.results()
+    queue.close()
+    return print_summary(results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pull-based Parabank test execution")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("run", "enqueue", "worker", "status"):
+        sub = subparsers.add_parser(name)
+        sub.add_argument("--db", default=DEFAULT_DB)
+        sub.add_argument("--lease", type=float, default=DEFAULT_LEASE, help="lease length in seconds")
+        if name in ("run", "enqueue"):
+            sub.add_argument("--tests", nargs="*", help="test IDs (default: every suite)")
+        if name in ("run", "worker"):
+            sub.add_argument("--steal-after", type=float, default=None,
+                             help="duplicate tests still running after this many seconds once the queue is empty")
+        if name == "run":
+            sub.add_argument("--workers", type=int, default=4)
+        if name == "worker":
+            sub.add_argument("--worker-id", default=None)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        run_queued(args.db, args.workers, args.tests, args.lease, args.steal_after)
+    elif args.command == "enqueue":
+        queue = WorkQueue(args.db, lease_seconds=args.lease)
+        queue.enqueue(args.tests or discover_test_ids())
+        print(f"[QUEUE] {queue.counts()}")
+        queue.close()
+    elif args.command == "worker":
+        run_worker(args.db, args.worker_id, args.lease, steal_after=args.steal_after)
+    elif args.command == "status":
+        queue = WorkQueue(args.db, lease_seconds=args.lease)
+        print(f"[QUEUE] {queue.counts()}")
+        for result in queue.results():
+            print(f"  {result['status'].upper():7} {result['test_id']} ({result['worker']}, attempts: {result['attempts']})")
+        queue.close()
+
+
+if __name__ == "__main__":
+    main()